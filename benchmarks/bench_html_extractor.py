@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the streaming HTML extractor on the local fixture corpus.
+
+Usage:
+    python benchmarks/bench_html_extractor.py [--repeat N] [--chunk-size BYTES]
+"""
+
+import os
+import glob
+import time
+import argparse
+
+from job_seeker_ai.tools.html_extractor import extract_posting
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests", "fixtures", "pages")
+
+
+def iter_chunks(path, chunk_size):
+    """
+    Stream a file in binary chunks.
+    """
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def bench_extractor(path, repeat, chunk_size):
+    """
+    Time the streaming extractor on one page.
+    """
+    started = time.perf_counter()
+    for _ in range(repeat):
+        posting = extract_posting(iter_chunks(path, chunk_size))
+    return (time.perf_counter() - started) / repeat, posting
+
+
+def bench_get_text(path, repeat):
+    """
+    Time BeautifulSoup's get_text() on one page, as a baseline without boilerplate stripping.
+    """
+    from bs4 import BeautifulSoup
+
+    with open(path, "r", encoding="utf-8") as file:
+        html = file.read()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
+    return (time.perf_counter() - started) / repeat, len(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HTML extractor")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--chunk-size", type=int, default=16 * 1024)
+    args = parser.parse_args()
+
+    try:
+        import bs4  # noqa: F401
+        has_bs4 = True
+    except ImportError:
+        has_bs4 = False
+
+    print(f"{'page':<32} {'html KB':>8} {'text KB':>8} {'reduced':>8} {'ms':>8} {'MB/s':>7}"
+          + (f" {'bs4 ms':>8} {'bs4 KB':>7}" if has_bs4 else ""))
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html"))):
+        seconds, posting = bench_extractor(path, args.repeat, args.chunk_size)
+        size = os.path.getsize(path)
+        line = (
+            f"{os.path.basename(path):<32} {size / 1024:8.1f} {posting.output_chars / 1024:8.1f} "
+            f"{posting.reduction:8.1%} {seconds * 1000:8.2f} {size / seconds / 1e6:7.1f}"
+        )
+        if has_bs4:
+            bs4_seconds, bs4_chars = bench_get_text(path, args.repeat)
+            line += f" {bs4_seconds * 1000:8.2f} {bs4_chars / 1024:7.1f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
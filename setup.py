@@ -25,6 +25,7 @@ setup(
     url="https://github.com/yourusername/job-seeker-ai",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    package_data={"job_seeker_ai": ["config/*.yaml", "config/*.json"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
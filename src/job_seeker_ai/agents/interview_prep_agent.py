@@ -2,8 +2,13 @@
 Interview Prep Agent - Specializes in preparing users for interviews with practice questions and feedback.
 """
 
+import time
 from crewai import Agent
-from typing import List
+from typing import Any, Dict, List, Optional
+
+from job_seeker_ai.utils.blackboard import Blackboard
+from job_seeker_ai.utils.conversation import RollingContext, truncate
+from job_seeker_ai.utils.question_bank import QuestionBank
 
 
 class InterviewPrepAgent(Agent):
@@ -12,7 +17,7 @@ class InterviewPrepAgent(Agent):
     questions and feedback tailored to specific job roles.
     """
     
-    def __init__(self, role: str, goal: str, tools: List):
+    def __init__(self, role: str, goal: str, tools: List, llm: Optional[Any] = None):
         """
         Initialize the Interview Prep Agent.
         
@@ -20,31 +25,66 @@ class InterviewPrepAgent(Agent):
             role (str): The role of the agent.
             goal (str): The goal of the agent.
             tools (List): The tools available to the agent.
+            llm (Optional[Any]): The language model for the agent. Defaults to the crew default.
         """
+        options = {"llm": llm} if llm is not None else {}
         super().__init__(
             role=role,
             goal=goal,
             backstory="I am an experienced interview coach who has helped thousands of candidates successfully prepare for job interviews across various industries. I specialize in identifying the most likely questions for specific roles and providing targeted feedback to improve interview performance.",
             tools=tools,
-            verbose=True
+            verbose=True,
+            **options
         )
     
-    def generate_interview_questions(self, job_description: str, resume: str) -> str:
+    def generate_interview_questions(
+        self,
+        job_description: str,
+        resume: str,
+        question_bank: Optional[QuestionBank] = None,
+        blackboard: Optional[Blackboard] = None
+    ) -> str:
         """
         Generate interview questions based on job description and resume.
         
+        When a question bank is given, the banked questions for the role's cluster are
+        reused and the LLM only fills in questions personalized to the resume. Question
+        sets generated for a new cluster are added to the bank. When an extracted blackboard
+        is given, the prompt carries its analysis of the role and the candidate instead of the
+        full job description and resume. A keyword-only blackboard is added as hints next to them.
+        
         Args:
             job_description (str): The job description.
             resume (str): The user's resume.
+            question_bank (Optional[QuestionBank]): Bank of reusable questions. Defaults to None.
+            blackboard (Optional[Blackboard]): The run's shared analysis. Defaults to None.
             
         Returns:
             str: A list of potential interview questions with preparation guidance.
         """
+        banked_questions = question_bank.lookup(job_description) if question_bank else []
+        if banked_questions:
+            return self.execute_task(self._personalize_banked_questions_task(job_description, resume, banked_questions))
+        
+        if blackboard is not None and blackboard.extracted:
+            analysis_steps = (
+                "1. Use the shared analysis below for the role's requirements and the user's background; do not re-derive it.\n"
+                "        2. Note the strengths and gaps in the analysis that the questions should probe."
+            )
+            documents_section = f"Shared Analysis:\n{blackboard.render()}"
+        else:
+            analysis_steps = (
+                "1. Analyze the job description to identify key skills, qualifications, and experiences required.\n"
+                "        2. Review the user's resume to understand their background and potential areas of strength or weakness."
+            )
+            documents_section = f"Job Description:\n        {job_description}\n        \n        Resume:\n        {resume}"
+            if blackboard is not None:
+                documents_section += f"\n        \n        Keyword Analysis:\n{blackboard.render()}"
+        
         task = f"""
         Your task is to generate tailored interview questions based on the job description and the user's resume.
         
-        1. Analyze the job description to identify key skills, qualifications, and experiences required.
-        2. Review the user's resume to understand their background and potential areas of strength or weakness.
+        {analysis_steps}
         3. Generate a comprehensive set of interview questions, including:
            a. Technical questions specific to the role's requirements
            b. Behavioral questions to assess fit with company culture
@@ -59,14 +99,54 @@ class InterviewPrepAgent(Agent):
         5. Include a section on common challenging questions for this role and how to address them.
         6. Provide general interview preparation advice tailored to this specific role and company.
         
+        {documents_section}
+        """
+        
+        result = self.execute_task(task)
+        
+        if question_bank is not None:
+            question_bank.add_questions(job_description, QuestionBank.extract_questions(result))
+            question_bank.save()
+        
+        return result
+    
+    def _personalize_banked_questions_task(self, job_description: str, resume: str, banked_questions: List[str]) -> str:
+        """
+        Build the task that adapts banked questions to the user's resume.
+        
+        Args:
+            job_description (str): The job description.
+            resume (str): The user's resume.
+            banked_questions (List[str]): Questions already banked for this role.
+            
+        Returns:
+            str: The task prompt.
+        """
+        question_list = "\n".join(f"        - {question}" for question in banked_questions)
+        
+        return f"""
+        Your task is to prepare the user for an interview using an existing bank of questions for this role.
+        
+        1. Use the banked questions below as the core question set. Do not rewrite them.
+        2. Review the user's resume against the job description and add only the questions the bank does not cover:
+           a. Questions about the user's specific experience and how it relates to the job
+           b. Questions that might address potential gaps or concerns in the resume
+        3. For each banked question and each added question, provide:
+           a. The question itself
+           b. Why this question might be asked
+           c. Tips for how to effectively answer it, drawing on the user's resume
+           d. Examples of strong responses
+        4. Provide general interview preparation advice tailored to this specific role and company.
+        
+        Banked Questions:
+{question_list}
+        
         Job Description:
         {job_description}
         
         Resume:
         {resume}
         """
-        
-        return self.execute_task(task)
     
     def conduct_mock_interview(self, job_description: str, resume: str, interview_focus: str) -> str:
         """
@@ -106,4 +186,201 @@ class InterviewPrepAgent(Agent):
         {interview_focus}
         """
         
-        return self.execute_task(task) 
\ No newline at end of file
+        return self.execute_task(task) 
+    
+    def start_mock_interview_session(
+        self,
+        job_description: str,
+        resume: str,
+        interview_focus: str,
+        num_questions: int = 10
+    ) -> "MockInterviewSession":
+        """
+        Start an interactive mock interview where the user answers each question.
+        
+        Args:
+            job_description (str): The job description.
+            resume (str): The user's resume.
+            interview_focus (str): The focus area for the mock interview.
+            num_questions (int): Number of questions to ask. Defaults to 10.
+            
+        Returns:
+            MockInterviewSession: The session to drive question by question.
+        """
+        return MockInterviewSession(self, job_description, resume, interview_focus, num_questions)
+
+
+class MockInterviewSession:
+    """
+    An interactive, multi-turn mock interview.
+    
+    The job description and resume are condensed into a brief once, at the start of the
+    session, and every turn sends that brief plus a rolling context of the conversation
+    instead of the full inputs and transcript. Prompt size per turn therefore stays flat
+    across the session.
+    """
+    
+    def __init__(
+        self,
+        agent: InterviewPrepAgent,
+        job_description: str,
+        resume: str,
+        interview_focus: str,
+        num_questions: int = 10,
+        max_brief_chars: int = 1500,
+        max_answer_chars: int = 2000
+    ):
+        """
+        Initialize the mock interview session.
+        
+        Args:
+            agent (InterviewPrepAgent): The agent conducting the interview.
+            job_description (str): The job description.
+            resume (str): The user's resume.
+            interview_focus (str): The focus area for the mock interview.
+            num_questions (int): Number of questions to ask. Defaults to 10.
+            max_brief_chars (int): Character budget for the condensed job and candidate brief.
+            max_answer_chars (int): Character budget for each user answer.
+        """
+        self.agent = agent
+        self.job_description = job_description
+        self.resume = resume
+        self.interview_focus = interview_focus
+        self.num_questions = num_questions
+        self.max_brief_chars = max_brief_chars
+        self.max_answer_chars = max_answer_chars
+        self.context = RollingContext()
+        self.current_question: Optional[str] = None
+        self.turn_stats: List[Dict[str, Any]] = []
+        self._brief: Optional[str] = None
+    
+    @property
+    def finished(self) -> bool:
+        """
+        Whether all questions have been answered.
+        """
+        return self.context.turn_count >= self.num_questions
+    
+    @property
+    def brief(self) -> str:
+        """
+        The condensed job and candidate context, built on first use.
+        """
+        if self._brief is None:
+            task = f"""
+        Your task is to condense the job description and resume below into a brief for a mock interviewer.
+        
+        In under 200 words, list:
+        1. The role, seniority and the key skills and responsibilities the interview should probe.
+        2. The candidate's most relevant experience and strengths.
+        3. Gaps or concerns in the resume an interviewer would likely ask about.
+        
+        Job Description:
+        {self.job_description}
+        
+        Resume:
+        {self.resume}
+        """
+            self._brief = truncate(self._execute(task, "brief"), self.max_brief_chars)
+        return self._brief
+    
+    def _execute(self, task: str, kind: str) -> str:
+        started = time.perf_counter()
+        result = self.agent.execute_task(task)
+        self.turn_stats.append({
+            "kind": kind,
+            "turn": self.context.turn_count + 1,
+            "prompt_chars": len(task),
+            "latency_seconds": time.perf_counter() - started
+        })
+        return result
+    
+    def ask_question(self) -> str:
+        """
+        Ask the next interview question.
+        
+        Returns:
+            str: The question.
+        """
+        if self.finished:
+            raise RuntimeError("The mock interview has no questions left.")
+        
+        task = f"""
+        You are conducting a mock interview focused on: {self.interview_focus}
+        
+        Ask question {self.context.turn_count + 1} of {self.num_questions}. Ask exactly one question and nothing else.
+        Do not repeat topics already covered. Include at least one challenging or unexpected question over the session.
+        
+        Candidate Brief:
+        {self.brief}
+        
+        Conversation So Far:
+        {self.context.render()}
+        """
+        
+        self.current_question = self._execute(task, "question").strip()
+        return self.current_question
+    
+    def submit_answer(self, answer: str) -> str:
+        """
+        Submit the user's answer to the current question and get feedback.
+        
+        Args:
+            answer (str): The user's answer.
+            
+        Returns:
+            str: Feedback on the answer.
+        """
+        if self.current_question is None:
+            raise RuntimeError("No question is awaiting an answer. Call ask_question() first.")
+        
+        answer = truncate(answer, self.max_answer_chars)
+        task = f"""
+        You are conducting a mock interview focused on: {self.interview_focus}
+        
+        Give concise feedback on the candidate's answer to the current question:
+        a. What was strong
+        b. What a strong answer would also include
+        c. Pitfalls to avoid
+        
+        Candidate Brief:
+        {self.brief}
+        
+        Conversation So Far:
+        {self.context.render()}
+        
+        Current Question:
+        {self.current_question}
+        
+        Candidate Answer:
+        {answer}
+        """
+        
+        feedback = self._execute(task, "feedback")
+        self.context.add_turn(self.current_question, answer, feedback)
+        self.current_question = None
+        return feedback
+    
+    def conclude(self) -> str:
+        """
+        Give overall feedback for the session.
+        
+        Returns:
+            str: Strengths, areas for improvement and preparation recommendations.
+        """
+        task = f"""
+        You have finished a mock interview focused on: {self.interview_focus}
+        
+        Conclude with overall feedback, including:
+        a. Strengths to emphasize in the actual interview
+        b. Areas for improvement
+        c. Specific preparation recommendations before the real interview
+        
+        Candidate Brief:
+        {self.brief}
+        
+        Session Summary:
+        {self.context.render()}
+        """
+        
+        return self._execute(task, "conclusion")
@@ -3,7 +3,9 @@ Job Search Agent - Specializes in finding and summarizing relevant job postings.
 """
 
 from crewai import Agent
-from typing import List
+from typing import Any, List, Optional
+
+from job_seeker_ai.utils.dedup import PostingDeduplicator
 
 
 class JobSearchAgent(Agent):
@@ -12,7 +14,7 @@ class JobSearchAgent(Agent):
     based on user preferences and qualifications.
     """
     
-    def __init__(self, role: str, goal: str, tools: List):
+    def __init__(self, role: str, goal: str, tools: List, llm: Optional[Any] = None):
         """
         Initialize the Job Search Agent.
         
@@ -20,32 +22,59 @@ class JobSearchAgent(Agent):
             role (str): The role of the agent.
             goal (str): The goal of the agent.
             tools (List): The tools available to the agent.
+            llm (Optional[Any]): The language model for the agent. Defaults to the crew default.
         """
+        options = {"llm": llm} if llm is not None else {}
         super().__init__(
             role=role,
             goal=goal,
             backstory="I am a seasoned job search specialist with extensive knowledge of job markets, industry trends, and recruitment practices. I excel at finding relevant job opportunities that match a candidate's skills, experience, and career goals across various platforms and networks.",
             tools=tools,
-            verbose=True
+            verbose=True,
+            **options
         )
     
-    def find_job_opportunities(self, resume: str, job_preferences: str) -> str:
+    def find_job_opportunities(
+        self,
+        resume: str,
+        job_preferences: str,
+        postings: Optional[List[str]] = None,
+        deduplicator: Optional[PostingDeduplicator] = None,
+        use_web_search: bool = True
+    ) -> str:
         """
         Find job opportunities based on resume and preferences.
         
         Args:
             resume (str): The user's resume.
             job_preferences (str): The user's job preferences.
+            postings (Optional[List[str]]): Postings already gathered from search and scrape results.
+                Defaults to None.
+            deduplicator (Optional[PostingDeduplicator]): Index used to collapse near-duplicate
+                postings before they reach the prompt. Defaults to None.
+            use_web_search (bool): Whether the agent may search the web. Set to False for a
+                faster answer from the provided postings and the agent's own knowledge, run by a
+                copy of the agent without tools. Defaults to True.
             
         Returns:
             str: A list of relevant job opportunities.
         """
+        if postings and deduplicator is not None:
+            postings = deduplicator.deduplicate(postings).unique
+            deduplicator.save()
+        
+        search_step = (
+            "Use web search to find job postings that match the user's profile and preferences."
+            if use_web_search else
+            "Do not use web search. Work only from any postings provided below and your own knowledge of the job market."
+        )
+        
         task = f"""
         Your task is to find and summarize relevant job opportunities based on the user's resume and preferences.
         
         1. Analyze the user's resume to understand their skills, qualifications, and experience.
         2. Consider the user's job preferences.
-        3. Use web search to find job postings that match the user's profile and preferences.
+        3. {search_step}
         4. For each relevant job posting, provide:
            a. Job title and company
            b. Location (including remote options)
@@ -63,6 +92,20 @@ class JobSearchAgent(Agent):
         {job_preferences}
         """
         
+        if postings:
+            posting_list = "\n\n".join(f"        Posting {i}:\n        {posting}" for i, posting in enumerate(postings, 1))
+            task += f"""
+        The following postings have already been collected and deduplicated. Summarize these before searching for more,
+        and do not summarize the same job twice.
+        
+{posting_list}
+        """
+        
+        if not use_web_search:
+            # The prompt alone does not stop the agent calling its tools, so the call runs
+            # on a tool-less copy rather than clearing the tools of this shared agent.
+            agent = type(self)(self.role, self.goal, [], llm=getattr(self, "llm", None))
+            return agent.execute_task(task)
         return self.execute_task(task)
     
     def analyze_job_market(self, industry: str, location: str) -> str:
@@ -3,7 +3,9 @@ Negotiation Agent - Specializes in providing guidance on offer evaluation and ne
 """
 
 from crewai import Agent
-from typing import List
+from typing import Any, List, Optional
+
+from job_seeker_ai.utils.blackboard import Blackboard
 
 
 class NegotiationAgent(Agent):
@@ -12,7 +14,7 @@ class NegotiationAgent(Agent):
     and negotiation strategies to help users secure better compensation packages.
     """
     
-    def __init__(self, role: str, goal: str, tools: List):
+    def __init__(self, role: str, goal: str, tools: List, llm: Optional[Any] = None):
         """
         Initialize the Negotiation Agent.
         
@@ -20,27 +22,53 @@ class NegotiationAgent(Agent):
             role (str): The role of the agent.
             goal (str): The goal of the agent.
             tools (List): The tools available to the agent.
+            llm (Optional[Any]): The language model for the agent. Defaults to the crew default.
         """
+        options = {"llm": llm} if llm is not None else {}
         super().__init__(
             role=role,
             goal=goal,
             backstory="I am a negotiation expert with extensive experience in the recruitment and HR space. I specialize in helping job seekers evaluate job offers and negotiate competitive compensation packages that reflect their true market value. I understand both the candidate and employer perspectives in the negotiation process.",
             tools=tools,
-            verbose=True
+            verbose=True,
+            **options
         )
     
-    def evaluate_job_offer(self, offer_details: str, resume: str, job_description: str) -> str:
+    def evaluate_job_offer(
+        self,
+        offer_details: str,
+        resume: str,
+        job_description: str,
+        blackboard: Optional[Blackboard] = None
+    ) -> str:
         """
         Evaluate a job offer based on the details provided.
         
+        When an extracted blackboard is given, the prompt carries its requirements, profile
+        and gaps instead of the full resume and job description. A keyword-only blackboard
+        is added as hints next to them.
+        
         Args:
             offer_details (str): The details of the job offer.
             resume (str): The user's resume.
             job_description (str): The job description.
+            blackboard (Optional[Blackboard]): The run's shared analysis. Defaults to None.
             
         Returns:
             str: An evaluation of the job offer.
         """
+        if blackboard is not None and blackboard.extracted:
+            qualifications_step = (
+                "3. Use the shared analysis below for the role's requirements and the user's strengths and gaps; "
+                "do not re-derive it. Consider the value the user would bring to the company."
+            )
+            documents_section = f"Shared Analysis:\n{blackboard.render()}"
+        else:
+            qualifications_step = "3. Consider the user's qualifications, experience, and value they would bring to the company."
+            documents_section = f"Resume:\n        {resume}\n        \n        Job Description:\n        {job_description}"
+            if blackboard is not None:
+                documents_section += f"\n        \n        Keyword Analysis:\n{blackboard.render()}"
+        
         task = f"""
         Your task is to evaluate the job offer based on the details provided and provide guidance.
         
@@ -53,7 +81,7 @@ class NegotiationAgent(Agent):
            f. Role and responsibilities
            g. Growth opportunities
         2. Compare the offer to industry standards for similar roles by researching current market rates.
-        3. Consider the user's qualifications, experience, and value they would bring to the company.
+        {qualifications_step}
         4. Evaluate the offer's strengths and weaknesses.
         5. Provide a detailed assessment of whether the offer is fair, below market, or above market.
         6. Identify specific components that could be negotiated for improvement.
@@ -62,11 +90,7 @@ class NegotiationAgent(Agent):
         Offer Details:
         {offer_details}
         
-        Resume:
-        {resume}
-        
-        Job Description:
-        {job_description}
+        {documents_section}
         """
         
         return self.execute_task(task)
@@ -2,8 +2,33 @@
 Resume Agent - Specializes in optimizing resumes for specific job descriptions.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from dataclasses import dataclass, field
 from crewai import Agent
-from typing import List
+from typing import Any, Dict, List, Optional
+
+from job_seeker_ai.tools.resume_parser import ResumeParser
+from job_seeker_ai.utils.blackboard import Blackboard
+from job_seeker_ai.utils.metrics import SharedPrefixTracker, Timer
+
+
+@dataclass
+class ResumeFanOutResult:
+    """
+    Results of tailoring one resume to several job descriptions.
+    
+    Attributes:
+        results (List[str]): Optimized resume per job description, in input order.
+        latencies (List[float]): Wall-clock seconds per job description, in input order.
+        shared_prefix_fraction (float): Fraction of prompt characters that repeat the prefix of an
+            earlier request, i.e. the most a provider prefix cache could serve. Not an observed hit rate.
+        errors (Dict[int, str]): Job description index -> error message, for failed requests.
+    """
+    results: List[str] = field(default_factory=list)
+    latencies: List[float] = field(default_factory=list)
+    shared_prefix_fraction: float = 0.0
+    errors: Dict[int, str] = field(default_factory=dict)
 
 
 class ResumeAgent(Agent):
@@ -12,7 +37,7 @@ class ResumeAgent(Agent):
     specific job descriptions, highlighting relevant skills and experience.
     """
     
-    def __init__(self, role: str, goal: str, tools: List):
+    def __init__(self, role: str, goal: str, tools: List, llm: Optional[Any] = None):
         """
         Initialize the Resume Agent.
         
@@ -20,42 +45,162 @@ class ResumeAgent(Agent):
             role (str): The role of the agent.
             goal (str): The goal of the agent.
             tools (List): The tools available to the agent.
+            llm (Optional[Any]): The language model for the agent. Defaults to the crew default.
         """
+        options = {"llm": llm} if llm is not None else {}
         super().__init__(
             role=role,
             goal=goal,
             backstory="I am an expert in resume optimization with years of experience in talent acquisition and HR. I specialize in tailoring resumes to match job descriptions, highlighting relevant skills and experiences to maximize the chances of getting interviews.",
             tools=tools,
-            verbose=True
+            verbose=True,
+            **options
         )
     
-    def optimize_resume(self, resume: str, job_description: str) -> str:
+    def _shared_prompt_prefix(self, resume: str, parsed_resume: Optional[Dict[str, Any]]) -> str:
         """
-        Optimize a resume based on a job description.
+        Build the part of the prompt that is identical for every job description.
+        
+        The agent's backstory is sent ahead of this by the crew as the system prompt, so
+        backstory, instructions and resume together form a stable prefix that providers
+        can cache when one resume is tailored to many job descriptions.
         
         Args:
             resume (str): The user's resume.
-            job_description (str): The job description.
+            parsed_resume (Optional[Dict[str, Any]]): Output of the resume parser, or None when a
+                shared analysis is sent with the job description instead.
             
         Returns:
-            str: The optimized resume.
+            str: The shared prompt prefix.
         """
-        task = f"""
-        Your task is to optimize the user's resume to match the provided job description.
+        if parsed_resume is None:
+            analysis_steps = (
+                "1. Use the shared analysis given with the job description for its requirements and the resume's strengths and gaps; do not re-derive it.\n"
+                "        2. Decide which strengths to emphasize and how to address the gaps."
+            )
+            parsed_section = ""
+        else:
+            analysis_steps = (
+                "1. Analyze the job description to identify key skills, qualifications, and experiences required.\n"
+                "        2. Review the user's resume and identify strengths, weaknesses, and gaps compared to the job requirements."
+            )
+            skills = ", ".join(parsed_resume.get("skills", [])) or "not listed"
+            education = "; ".join(parsed_resume.get("education", [])) or "not listed"
+            parsed_section = f"""
+        Parsed Resume Sections:
+        Skills: {skills}
+        Education: {education}
+        Experience entries: {len(parsed_resume.get("experience", []))}
+        """
+        
+        return f"""
+        Your task is to optimize the user's resume to match the job description given at the end.
         
-        1. Analyze the job description to identify key skills, qualifications, and experiences required.
-        2. Review the user's resume and identify strengths, weaknesses, and gaps compared to the job requirements.
+        {analysis_steps}
         3. Restructure and rewrite the resume to highlight relevant skills and experiences that match the job description.
         4. Remove or downplay irrelevant information.
         5. Use industry-specific keywords and phrases from the job description.
         6. Ensure the resume follows best practices for formatting and presentation.
         7. Provide a summary of changes made and why they improve the resume's effectiveness.
         
+        Resume:
+        {resume}
+        {parsed_section}"""
+    
+    def _job_prompt_suffix(self, job_description: str, blackboard: Optional[Blackboard] = None) -> str:
+        """
+        Build the part of the prompt that varies per job description.
+        
+        Args:
+            job_description (str): The job description.
+            blackboard (Optional[Blackboard]): The run's shared analysis. Defaults to None.
+            
+        Returns:
+            str: The per-job prompt suffix.
+        """
+        analysis_section = f"""
+        Shared Analysis:
+{blackboard.render()}
+        """ if blackboard is not None else ""
+        
+        return f"""{analysis_section}
         Job Description:
         {job_description}
+        """
+    
+    def optimize_resume(self, resume: str, job_description: str, blackboard: Optional[Blackboard] = None) -> str:
+        """
+        Optimize a resume based on a job description.
         
-        Resume:
-        {resume}
+        Args:
+            resume (str): The user's resume.
+            job_description (str): The job description.
+            blackboard (Optional[Blackboard]): The run's shared analysis. An extracted analysis is
+                used instead of parsing and analyzing the resume again; a keyword analysis is
+                added as hints. Defaults to None.
+            
+        Returns:
+            str: The optimized resume.
+        """
+        parsed_resume = ResumeParser()._run(resume) if blackboard is None or not blackboard.extracted else None
+        task = self._shared_prompt_prefix(resume, parsed_resume) + self._job_prompt_suffix(job_description, blackboard)
+        
+        return self.execute_task(task)
+    
+    def optimize_resume_for_jobs(
+        self,
+        resume: str,
+        job_descriptions: List[str],
+        max_workers: int = 4
+    ) -> ResumeFanOutResult:
         """
+        Tailor one resume to several job descriptions.
+        
+        The resume is parsed once and every prompt starts with the same prefix. The first
+        job description is run on its own so the provider can cache that prefix, then the
+        remaining ones run concurrently. A crewai agent keeps per-task executor and tool
+        state, so each worker thread runs its tasks on its own copy of this agent.
+        
+        Args:
+            resume (str): The user's resume.
+            job_descriptions (List[str]): The job descriptions to tailor the resume to.
+            max_workers (int): Maximum number of concurrent requests. Defaults to 4.
+            
+        Returns:
+            ResumeFanOutResult: Optimized resumes with per-job latency and the shared prefix fraction.
+        """
+        fan_out = ResumeFanOutResult(
+            results=[""] * len(job_descriptions),
+            latencies=[0.0] * len(job_descriptions)
+        )
+        if not job_descriptions:
+            return fan_out
+        
+        prefix = self._shared_prompt_prefix(resume, ResumeParser()._run(resume))
+        tracker = SharedPrefixTracker()
+        caller = threading.current_thread()
+        workers = threading.local()
+        
+        def agent_for_thread() -> "ResumeAgent":
+            if threading.current_thread() is caller:
+                return self
+            if not hasattr(workers, "agent"):
+                workers.agent = type(self)(self.role, self.goal, self.tools, llm=getattr(self, "llm", None))
+            return workers.agent
+        
+        def optimize(index: int) -> None:
+            task = prefix + self._job_prompt_suffix(job_descriptions[index])
+            tracker.record(prefix, task)
+            with Timer() as timer:
+                try:
+                    fan_out.results[index] = agent_for_thread().execute_task(task)
+                except Exception as e:
+                    fan_out.errors[index] = str(e)
+            fan_out.latencies[index] = timer.elapsed
+        
+        optimize(0)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(optimize, range(1, len(job_descriptions))))
         
-        return self.execute_task(task) 
\ No newline at end of file
+        fan_out.shared_prefix_fraction = tracker.shared_prefix_fraction
+        return fan_out
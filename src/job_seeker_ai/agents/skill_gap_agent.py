@@ -3,7 +3,11 @@ Skill Gap Agent - Specializes in identifying skill gaps and recommending develop
 """
 
 from crewai import Agent
-from typing import List
+from typing import Any, List, Optional
+
+from job_seeker_ai.utils.blackboard import Blackboard
+from job_seeker_ai.utils.resource_catalog import ResourceCatalog
+from job_seeker_ai.utils.skills import extract_skills
 
 
 class SkillGapAgent(Agent):
@@ -12,7 +16,7 @@ class SkillGapAgent(Agent):
     and job requirements, and recommends resources to bridge these gaps.
     """
     
-    def __init__(self, role: str, goal: str, tools: List):
+    def __init__(self, role: str, goal: str, tools: List, llm: Optional[Any] = None):
         """
         Initialize the Skill Gap Agent.
         
@@ -20,27 +24,105 @@ class SkillGapAgent(Agent):
             role (str): The role of the agent.
             goal (str): The goal of the agent.
             tools (List): The tools available to the agent.
+            llm (Optional[Any]): The language model for the agent. Defaults to the crew default.
         """
+        options = {"llm": llm} if llm is not None else {}
         super().__init__(
             role=role,
             goal=goal,
             backstory="I am a professional career development advisor with expertise in identifying skill gaps and providing targeted learning resources. I help job seekers understand what skills they need to develop to succeed in their desired roles and recommend the best resources to gain those skills efficiently.",
             tools=tools,
-            verbose=True
+            verbose=True,
+            **options
         )
     
-    def analyze_skill_gaps(self, resume: str, job_description: str) -> str:
+    def extract_requirements(self, job_description: str, resume: str) -> str:
+        """
+        Extract a structured analysis of a job description and resume for the run's blackboard.
+        
+        Args:
+            job_description (str): The job description.
+            resume (str): The user's resume.
+            
+        Returns:
+            str: The analysis as a JSON object, to be read by Blackboard.from_extraction.
+        """
+        task = f"""
+        Your task is to extract a structured analysis of the job description and the user's resume.
+        Other advisors will rely on this analysis instead of reading either document, so include
+        every requirement, whatever the field: technical skills, frameworks, clinical or domain
+        competencies, licenses, certifications and degrees.
+        
+        Return only a JSON object with these keys:
+        - "title": the job title
+        - "required_skills": every required skill, tool or competency, as short names
+        - "preferred_skills": skills listed as preferred or nice to have
+        - "qualifications": required degrees, licenses and certifications
+        - "responsibilities": the main duties of the role, one short phrase each
+        - "min_years_experience": the minimum years of experience required, or null
+        - "candidate_skills": the skills the resume shows, as short names
+        - "candidate_years_experience": the candidate's years of relevant experience, or null
+        - "candidate_education": the education entries in the resume
+        - "candidate_experience": the candidate's experience most relevant to the job, one short phrase each
+        - "matched_skills": required and preferred skills the candidate has
+        - "missing_skills": required skills and qualifications the candidate lacks
+        - "missing_preferred_skills": preferred skills the candidate lacks
+        
+        Job Description:
+        {job_description}
+        
+        Resume:
+        {resume}
+        """
+        
+        return self.execute_task(task)
+    
+    def analyze_skill_gaps(
+        self,
+        resume: str,
+        job_description: str,
+        resource_catalog: Optional[ResourceCatalog] = None,
+        blackboard: Optional[Blackboard] = None
+    ) -> str:
         """
         Analyze skill gaps between a resume and a job description.
         
+        When a resource catalog is given, recommendations for the missing skills it covers
+        are included in the prompt, and web search is only needed for the remaining skills.
+        When an extracted blackboard is given, the prompt carries its requirements, profile
+        and gaps instead of the full job description and resume. A keyword-only blackboard
+        is added as hints next to them.
+        
         Args:
             resume (str): The user's resume.
             job_description (str): The job description.
+            resource_catalog (Optional[ResourceCatalog]): Local catalog of learning resources.
+                Defaults to None.
+            blackboard (Optional[Blackboard]): The run's shared analysis. Defaults to None.
             
         Returns:
             str: Analysis of skill gaps and recommended resources.
         """
-        task = f"""
+        if blackboard is not None and blackboard.extracted:
+            task = f"""
+        Your task is to explain the skill gaps identified below and recommend resources to bridge them.
+        
+        1. Use the shared analysis of the job requirements and the user's resume below; do not re-derive it.
+        2. For each missing skill, provide:
+           a. A clear description of the skill needed
+           b. Why this skill is important for the position
+           c. Specific recommendations for learning resources (online courses, books, tutorials, etc.)
+           d. Estimated time required to develop the skill to a sufficient level
+        3. Note any experience or qualification gaps the analysis shows.
+        4. Prioritize the skill gaps based on importance for the role.
+        5. Provide a learning roadmap with a suggested timeline.
+        
+        Shared Analysis:
+{blackboard.render()}
+        """
+            missing_skills = blackboard.missing_skills + blackboard.missing_preferred_skills
+        else:
+            task = f"""
         Your task is to identify skill gaps between the user's resume and the job description and recommend resources to bridge these gaps.
         
         1. Analyze the job description to identify required skills, qualifications, and experiences.
@@ -60,5 +142,51 @@ class SkillGapAgent(Agent):
         Resume:
         {resume}
         """
+            resume_skills = set(extract_skills(resume))
+            missing_skills = [skill for skill in extract_skills(job_description) if skill not in resume_skills]
+            if blackboard is not None:
+                task += f"""
+        Keyword Analysis:
+{blackboard.render()}
+        """
+                missing_skills = blackboard.missing_skills + blackboard.missing_preferred_skills
+        
+        if resource_catalog is not None:
+            task += self._prefetched_resources_section(missing_skills, resource_catalog)
+        
+        return self.execute_task(task)
+    
+    def _prefetched_resources_section(self, missing_skills: List[str], resource_catalog: ResourceCatalog) -> str:
+        """
+        Build the prompt section listing catalog resources for the missing skills.
+        
+        Args:
+            missing_skills (List[str]): Canonical skills the job requires and the resume lacks.
+            resource_catalog (ResourceCatalog): Local catalog of learning resources.
+            
+        Returns:
+            str: The prompt section, or an empty string if the catalog covers none of the missing skills.
+        """
+        recommendations = resource_catalog.recommend(missing_skills)
+        if not recommendations:
+            return ""
+        
+        lines = []
+        for skill, resources in recommendations.items():
+            lines.append(f"        {skill}:")
+            lines.extend(f"          - {resource.format()}" for resource in resources)
+        
+        uncovered = [skill for skill in missing_skills if skill not in recommendations]
+        search_note = (
+            f"Only use web search to find resources for skills not listed above (for example: {', '.join(uncovered)})."
+            if uncovered else
+            "Only use web search to find resources for skills not listed above."
+        )
+        resource_list = "\n".join(lines)
+        
+        return f"""
+        Prefetched Learning Resources:
+        Use these vetted resources and their time estimates for the skills below. {search_note}
         
-        return self.execute_task(task) 
\ No newline at end of file
+{resource_list}
+        """ 
\ No newline at end of file
@@ -8,7 +8,10 @@ a simple command-line interface for interacting with the agents.
 
 import os
 import yaml
+import signal
 import logging
+import argparse
+from contextlib import nullcontext
 from dotenv import load_dotenv
 from crewai import Crew, Process
 from crewai.tools import SerperDevAPI, WebScraper
@@ -18,6 +21,20 @@ from job_seeker_ai.agents.skill_gap_agent import SkillGapAgent
 from job_seeker_ai.agents.job_search_agent import JobSearchAgent
 from job_seeker_ai.agents.interview_prep_agent import InterviewPrepAgent
 from job_seeker_ai.agents.negotiation_agent import NegotiationAgent
+from job_seeker_ai.tools.html_extractor import clean_scraped_page
+from job_seeker_ai.tools.runtime import RuntimeTool, get_runtime
+from job_seeker_ai.utils.blackboard import Blackboard
+from job_seeker_ai.utils.deadline import Deadline, Stage, check_cancelled, format_pipeline_result, run_stages
+from job_seeker_ai.utils.helpers import read_file_content, validate_input
+from job_seeker_ai.utils.ingestion import compact_text
+from job_seeker_ai.utils.model_router import EXTRACTION, GENERATION, SCORING, ModelRouter
+from job_seeker_ai.utils.profiling import StageProfiler
+from job_seeker_ai.utils.question_bank import QuestionBank
+from job_seeker_ai.utils.resource_catalog import ResourceCatalog
+from job_seeker_ai.utils.saved_searches import SavedSearchStore, parse_serper_results, refresh_search
+from job_seeker_ai.utils.skills import extract_role_title
+from job_seeker_ai.workers.job_queue import SQLiteJobQueue
+from job_seeker_ai.workers.worker import PermanentJobError, Worker
 
 # Configure logging
 logging.basicConfig(
@@ -50,6 +67,10 @@ def initialize_tools():
     """
     Initialize the tools for the agents.
     
+    Both tools do network I/O, so they are wrapped to run on the shared tool runtime's
+    bounded thread pool with per-call timeouts. Scraped pages are reduced to their
+    posting text before they reach the agents.
+    
     Returns:
         tuple: Initialized SerperDevAPI and WebScraper tools.
     """
@@ -57,50 +78,68 @@ def initialize_tools():
     if not serper_api_key:
         logger.warning("SERPER_API_KEY not found in environment variables.")
         
-    serper_dev_api = SerperDevAPI(api_key=serper_api_key)
-    web_scraper = WebScraper()
+    serper_dev_api = RuntimeTool(SerperDevAPI(api_key=serper_api_key))
+    web_scraper = RuntimeTool(WebScraper(), postprocess=clean_scraped_page)
     
     return serper_dev_api, web_scraper
 
-def initialize_agents(config, tools):
+AGENT_KEYS = [
+    "resume_agent",
+    "skill_gap_agent",
+    "job_search_agent",
+    "interview_prep_agent",
+    "negotiation_agent",
+]
+
+def initialize_agents(config, tools, router=None):
     """
     Initialize the agents with their configurations and tools.
     
     Args:
         config (dict): Agent configurations.
         tools (list): List of tools to be used by the agents.
+        router (ModelRouter): Chooses each agent's model from its configured tier.
+            Defaults to None, which gives every agent the crew's default model.
         
     Returns:
         list: List of initialized agents.
     """
+    def llm(agent_key):
+        return router.agent_llm(agent_key) if router else None
+    
     resume_agent = ResumeAgent(
         config["resume_agent"]["role"],
         config["resume_agent"]["goal"],
-        tools
+        tools,
+        llm=llm("resume_agent")
     )
     
     skill_gap_agent = SkillGapAgent(
         config["skill_gap_agent"]["role"],
         config["skill_gap_agent"]["goal"],
-        tools
+        tools,
+        llm=llm("skill_gap_agent")
     )
     
     job_search_agent = JobSearchAgent(
         config["job_search_agent"]["role"],
         config["job_search_agent"]["goal"],
-        tools
+        tools,
+        llm=llm("job_search_agent")
     )
     
     interview_prep_agent = InterviewPrepAgent(
         config["interview_prep_agent"]["role"],
         config["interview_prep_agent"]["goal"],
-        tools
+        tools,
+        llm=llm("interview_prep_agent")
     )
     
     negotiation_agent = NegotiationAgent(
         config["negotiation_agent"]["role"],
         config["negotiation_agent"]["goal"],
-        tools
+        tools,
+        llm=llm("negotiation_agent")
     )
     
     return [
@@ -127,25 +166,388 @@ def create_crew(agents):
         verbose=True
     )
 
-def main():
+STAGE_TITLES = {
+    "analysis": "Requirements Analysis",
+    "resume": "Optimized Resume",
+    "skill_gaps": "Skill Gaps",
+    "job_search": "Job Opportunities",
+    "interview_prep": "Interview Preparation",
+}
+
+def build_stages(agents, job_description, resume, router=None, question_bank=None):
     """
-    Main function to run the Job Seeker AI Assistant.
+    Build the deadline-aware pipeline of agent steps for a job description and resume.
+    
+    The job search stage gets a double share of the budget and skips web search when
+    its share drops below 30 seconds. With a router, each step runs on its own copy of
+    its agent, with the model tier routed for the agent, method, task type and input size. The first step extracts the
+    requirements, candidate profile and gaps once into a blackboard that the resume,
+    skill gap and interview prep steps share instead of each re-analyzing the inputs. If
+    the extraction is skipped or fails, they get a keyword analysis as hints instead.
+    With a question bank, interview prep reuses the questions banked for the same role
+    and skills, and banks the ones it generates.
+    
+    Args:
+        agents (list): Agents as returned by initialize_agents.
+        job_description (str): The job description.
+        resume (str): The user's resume.
+        router (ModelRouter): Routes each step to a model tier. Defaults to None.
+        question_bank (QuestionBank): Bank of reusable interview questions. Defaults to None.
+        
+    Returns:
+        list: The pipeline stages, in order.
+    """
+    job_preferences = f"Roles similar to: {extract_role_title(job_description) or 'the provided job description'}"
+    input_text = f"{resume}\n{job_description}"
+    # Replaced by the extracted analysis once the analysis stage completes.
+    analysis = {"blackboard": Blackboard.build(job_description, resume)}
+    
+    agents_by_key = dict(zip(AGENT_KEYS, agents))
+    
+    def routed(agent_key, method, task_type, func):
+        def run(degraded, cancel):
+            # A stage abandoned before it reaches its model call does not make it.
+            check_cancelled(cancel)
+            # Read once, so the whole stage works from the analysis current when it started.
+            blackboard = analysis["blackboard"]
+            agent = agents_by_key[agent_key]
+            if router is None:
+                return func(agent, degraded, blackboard)
+            return router.call(
+                agent, agent_key, method,
+                lambda routed_agent: func(routed_agent, degraded, blackboard), input_text, task_type
+            )
+        return run
+    
+    extract = routed(
+        "skill_gap_agent", "extract_requirements", EXTRACTION,
+        lambda agent, degraded, blackboard: agent.extract_requirements(job_description, resume)
+    )
+    
+    def analyze(degraded, cancel):
+        if not degraded:
+            extraction = extract(degraded, cancel)
+            # An extraction that outlived its stage must not replace the analysis that
+            # later stages have already started from.
+            check_cancelled(cancel)
+            analysis["blackboard"] = Blackboard.from_extraction(extraction)
+        return "\n".join(line.strip() for line in analysis["blackboard"].render().splitlines())
+    
+    return [
+        Stage("analysis", analyze, weight=0.5, degrade_below=5.0),
+        Stage(
+            "resume",
+            routed(
+                "resume_agent", "optimize_resume", GENERATION,
+                lambda agent, degraded, blackboard: agent.optimize_resume(resume, job_description, blackboard)
+            )
+        ),
+        Stage(
+            "skill_gaps",
+            routed(
+                "skill_gap_agent", "analyze_skill_gaps", GENERATION,
+                lambda agent, degraded, blackboard: agent.analyze_skill_gaps(
+                    resume, job_description, ResourceCatalog(), blackboard
+                )
+            )
+        ),
+        Stage(
+            "job_search",
+            routed(
+                "job_search_agent", "find_job_opportunities", SCORING,
+                lambda agent, degraded, blackboard: agent.find_job_opportunities(
+                    resume, job_preferences, use_web_search=not degraded
+                )
+            ),
+            weight=2.0,
+            degrade_below=30.0
+        ),
+        Stage(
+            "interview_prep",
+            routed(
+                "interview_prep_agent", "generate_interview_questions", GENERATION,
+                lambda agent, degraded, blackboard: agent.generate_interview_questions(
+                    job_description, resume, question_bank=question_bank, blackboard=blackboard
+                )
+            )
+        ),
+    ]
+
+def parse_args(argv=None):
+    """
+    Parse command-line arguments.
+    
+    Args:
+        argv (list): Arguments to parse. Defaults to sys.argv.
+        
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Job Seeker AI Assistant")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile each stage of the run and write cProfile, flame graph and memory output."
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=os.path.join(os.getenv("OUTPUT_DIR", "./output"), "profile"),
+        help="Directory for profiling output."
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Run as a queue worker, pulling crew runs from the shared job queue."
+    )
+    parser.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="Add the entered job description and resume to the shared job queue instead of running them."
+    )
+    parser.add_argument(
+        "--queue-path",
+        default=os.getenv("JOB_QUEUE_PATH", os.path.join(os.getenv("OUTPUT_DIR", "./output"), "jobs.sqlite3")),
+        help="SQLite file backing the shared job queue."
+    )
+    parser.add_argument(
+        "--queue-journal-mode",
+        choices=["DELETE", "WAL"],
+        default=os.getenv("JOB_QUEUE_JOURNAL_MODE", "DELETE").upper(),
+        help="SQLite journal mode of the job queue. DELETE (the default) uses file locks and works "
+             "when the queue file is shared between machines; WAL is faster but only safe when all "
+             "workers run on one host."
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="Latency budget in seconds. Agents run one by one with a share of the budget each, "
+             "and whatever completes in time is returned."
+    )
+    parser.add_argument(
+        "--mock-interview",
+        action="store_true",
+        help="Run an interactive mock interview for the entered job description and resume."
+    )
+    parser.add_argument(
+        "--mock-interview-questions",
+        type=int,
+        default=10,
+        help="Number of questions asked in a mock interview."
+    )
+    parser.add_argument(
+        "--save-search",
+        action="store_true",
+        help="Save a job search to be refreshed on a schedule instead of running the crew."
+    )
+    parser.add_argument(
+        "--refresh-saved-searches",
+        action="store_true",
+        help="Refresh the saved searches that are due, summarizing only new or changed postings. "
+             "Run this from cron or another scheduler."
+    )
+    parser.add_argument(
+        "--saved-searches-path",
+        default=os.path.join(os.getenv("OUTPUT_DIR", "./output"), "saved_searches.json"),
+        help="JSON file holding the saved searches."
+    )
+    return parser.parse_args(argv)
+
+def build_crew(stage):
+    """
+    Initialize the tools, configuration and agents, and create the crew.
+    
+    Args:
+        stage (callable): Returns a context manager wrapping each startup stage.
+        
+    Returns:
+        tuple: The crew and its model router (None when no model tiers are configured),
+            or (None, None) if the configuration could not be loaded.
     """
     # Initialize tools
-    serper_dev_api, web_scraper = initialize_tools()
+    with stage("initialize_tools"):
+        serper_dev_api, web_scraper = initialize_tools()
     tools = [serper_dev_api, web_scraper]
     
     # Load agent configurations
-    config = load_config("src/job_seeker_ai/config/agents.yaml")
+    with stage("load_config"):
+        config = load_config("src/job_seeker_ai/config/agents.yaml")
     if not config:
         logger.error("Failed to load agent configurations.")
-        return
+        return None, None
     
     # Initialize agents
-    agents = initialize_agents(config, tools)
+    with stage("initialize_agents"):
+        router = ModelRouter.from_config(config)
+        agents = initialize_agents(config, tools, router)
     
     # Create the crew
-    crew = create_crew(agents)
+    with stage("create_crew"):
+        return create_crew(agents), router
+
+def prepare_inputs(payload):
+    """
+    Compact the text inputs of a crew run and check that the required ones are present.
+    
+    Pasted or queued text is bounded the same way as uploaded files, so a giant input
+    cannot blow up memory or the prompt.
+    
+    Args:
+        payload (dict): The run inputs, with "job_description" and "resume".
+        
+    Returns:
+        dict: The compacted inputs.
+        
+    Raises:
+        ValueError: If a required input is missing or empty.
+    """
+    inputs = {
+        key: compact_text([value])[0] if isinstance(value, str) else value
+        for key, value in payload.items()
+    }
+    if not validate_input(inputs, ["job_description", "resume"]):
+        raise ValueError("A job description and a resume are required.")
+    return inputs
+
+def run_queued_job(crew, payload):
+    """
+    Run a crew on a queued job payload.
+    
+    Args:
+        crew (Crew): The crew to run.
+        payload (dict): The job payload.
+        
+    Returns:
+        The crew output.
+        
+    Raises:
+        PermanentJobError: If the payload is invalid, so the job is not retried.
+    """
+    try:
+        inputs = prepare_inputs(payload)
+    except ValueError as e:
+        raise PermanentJobError(str(e)) from e
+    return crew.kickoff(inputs=inputs)
+
+def refresh_saved_searches(crew, store_path):
+    """
+    Refresh the saved searches that are due and print the new postings for each.
+    
+    Args:
+        crew (Crew): The crew whose job search agent summarizes the postings.
+        store_path (str): Path to the saved searches file.
+    """
+    store = SavedSearchStore(store_path)
+    due = store.due()
+    if not due:
+        print("No saved searches are due.")
+        return
+    
+    serper_dev_api, _ = initialize_tools()
+    job_search_agent = crew.agents[2]
+    
+    for search in due:
+        try:
+            summary = refresh_search(
+                search,
+                job_search_agent,
+                lambda saved: parse_serper_results(serper_dev_api.run(f"{saved.job_preferences} jobs"))
+            )
+        except Exception as e:
+            logger.error(f"Error refreshing saved search {search.id}: {e}")
+            continue
+        
+        print(f"\n=== Saved search {search.id}: {search.job_preferences} ===\n")
+        print(summary or "No new or changed postings since the last check.")
+        store.save()
+
+def run_mock_interview(interview_prep_agent, job_description, resume, num_questions=10):
+    """
+    Run an interactive mock interview, reading each answer from the terminal.
+    
+    Entering "quit" as an answer ends the interview early. The prompt size and latency
+    of every model call are printed at the end.
+    
+    Args:
+        interview_prep_agent (InterviewPrepAgent): The agent conducting the interview.
+        job_description (str): The job description.
+        resume (str): The user's resume.
+        num_questions (int): Number of questions to ask. Defaults to 10.
+    """
+    interview_focus = input("What should the mock interview focus on? ") or "the role in the job description"
+    session = interview_prep_agent.start_mock_interview_session(
+        job_description, resume, interview_focus, num_questions
+    )
+    
+    print("\n=== Mock Interview ===\n")
+    print('Answer each question, or enter "quit" to finish early.')
+    while not session.finished:
+        print(f"\nQuestion {session.context.turn_count + 1}: {session.ask_question()}")
+        answer = input("\nYour answer: ")
+        if answer.strip().lower() == "quit":
+            break
+        print(f"\nFeedback:\n{session.submit_answer(answer)}")
+    
+    print(f"\n=== Overall Feedback ===\n\n{session.conclude()}")
+    
+    print("\n=== Turn stats ===\n")
+    for stats in session.turn_stats:
+        print(
+            f"{stats['kind']:<10} turn {stats['turn']:>2}  "
+            f"{stats['prompt_chars']:>6} prompt chars  {stats['latency_seconds']:.2f}s"
+        )
+
+def run_cli(args, stage):
+    """
+    Run the mode selected on the command line.
+    
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+        stage (callable): Returns a context manager wrapping each profiled stage.
+    """
+    if args.save_search:
+        resume = input("Please provide your resume (or path to resume file): ")
+        if os.path.isfile(resume):
+            resume = read_file_content(resume)
+            if resume is None:
+                print("Error reading resume file. Please try again.")
+                return
+        else:
+            resume = compact_text([resume])[0]
+        job_preferences = input("Please describe the jobs you are looking for: ")
+        store = SavedSearchStore(args.saved_searches_path)
+        search = store.add(resume, job_preferences)
+        store.save()
+        print(f"\nSaved search {search.id}. Refresh it with --refresh-saved-searches.")
+        return
+    
+    if args.refresh_saved_searches:
+        crew, _ = build_crew(stage)
+        if crew is not None:
+            with stage("refresh_saved_searches"):
+                refresh_saved_searches(crew, args.saved_searches_path)
+        return
+    
+    if args.worker:
+        crew, _ = build_crew(stage)
+        if crew is None:
+            return
+        worker = Worker(
+            SQLiteJobQueue(args.queue_path, journal_mode=args.queue_journal_mode),
+            handler=lambda payload: run_queued_job(crew, payload),
+            results_dir=os.path.join(os.getenv("OUTPUT_DIR", "./output"), "results")
+        )
+        # Finish the current job on SIGTERM and return normally, so a profiled worker
+        # still writes its profile on shutdown.
+        signal.signal(signal.SIGTERM, lambda signum, frame: worker.stop())
+        with stage("worker"):
+            worker.run()
+        return
+    
+    crew, router = None, None
+    if not args.enqueue:
+        crew, router = build_crew(stage)
+        if crew is None:
+            return
     
     # Simple CLI interface
     print("\n=== Job Seeker AI Assistant ===\n")
@@ -157,24 +559,70 @@ def main():
     
     # If resume is a file path, read the file
     if os.path.isfile(resume):
-        try:
-            with open(resume, 'r') as file:
-                resume = file.read()
-        except Exception as e:
-            logger.error(f"Error reading resume file: {e}")
+        resume = read_file_content(resume)
+        if resume is None:
             print("Error reading resume file. Please try again.")
             return
     
-    # Run the crew with the provided inputs
-    result = crew.kickoff(
-        inputs={
-            "job_description": job_description,
-            "resume": resume
-        }
-    )
+    try:
+        inputs = prepare_inputs({"job_description": job_description, "resume": resume})
+    except ValueError as e:
+        print(f"{e} Please try again.")
+        return
+    job_description, resume = inputs["job_description"], inputs["resume"]
+    
+    if args.enqueue:
+        job_id = SQLiteJobQueue(args.queue_path, journal_mode=args.queue_journal_mode).enqueue(inputs)
+        print(f"\nQueued job {job_id}. A worker will write its result to the results store.")
+        return
     
-    print("\n=== Results ===\n")
-    print(result)
+    if args.mock_interview:
+        with stage("mock_interview"):
+            run_mock_interview(crew.agents[3], job_description, resume, args.mock_interview_questions)
+        return
+    
+    # Run the crew with the provided inputs.
+    try:
+        with stage("crew_kickoff"):
+            if args.budget:
+                pipeline_result = run_stages(
+                    build_stages(
+                        crew.agents, job_description, resume, router,
+                        QuestionBank(os.path.join(os.getenv("OUTPUT_DIR", "./output"), "question_bank.json"))
+                    ),
+                    Deadline(args.budget)
+                )
+                result = format_pipeline_result(pipeline_result, STAGE_TITLES)
+            else:
+                result = crew.kickoff(inputs=inputs)
+        
+        print("\n=== Results ===\n")
+        print(result)
+    finally:
+        logger.info(f"Tool pool metrics: {get_runtime().metrics()}")
+        
+        if router and router.report():
+            print(f"\n=== Model tiers ===\n\n{router.format_report()}")
+
+def main(argv=None):
+    """
+    Main function to run the Job Seeker AI Assistant.
+    
+    With --profile, the profile is written whichever mode runs, even if it fails or is
+    interrupted, since a failing or slow run is the one worth profiling.
+    
+    Args:
+        argv (list): Command-line arguments. Defaults to sys.argv.
+    """
+    args = parse_args(argv)
+    profiler = StageProfiler(args.profile_dir) if args.profile else None
+    
+    try:
+        run_cli(args, profiler.stage if profiler else (lambda name: nullcontext()))
+    finally:
+        if profiler:
+            print(f"\n{profiler.report()}")
+            print(f"\nProfiling output written to {profiler.save()}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
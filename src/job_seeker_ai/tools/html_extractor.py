@@ -0,0 +1,417 @@
+"""
+HTML Extractor - Streaming HTML-to-text extraction for scraped job postings.
+"""
+
+import re
+import json
+import codecs
+import logging
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Set, Union
+
+logger = logging.getLogger(__name__)
+
+# Elements whose content is never text, even when the extractor falls back to the whole page.
+NON_TEXT_TAGS = {"script", "style", "noscript", "template", "svg", "canvas", "iframe"}
+
+# Elements whose content is never part of the posting. Forms are kept: some sites wrap
+# the whole posting in the application form.
+BOILERPLATE_TAGS = NON_TEXT_TAGS | {"nav", "footer", "aside", "button", "select", "dialog"}
+
+# Elements that hold the main content. A container with a boilerplate class or id that
+# encloses one of these is kept, e.g. <body class="has-sidebar">.
+CONTENT_TAGS = {"main", "article", "h1"}
+
+# Elements that end a block of text.
+BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "li", "ul", "ol", "dl", "dt", "dd",
+    "h1", "h2", "h3", "h4", "h5", "h6", "br", "tr", "table", "blockquote", "pre",
+}
+
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "param", "source", "track", "wbr",
+}
+
+# class/id values that mark page chrome rather than content.
+BOILERPLATE_ATTRIBUTE_PATTERN = re.compile(
+    r"(?i)\b(?:nav|navbar|menu|footer|sidebar|breadcrumbs?|cookie|consent|banner|"
+    r"share|social|newsletter|subscribe|related|recommended|advert|ads?|promo|modal|popup)\b"
+)
+
+SALARY_PATTERN = re.compile(
+    r"(?i)(?:[$£€]\s?\d[\d,.]*\s?[kK]?(?:\s?(?:-|–|to)\s?[$£€]?\s?\d[\d,.]*\s?[kK]?)?)"
+    r"(?:\s?(?:per|/|an?)\s?(?:year|yr|annum|hour|hr|month))?"
+)
+
+LOCATION_PATTERN = re.compile(r"(?im)^\s*(?:location|based in|office)\s*[:\-]\s*(.+)$")
+
+# Extracted text shorter than this suggests the heuristics dropped the posting itself.
+MIN_POSTING_CHARS = 200
+
+
+@dataclass
+class ExtractedPosting:
+    """
+    Clean posting text and structured fields extracted from a page.
+
+    Attributes:
+        text (str): The posting content with boilerplate removed.
+        title (Optional[str]): The job title.
+        location (Optional[str]): The job location.
+        salary (Optional[str]): The advertised salary or salary range.
+        input_chars (int): Size of the input HTML.
+        output_chars (int): Size of the extracted text.
+    """
+    text: str
+    title: Optional[str] = None
+    location: Optional[str] = None
+    salary: Optional[str] = None
+    input_chars: int = 0
+    output_chars: int = 0
+
+    @property
+    def reduction(self) -> float:
+        """
+        Fraction of the input removed by extraction.
+        """
+        return 1 - self.output_chars / self.input_chars if self.input_chars else 0.0
+
+    def format(self) -> str:
+        """
+        Format the posting for a prompt, structured fields first.
+
+        Returns:
+            str: The formatted posting.
+        """
+        fields = [
+            f"{label}: {value}"
+            for label, value in (("Title", self.title), ("Location", self.location), ("Salary", self.salary))
+            if value
+        ]
+        return "\n".join(fields + ([""] if fields else []) + [self.text])
+
+
+@dataclass
+class _Block:
+    """
+    Raw text pieces of one block. The parser flushes text at chunk boundaries, so a word
+    can arrive in several pieces; whitespace is only normalized once the block is read.
+    """
+    text: List[str] = field(default_factory=list)
+    link_chars: int = 0
+
+    @property
+    def content(self) -> str:
+        return " ".join("".join(self.text).split())
+
+
+@dataclass
+class _Suspect:
+    """
+    Where the output stood when a container with a boilerplate class or id opened.
+    """
+    blocks: int
+    block_text: int
+    link_chars: int
+    h1: int
+    encloses_content: bool = False
+
+
+class _ContentParser(HTMLParser):
+    """
+    Incremental parser that keeps content text and drops boilerplate subtrees.
+
+    Boilerplate tags are dropped as they are parsed. A container that only looks like
+    boilerplate from its class or id is parsed as normal, and its text is discarded
+    when it closes unless it enclosed a main, article or h1 element.
+    """
+
+    def __init__(
+        self,
+        boilerplate_tags: Set[str] = BOILERPLATE_TAGS,
+        attribute_pattern: Optional[Pattern] = BOILERPLATE_ATTRIBUTE_PATTERN
+    ):
+        super().__init__(convert_charrefs=True)
+        self.boilerplate_tags = boilerplate_tags
+        self.attribute_pattern = attribute_pattern
+        self.stack: List[Optional[_Suspect]] = []
+        self.skipping: List[bool] = []
+        self.suspects: List[_Suspect] = []
+        self.tags: List[str] = []
+        self.skip_depth = 0
+        self.link_depth = 0
+        self.blocks: List[_Block] = [_Block()]
+        self.page_title: List[str] = []
+        self.h1: List[str] = []
+        self.json_ld: List[str] = []
+        self._in_title = False
+        self._in_h1 = False
+        self._in_json_ld = False
+
+    def _end_block(self) -> None:
+        if any(piece.strip() for piece in self.blocks[-1].text):
+            self.blocks.append(_Block())
+
+    def handle_starttag(self, tag: str, attrs: List) -> None:
+        attributes = dict(attrs)
+        if tag == "script" and (attributes.get("type") or "").lower() == "application/ld+json":
+            self._in_json_ld = True
+        if tag == "title":
+            self._in_title = True
+
+        if tag in BLOCK_TAGS:
+            self._end_block()
+        if tag in VOID_TAGS:
+            return
+
+        skip = tag in self.boilerplate_tags
+        suspect = None
+        if not skip and not self.skip_depth and self.attribute_pattern is not None:
+            marker = f"{attributes.get('class') or ''} {attributes.get('id') or ''} {attributes.get('role') or ''}"
+            if self.attribute_pattern.search(marker):
+                block = self.blocks[-1]
+                suspect = _Suspect(len(self.blocks), len(block.text), block.link_chars, len(self.h1))
+                self.suspects.append(suspect)
+        if tag in CONTENT_TAGS and not skip and not self.skip_depth:
+            for enclosing in self.suspects:
+                enclosing.encloses_content = True
+
+        self.stack.append(suspect)
+        self.skipping.append(skip)
+        self.tags.append(tag)
+        if skip:
+            self.skip_depth += 1
+        if tag == "a":
+            self.link_depth += 1
+        if tag == "h1" and not self.skip_depth:
+            self._in_h1 = True
+
+    def _close_suspect(self) -> None:
+        # Containers nest, so the one closing is always the innermost.
+        suspect = self.suspects.pop()
+        if suspect.encloses_content:
+            return
+        # Discard everything the container added.
+        del self.blocks[suspect.blocks:]
+        block = self.blocks[-1]
+        del block.text[suspect.block_text:]
+        block.link_chars = suspect.link_chars
+        del self.h1[suspect.h1:]
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script":
+            self._in_json_ld = False
+        elif tag == "title":
+            self._in_title = False
+        elif tag == "h1":
+            self._in_h1 = False
+
+        if tag in BLOCK_TAGS:
+            self._end_block()
+        if tag not in self.tags:
+            return
+
+        # Close any elements left open inside this one (common in real-world HTML).
+        while self.tags:
+            open_tag = self.tags.pop()
+            if self.skipping.pop():
+                self.skip_depth -= 1
+            if self.stack.pop() is not None:
+                self._close_suspect()
+            if open_tag == "a":
+                self.link_depth -= 1
+            if open_tag == tag:
+                break
+
+    def close(self) -> None:
+        super().close()
+        # Containers left open at the end of the document.
+        while self.suspects:
+            self._close_suspect()
+
+    def handle_data(self, data: str) -> None:
+        if self._in_json_ld:
+            self.json_ld.append(data)
+            return
+        if self._in_title:
+            self.page_title.append(data)
+            return
+        if self.skip_depth:
+            return
+
+        if self._in_h1:
+            self.h1.append(data)
+        block = self.blocks[-1]
+        block.text.append(data)
+        if self.link_depth:
+            block.link_chars += len(data.strip())
+
+
+def _job_posting_from_json_ld(scripts: List[str]) -> Dict[str, Any]:
+    for script in scripts:
+        try:
+            data = json.loads(script)
+        except ValueError:
+            continue
+        candidates = data if isinstance(data, list) else data.get("@graph", [data]) if isinstance(data, dict) else []
+        for candidate in candidates:
+            if isinstance(candidate, dict) and candidate.get("@type") == "JobPosting":
+                return candidate
+    return {}
+
+
+def _location_from_json_ld(posting: Dict[str, Any]) -> Optional[str]:
+    locations = posting.get("jobLocation")
+    if isinstance(locations, dict):
+        locations = [locations]
+    parts = []
+    for location in locations or []:
+        address = location.get("address", {}) if isinstance(location, dict) else {}
+        if isinstance(address, dict):
+            place = ", ".join(
+                str(address[key]) for key in ("addressLocality", "addressRegion", "addressCountry")
+                if isinstance(address.get(key), str)
+            )
+            if place:
+                parts.append(place)
+    if posting.get("jobLocationType") == "TELECOMMUTE":
+        parts.append("Remote")
+    return "; ".join(parts) or None
+
+
+def _salary_from_json_ld(posting: Dict[str, Any]) -> Optional[str]:
+    salary = posting.get("baseSalary")
+    if not isinstance(salary, dict):
+        return None
+    value = salary.get("value", {})
+    currency = salary.get("currency", "")
+    if isinstance(value, dict):
+        low, high = value.get("minValue"), value.get("maxValue")
+        amount = f"{low}-{high}" if low and high else str(value.get("value") or low or high or "")
+        unit = value.get("unitText", "")
+    else:
+        amount, unit = str(value), ""
+    return " ".join(part for part in (currency, amount, f"per {unit.lower()}" if unit else "") if part) or None
+
+
+def extract_posting(
+    chunks: Union[str, bytes, Iterable[Union[str, bytes]]],
+    max_link_density: float = 0.5,
+    min_block_chars: int = 3
+) -> ExtractedPosting:
+    """
+    Extract clean posting text and structured fields from HTML.
+
+    The HTML is fed to the parser chunk by chunk, so a page can be streamed from the
+    network or disk without holding the markup and a parse tree in memory together.
+    Boilerplate elements (scripts, navigation, footers, cookie banners, ...)
+    are dropped while parsing, and link-heavy blocks such as menus are dropped afterwards.
+
+    Args:
+        chunks (Union[str, bytes, Iterable[Union[str, bytes]]]): The page, whole or as chunks.
+            Bytes are decoded incrementally as UTF-8.
+        max_link_density (float): Blocks with a higher share of link text are dropped.
+        min_block_chars (int): Blocks shorter than this are dropped.
+
+    Returns:
+        ExtractedPosting: The extracted posting.
+    """
+    if isinstance(chunks, (str, bytes)):
+        chunks = [chunks]
+
+    parser = _ContentParser()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    input_chars = 0
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        input_chars += len(chunk)
+        parser.feed(chunk)
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+
+    lines, seen = [], set()
+    for block in parser.blocks:
+        text = block.content
+        if len(text) < min_block_chars or block.link_chars / len(text) > max_link_density:
+            continue
+        if text in seen:
+            continue
+        seen.add(text)
+        lines.append(text)
+    text = "\n".join(lines)
+
+    json_ld = _job_posting_from_json_ld(parser.json_ld)
+    title = json_ld.get("title") or " ".join("".join(parser.h1).split()) or None
+    if not title and parser.page_title:
+        title = re.split(r"\s[|\-–]\s", " ".join("".join(parser.page_title).split()))[0] or None
+
+    location = _location_from_json_ld(json_ld)
+    if not location:
+        match = LOCATION_PATTERN.search(text)
+        location = match.group(1).strip() if match else None
+
+    salary = _salary_from_json_ld(json_ld)
+    if not salary:
+        match = SALARY_PATTERN.search(text)
+        salary = match.group(0).strip() if match else None
+
+    return ExtractedPosting(
+        text=text,
+        title=title,
+        location=location,
+        salary=salary,
+        input_chars=input_chars,
+        output_chars=len(text)
+    )
+
+
+def page_text(html: str) -> str:
+    """
+    Get all the text of a page, dropping only scripts, styles and other non-text elements.
+
+    Args:
+        html (str): The page.
+
+    Returns:
+        str: The text, one block per line.
+    """
+    parser = _ContentParser(boilerplate_tags=NON_TEXT_TAGS, attribute_pattern=None)
+    parser.feed(html)
+    parser.close()
+    return "\n".join(block.content for block in parser.blocks if block.content)
+
+
+def clean_scraped_page(output: Any, min_chars: int = MIN_POSTING_CHARS) -> Any:
+    """
+    Replace scraped HTML with its extracted posting text. Other output is returned unchanged.
+
+    If extraction leaves less than min_chars characters the heuristics have probably
+    dropped the posting, so the page's full text is returned instead.
+
+    Args:
+        output (Any): The scraper output.
+        min_chars (int): Shortest extracted text that is trusted.
+
+    Returns:
+        Any: The formatted posting, or the original output if it is not HTML.
+    """
+    if not isinstance(output, str) or not re.search(r"<(?:html|body|div|p)\b", output[:5000], re.IGNORECASE):
+        return output
+
+    posting = extract_posting(output)
+    if posting.output_chars < min_chars:
+        text = page_text(output)
+        if len(text) > posting.output_chars:
+            logger.warning(
+                f"Extracted posting text is only {posting.output_chars} chars; using the full page text"
+            )
+            return text
+
+    logger.info(
+        f"Extracted posting text: {posting.input_chars} -> {posting.output_chars} chars "
+        f"({posting.reduction:.0%} smaller)"
+    )
+    return posting.format()
@@ -6,6 +6,8 @@ import re
 from typing import Dict, Any, Optional
 from langchain.tools import BaseTool
 
+from job_seeker_ai.tools.runtime import CPU, get_runtime
+
 
 class ResumeParser(BaseTool):
     """
@@ -143,10 +145,26 @@ class ResumeParser(BaseTool):
         """
         Async version of _run.
         
+        Parsing is regex-heavy, so it runs on the shared tool runtime's process pool
+        instead of blocking the event loop.
+        
         Args:
             text (str): The resume text to parse.
             
         Returns:
             Dict[str, Any]: Extracted information from the resume.
         """
-        return self._run(text) 
\ No newline at end of file
+        return await get_runtime().arun(CPU, self.name, parse_resume, text)
+
+
+def parse_resume(text: str) -> Dict[str, Any]:
+    """
+    Parse a resume text. Module-level so it can be sent to a worker process.
+    
+    Args:
+        text (str): The resume text to parse.
+        
+    Returns:
+        Dict[str, Any]: Extracted information from the resume.
+    """
+    return ResumeParser()._run(text) 
\ No newline at end of file
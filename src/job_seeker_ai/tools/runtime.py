@@ -0,0 +1,330 @@
+"""
+Tool Runtime - Shared, bounded executors for running tools off the caller's thread.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+from langchain.tools import BaseTool
+
+logger = logging.getLogger(__name__)
+
+CPU = "cpu"
+IO = "io"
+
+
+class ToolBackpressureError(RuntimeError):
+    """
+    Raised when a tool pool's queue is full and the call cannot be admitted.
+    """
+
+
+class ToolTimeoutError(TimeoutError):
+    """
+    Raised when a tool call does not finish within its timeout.
+    """
+
+
+class _Pool:
+    """
+    An executor with an admission limit and usage counters.
+    """
+
+    def __init__(self, kind: str, executor: Executor, workers: int, max_queue_depth: int):
+        self.kind = kind
+        self.executor = executor
+        self.workers = workers
+        self.max_queue_depth = max_queue_depth
+        self.slots = threading.BoundedSemaphore(workers + max_queue_depth)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.rejected = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "workers": self.workers,
+                "in_flight": self.in_flight,
+                "queued": max(0, self.in_flight - self.workers),
+                "utilization": min(self.in_flight, self.workers) / self.workers,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "timed_out": self.timed_out,
+                "rejected": self.rejected,
+            }
+
+
+class ToolRuntime:
+    """
+    Dispatches tool calls to a process pool (CPU-bound tools) or a bounded thread pool
+    (I/O-bound tools).
+
+    Each pool admits at most ``workers + max_queue_depth`` calls at a time. Callers wait
+    up to ``admission_timeout`` for a slot and then get a ToolBackpressureError, so one
+    busy crew cannot queue unbounded work in front of the others. Every call has a timeout,
+    taken from ``tool_timeouts`` by tool name or from ``default_timeout``.
+    """
+
+    def __init__(
+        self,
+        cpu_workers: Optional[int] = None,
+        io_workers: int = 8,
+        max_queue_depth: int = 32,
+        default_timeout: float = 60.0,
+        admission_timeout: float = 5.0,
+        tool_timeouts: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize the tool runtime.
+
+        Args:
+            cpu_workers (Optional[int]): Process pool size. Defaults to the CPU count.
+            io_workers (int): Thread pool size for I/O-bound tools.
+            max_queue_depth (int): Calls allowed to wait per pool beyond the running ones.
+            default_timeout (float): Seconds a call may take when the tool has no specific timeout.
+            admission_timeout (float): Seconds to wait for a pool slot before rejecting a call.
+            tool_timeouts (Optional[Dict[str, float]]): Tool name -> timeout in seconds.
+        """
+        self.cpu_workers = cpu_workers or os.cpu_count() or 1
+        self.io_workers = io_workers
+        self.max_queue_depth = max_queue_depth
+        self.default_timeout = default_timeout
+        self.admission_timeout = admission_timeout
+        self.tool_timeouts = dict(tool_timeouts or {})
+        self._pools: Dict[str, _Pool] = {}
+        self._pools_lock = threading.Lock()
+
+    def _pool(self, kind: str) -> _Pool:
+        with self._pools_lock:
+            if kind not in self._pools:
+                if kind == CPU:
+                    try:
+                        executor = ProcessPoolExecutor(max_workers=self.cpu_workers)
+                    except (OSError, NotImplementedError) as e:
+                        logger.warning(f"Process pool unavailable, running CPU-bound tools on threads: {e}")
+                        executor = ThreadPoolExecutor(max_workers=self.cpu_workers, thread_name_prefix="tool-cpu")
+                    self._pools[kind] = _Pool(kind, executor, self.cpu_workers, self.max_queue_depth)
+                elif kind == IO:
+                    executor = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="tool-io")
+                    self._pools[kind] = _Pool(kind, executor, self.io_workers, self.max_queue_depth)
+                else:
+                    raise ValueError(f"Unknown tool pool: {kind}")
+            return self._pools[kind]
+
+    def timeout_for(self, tool_name: str) -> float:
+        """
+        Get the timeout for a tool.
+
+        Args:
+            tool_name (str): The tool name.
+
+        Returns:
+            float: The timeout in seconds.
+        """
+        return self.tool_timeouts.get(tool_name, self.default_timeout)
+
+    def submit(self, kind: str, tool_name: str, func: Callable, *args, **kwargs) -> Future:
+        """
+        Submit a tool call to a pool.
+
+        Args:
+            kind (str): CPU or IO.
+            tool_name (str): The tool name, used for logging and timeouts.
+            func (Callable): The function to run. Must be picklable for CPU calls.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            Future: The pending result.
+
+        Raises:
+            ToolBackpressureError: If the pool stays full for longer than the admission timeout.
+        """
+        pool = self._pool(kind)
+        if not pool.slots.acquire(timeout=self.admission_timeout):
+            with pool.lock:
+                pool.rejected += 1
+            raise ToolBackpressureError(f"{kind} tool pool is full, rejected call to {tool_name}")
+
+        with pool.lock:
+            pool.in_flight += 1
+            pool.submitted += 1
+
+        def on_done(future: Future) -> None:
+            with pool.lock:
+                pool.in_flight -= 1
+                if future.cancelled() or future.exception() is not None:
+                    pool.failed += 1
+                else:
+                    pool.completed += 1
+            pool.slots.release()
+
+        try:
+            future = pool.executor.submit(func, *args, **kwargs)
+        except Exception:
+            with pool.lock:
+                pool.in_flight -= 1
+                pool.failed += 1
+            pool.slots.release()
+            raise
+
+        future.add_done_callback(on_done)
+        return future
+
+    def _timed_out(self, kind: str, tool_name: str, timeout: float, future: Future) -> ToolTimeoutError:
+        future.cancel()
+        pool = self._pool(kind)
+        with pool.lock:
+            pool.timed_out += 1
+        logger.warning(f"Tool {tool_name} timed out after {timeout}s")
+        return ToolTimeoutError(f"Tool {tool_name} timed out after {timeout}s")
+
+    def run(self, kind: str, tool_name: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a tool call in a pool and wait for its result.
+
+        Args:
+            kind (str): CPU or IO.
+            tool_name (str): The tool name, used for logging and timeouts.
+            func (Callable): The function to run.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            Any: The result of ``func``.
+
+        Raises:
+            ToolBackpressureError: If the pool is full.
+            ToolTimeoutError: If the call does not finish in time.
+        """
+        timeout = self.timeout_for(tool_name)
+        future = self.submit(kind, tool_name, func, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise self._timed_out(kind, tool_name, timeout, future)
+
+    async def arun(self, kind: str, tool_name: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Async version of run that does not block the event loop.
+
+        Args:
+            kind (str): CPU or IO.
+            tool_name (str): The tool name, used for logging and timeouts.
+            func (Callable): The function to run.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            Any: The result of ``func``.
+        """
+        timeout = self.timeout_for(tool_name)
+        loop = asyncio.get_running_loop()
+        # Admission may wait for a slot, so it runs off the event loop as well.
+        future = await loop.run_in_executor(None, lambda: self.submit(kind, tool_name, func, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise self._timed_out(kind, tool_name, timeout, future)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get utilization and counters for each pool that has been used.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Pool kind -> metrics.
+        """
+        with self._pools_lock:
+            pools = list(self._pools.values())
+        return {pool.kind: pool.metrics() for pool in pools}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down all pools.
+
+        Args:
+            wait (bool): Whether to wait for running calls to finish.
+        """
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.executor.shutdown(wait=wait)
+
+
+_runtime: Optional[ToolRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> ToolRuntime:
+    """
+    Get the process-wide tool runtime shared by all crews.
+
+    Returns:
+        ToolRuntime: The shared runtime, created on first use.
+    """
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = ToolRuntime()
+        return _runtime
+
+
+class RuntimeTool(BaseTool):
+    """
+    Wraps a blocking I/O-bound tool so its calls go through the shared tool runtime.
+    """
+
+    name: str = ""
+    description: str = ""
+    tool: Any = None
+    postprocess: Any = None
+
+    def __init__(self, tool: Any, postprocess: Optional[Callable[[Any], Any]] = None, **kwargs):
+        """
+        Initialize the wrapper.
+
+        Args:
+            tool (Any): The tool to wrap, e.g. SerperDevAPI or WebScraper.
+            postprocess (Optional[Callable[[Any], Any]]): Applied to the tool output before it
+                reaches the agent. Defaults to None.
+        """
+        super().__init__(
+            name=getattr(tool, "name", type(tool).__name__),
+            description=getattr(tool, "description", ""),
+            tool=tool,
+            postprocess=postprocess,
+            **kwargs
+        )
+
+    def _call(self, tool_input: Any) -> Any:
+        output = self.tool.run(tool_input)
+        return self.postprocess(output) if self.postprocess else output
+
+    def _run(self, *args, **kwargs) -> Any:
+        """
+        Run the wrapped tool on the I/O pool.
+
+        Returns:
+            Any: The wrapped tool's output.
+        """
+        tool_input = kwargs if kwargs else (args[0] if args else "")
+        return get_runtime().run(IO, self.name, self._call, tool_input)
+
+    async def _arun(self, *args, **kwargs) -> Any:
+        """
+        Async version of _run.
+
+        Returns:
+            Any: The wrapped tool's output.
+        """
+        tool_input = kwargs if kwargs else (args[0] if args else "")
+        return await get_runtime().arun(IO, self.name, self._call, tool_input)
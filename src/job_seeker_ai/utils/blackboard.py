@@ -0,0 +1,345 @@
+"""
+Blackboard - Structured analysis of a run's job description and resume, shared between agents.
+"""
+
+import re
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from job_seeker_ai.tools.resume_parser import parse_resume
+from job_seeker_ai.utils.skills import canonicalize_skill, extract_role_title, extract_skills, normalize_role
+
+logger = logging.getLogger(__name__)
+
+# Headings after which the skills in a job description are nice-to-have rather than required.
+PREFERRED_SECTION_PATTERN = re.compile(
+    r"(?im)^\s*(?:preferred|nice[\s-]to[\s-]have|bonus(?: points)?|pluses|desired)\b.*$"
+)
+
+YEARS_PATTERN = re.compile(r"(?i)\b(\d{1,2})\+?\s*(?:-\s*\d{1,2}\s*)?(?:years?|yrs?)\b")
+
+
+def _years(text: str, pick: Any) -> Optional[int]:
+    years = [int(match) for match in YEARS_PATTERN.findall(text)]
+    return pick(years) if years else None
+
+
+def _strings(value: Any) -> List[str]:
+    if not isinstance(value, list):
+        return []
+    return [" ".join(str(item).split()) for item in value if str(item).strip()]
+
+
+def _skills(value: Any) -> List[str]:
+    skills = []
+    for skill in map(canonicalize_skill, _strings(value)):
+        if skill not in skills:
+            skills.append(skill)
+    return skills
+
+
+def _integer(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_extraction(output: str) -> Dict[str, Any]:
+    """
+    Parse the JSON object returned by the requirements extraction call.
+
+    Args:
+        output (str): The model output, possibly with prose or a code fence around the object.
+
+    Returns:
+        Dict[str, Any]: The parsed object.
+
+    Raises:
+        ValueError: If the output holds no JSON object.
+    """
+    start, end = output.find("{"), output.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError("Requirements extraction returned no JSON object")
+    data = json.loads(output[start:end + 1])
+    if not isinstance(data, dict):
+        raise ValueError("Requirements extraction did not return a JSON object")
+    return data
+
+
+@dataclass(frozen=True)
+class JobRequirements:
+    """
+    What a job description asks for.
+
+    Attributes:
+        title (Optional[str]): The job title.
+        role (Optional[str]): The normalized role, e.g. "backend engineer".
+        required_skills (List[str]): Canonical skills from the required part of the description.
+        preferred_skills (List[str]): Canonical skills listed only as nice-to-have.
+        min_years_experience (Optional[int]): The lowest experience requirement mentioned.
+        qualifications (List[str]): Required degrees, licenses and certifications.
+        responsibilities (List[str]): The main duties of the role.
+    """
+    title: Optional[str] = None
+    role: Optional[str] = None
+    required_skills: List[str] = field(default_factory=list)
+    preferred_skills: List[str] = field(default_factory=list)
+    min_years_experience: Optional[int] = None
+    qualifications: List[str] = field(default_factory=list)
+    responsibilities: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_job_description(cls, job_description: str) -> "JobRequirements":
+        """
+        Extract the requirements from a job description.
+
+        Args:
+            job_description (str): The job description.
+
+        Returns:
+            JobRequirements: The requirements.
+        """
+        match = PREFERRED_SECTION_PATTERN.search(job_description)
+        required_text = job_description[:match.start()] if match else job_description
+        preferred_text = job_description[match.start():] if match else ""
+
+        required_skills = extract_skills(required_text)
+        title = extract_role_title(job_description)
+        return cls(
+            title=title,
+            role=normalize_role(title) if title else None,
+            required_skills=required_skills,
+            preferred_skills=[skill for skill in extract_skills(preferred_text) if skill not in required_skills],
+            min_years_experience=_years(required_text, min)
+        )
+
+    @classmethod
+    def from_extraction(cls, data: Dict[str, Any]) -> "JobRequirements":
+        """
+        Build the requirements from a parsed extraction.
+
+        Args:
+            data (Dict[str, Any]): The object returned by the extraction call.
+
+        Returns:
+            JobRequirements: The requirements.
+        """
+        title = " ".join(str(data.get("title") or "").split()) or None
+        required_skills = _skills(data.get("required_skills"))
+        return cls(
+            title=title,
+            role=normalize_role(title) if title else None,
+            required_skills=required_skills,
+            preferred_skills=[skill for skill in _skills(data.get("preferred_skills")) if skill not in required_skills],
+            min_years_experience=_integer(data.get("min_years_experience")),
+            qualifications=_strings(data.get("qualifications")),
+            responsibilities=_strings(data.get("responsibilities"))
+        )
+
+
+@dataclass(frozen=True)
+class CandidateProfile:
+    """
+    What a resume shows about the candidate.
+
+    Attributes:
+        skills (List[str]): Canonical skills found anywhere in the resume.
+        education (List[str]): Education entries.
+        experience_entries (int): Number of entries in the experience section.
+        years_experience (Optional[int]): The most years of experience the resume claims.
+        relevant_experience (List[str]): The candidate's experience most relevant to the job.
+    """
+    skills: List[str] = field(default_factory=list)
+    education: List[str] = field(default_factory=list)
+    experience_entries: int = 0
+    years_experience: Optional[int] = None
+    relevant_experience: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_resume(cls, resume: str, parsed_resume: Optional[Dict[str, Any]] = None) -> "CandidateProfile":
+        """
+        Extract the candidate profile from a resume.
+
+        Args:
+            resume (str): The resume.
+            parsed_resume (Optional[Dict[str, Any]]): Output of the resume parser, if already available.
+
+        Returns:
+            CandidateProfile: The profile.
+        """
+        parsed_resume = parsed_resume if parsed_resume is not None else parse_resume(resume)
+        skills = extract_skills(resume)
+        # Listed skills the alias table does not know are kept as written.
+        skills += [
+            skill.lower() for skill in parsed_resume.get("skills", [])
+            if not extract_skills(skill) and skill.lower() not in skills
+        ]
+        return cls(
+            skills=skills,
+            education=list(parsed_resume.get("education", [])),
+            experience_entries=len(parsed_resume.get("experience", [])),
+            years_experience=_years(resume, max)
+        )
+
+    @classmethod
+    def from_extraction(cls, data: Dict[str, Any]) -> "CandidateProfile":
+        """
+        Build the profile from a parsed extraction.
+
+        Args:
+            data (Dict[str, Any]): The object returned by the extraction call.
+
+        Returns:
+            CandidateProfile: The profile.
+        """
+        relevant_experience = _strings(data.get("candidate_experience"))
+        return cls(
+            skills=_skills(data.get("candidate_skills")),
+            education=_strings(data.get("candidate_education")),
+            experience_entries=len(relevant_experience),
+            years_experience=_integer(data.get("candidate_years_experience")),
+            relevant_experience=relevant_experience
+        )
+
+
+@dataclass(frozen=True)
+class Blackboard:
+    """
+    Per-run analysis of the job description and resume, built once and rendered into
+    the prompts of every agent in the run so none of them has to re-derive it.
+
+    The analysis comes from one structured extraction call per run, which covers the
+    whole job description and resume, so agents can use it in place of either. When no
+    extraction is available it is built from keyword matching instead; that only finds
+    known technical skills, so it is offered as hints next to the full inputs.
+
+    Attributes:
+        job_requirements (JobRequirements): What the job asks for.
+        candidate_profile (CandidateProfile): What the candidate brings.
+        matched_skills (List[str]): Required and preferred skills the candidate has.
+        missing_skills (List[str]): Required skills and qualifications the candidate lacks.
+        missing_preferred_skills (List[str]): Preferred skills the candidate lacks.
+        extracted (bool): Whether the analysis came from the extraction call.
+    """
+    job_requirements: JobRequirements
+    candidate_profile: CandidateProfile
+    matched_skills: List[str] = field(default_factory=list)
+    missing_skills: List[str] = field(default_factory=list)
+    missing_preferred_skills: List[str] = field(default_factory=list)
+    extracted: bool = False
+
+    @classmethod
+    def build(cls, job_description: str, resume: str, parsed_resume: Optional[Dict[str, Any]] = None) -> "Blackboard":
+        """
+        Analyze a job description and resume by keyword matching.
+
+        Args:
+            job_description (str): The job description.
+            resume (str): The resume.
+            parsed_resume (Optional[Dict[str, Any]]): Output of the resume parser, if already available.
+
+        Returns:
+            Blackboard: The keyword analysis for the run.
+        """
+        requirements = JobRequirements.from_job_description(job_description)
+        profile = CandidateProfile.from_resume(resume, parsed_resume)
+        candidate_skills = set(profile.skills)
+        blackboard = cls(
+            requirements,
+            profile,
+            matched_skills=[
+                skill for skill in requirements.required_skills + requirements.preferred_skills
+                if skill in candidate_skills
+            ],
+            missing_skills=[skill for skill in requirements.required_skills if skill not in candidate_skills],
+            missing_preferred_skills=[skill for skill in requirements.preferred_skills if skill not in candidate_skills]
+        )
+        blackboard._log()
+        return blackboard
+
+    @classmethod
+    def from_extraction(cls, output: str) -> "Blackboard":
+        """
+        Build the analysis from the output of the requirements extraction call.
+
+        Args:
+            output (str): The model output, a JSON object as requested by the extraction prompt.
+
+        Returns:
+            Blackboard: The extracted analysis for the run.
+
+        Raises:
+            ValueError: If the output is not a JSON object.
+        """
+        data = parse_extraction(output)
+        blackboard = cls(
+            JobRequirements.from_extraction(data),
+            CandidateProfile.from_extraction(data),
+            matched_skills=_skills(data.get("matched_skills")),
+            missing_skills=_strings(data.get("missing_skills")),
+            missing_preferred_skills=_strings(data.get("missing_preferred_skills")),
+            extracted=True
+        )
+        blackboard._log()
+        return blackboard
+
+    def _log(self) -> None:
+        logger.info(
+            f"Blackboard ({'extracted' if self.extracted else 'keywords'}): "
+            f"{len(self.job_requirements.required_skills)} required skills, "
+            f"{len(self.matched_skills)} matched, {len(self.missing_skills)} missing"
+        )
+
+    def render(self) -> str:
+        """
+        Format the analysis for a prompt.
+
+        Returns:
+            str: The analysis, one fact per line.
+        """
+        requirements, profile = self.job_requirements, self.candidate_profile
+
+        def listed(items: List[str]) -> str:
+            return ", ".join(items) or "none identified"
+
+        def years(value: Optional[int]) -> str:
+            return f"{value}+ years" if value is not None else "not stated"
+
+        role = requirements.title or "not stated"
+        if requirements.role and requirements.role != (requirements.title or "").lower():
+            role += f" ({requirements.role})"
+
+        lines = []
+        if not self.extracted:
+            lines.append(
+                "        Keyword hints (only known technical skills are detected; "
+                "rely on the full job description and resume for everything else)"
+            )
+        lines += [
+            f"        Target role: {role}",
+            f"        Required skills: {listed(requirements.required_skills)}",
+            f"        Preferred skills: {listed(requirements.preferred_skills)}",
+        ]
+        if self.extracted:
+            lines += [
+                f"        Required qualifications: {listed(requirements.qualifications)}",
+                f"        Responsibilities: {'; '.join(requirements.responsibilities) or 'none identified'}",
+            ]
+        lines += [
+            f"        Required experience: {years(requirements.min_years_experience)}",
+            f"        Candidate skills: {listed(profile.skills)}",
+            f"        Candidate experience: {years(profile.years_experience)} "
+            f"(experience section entries: {profile.experience_entries})",
+        ]
+        if profile.relevant_experience:
+            lines.append(f"        Candidate relevant experience: {'; '.join(profile.relevant_experience)}")
+        lines += [
+            f"        Candidate education: {'; '.join(profile.education) or 'not listed'}",
+            f"        Matching skills (strengths): {listed(self.matched_skills)}",
+            f"        Missing required skills (gaps): {listed(self.missing_skills)}",
+            f"        Missing preferred skills: {listed(self.missing_preferred_skills)}",
+        ]
+        return "\n".join(lines)
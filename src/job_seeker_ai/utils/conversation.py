@@ -0,0 +1,122 @@
+"""
+Rolling conversation context for multi-turn agent sessions.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List
+
+
+def truncate(text: str, max_chars: int) -> str:
+    """
+    Shorten text to at most ``max_chars`` characters, marking the cut.
+
+    Args:
+        text (str): The text to shorten.
+        max_chars (int): The maximum length.
+
+    Returns:
+        str: The text, truncated with an ellipsis if it was too long.
+    """
+    text = " ".join(text.split())
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars - 3].rstrip() + "..."
+
+
+def first_sentence(text: str) -> str:
+    """
+    Return the first sentence of a block of text.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        str: Everything up to and including the first sentence terminator.
+    """
+    match = re.search(r"^.+?[.!?](?=\s|$)", " ".join(text.split()))
+    return match.group(0) if match else " ".join(text.split())
+
+
+@dataclass
+class Turn:
+    """
+    A single question, answer and feedback exchange.
+    """
+    question: str
+    answer: str
+    feedback: str
+
+
+class RollingContext:
+    """
+    Conversation history compacted into a rolling summary plus the most recent turns.
+
+    The most recent turns are kept verbatim (truncated per field). Older turns are folded
+    into one-line digests, and the oldest digests are dropped once the summary exceeds its
+    budget, so the rendered context stays the same size however long the session runs.
+    """
+
+    def __init__(self, max_recent_turns: int = 2, max_summary_chars: int = 1200, max_field_chars: int = 800):
+        """
+        Initialize the rolling context.
+
+        Args:
+            max_recent_turns (int): Number of turns kept verbatim.
+            max_summary_chars (int): Character budget for the rolling summary.
+            max_field_chars (int): Character budget for each field of a verbatim turn.
+        """
+        self.max_recent_turns = max_recent_turns
+        self.max_summary_chars = max_summary_chars
+        self.max_field_chars = max_field_chars
+        self.recent: List[Turn] = []
+        self.digests: List[str] = []
+        self.dropped_turns = 0
+        self.turn_count = 0
+
+    def add_turn(self, question: str, answer: str, feedback: str) -> None:
+        """
+        Record a completed turn, compacting older turns as needed.
+
+        Args:
+            question (str): The question asked.
+            answer (str): The user's answer.
+            feedback (str): The feedback given.
+        """
+        self.recent.append(Turn(
+            truncate(question, self.max_field_chars),
+            truncate(answer, self.max_field_chars),
+            truncate(feedback, self.max_field_chars)
+        ))
+        self.turn_count += 1
+
+        while len(self.recent) > self.max_recent_turns:
+            self.digests.append(self._digest(self.recent.pop(0)))
+
+        while self.digests and sum(len(digest) + 1 for digest in self.digests) > self.max_summary_chars:
+            self.digests.pop(0)
+            self.dropped_turns += 1
+
+    def _digest(self, turn: Turn) -> str:
+        return f"- Q: {truncate(turn.question, 120)} | Feedback: {truncate(first_sentence(turn.feedback), 160)}"
+
+    def render(self) -> str:
+        """
+        Render the context for inclusion in a prompt.
+
+        Returns:
+            str: The rolling summary followed by the recent turns.
+        """
+        sections = []
+        if self.digests or self.dropped_turns:
+            summary = list(self.digests)
+            if self.dropped_turns:
+                summary.insert(0, f"- ({self.dropped_turns} earlier questions already covered)")
+            sections.append("Earlier in the session:\n" + "\n".join(summary))
+
+        for turn in self.recent:
+            sections.append(
+                f"Question: {turn.question}\nAnswer: {turn.answer}\nFeedback: {turn.feedback}"
+            )
+
+        return "\n\n".join(sections) if sections else "(no questions asked yet)"
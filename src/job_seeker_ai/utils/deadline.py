@@ -0,0 +1,201 @@
+"""
+Deadline-aware execution of agent stages under a request-level latency budget.
+"""
+
+import time
+import logging
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StageCancelled(Exception):
+    """
+    Raised by a stage that stops early because it was abandoned.
+    """
+
+
+def check_cancelled(cancel: threading.Event) -> None:
+    """
+    Stop a stage that has been abandoned. Stages call this between steps.
+
+    Args:
+        cancel (threading.Event): The event passed to the stage.
+
+    Raises:
+        StageCancelled: If the event is set.
+    """
+    if cancel.is_set():
+        raise StageCancelled("stage was abandoned")
+
+
+class Deadline:
+    """
+    A latency budget that counts down from creation.
+    """
+
+    def __init__(self, budget_seconds: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the deadline.
+
+        Args:
+            budget_seconds (float): Total time available.
+            clock (Callable[[], float]): Monotonic clock. Defaults to time.monotonic.
+        """
+        self.budget_seconds = budget_seconds
+        self._clock = clock
+        self._expires = clock() + budget_seconds
+
+    def remaining(self) -> float:
+        """
+        Seconds left before the deadline, never negative.
+        """
+        return max(0.0, self._expires - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        """
+        Whether the budget is used up.
+        """
+        return self.remaining() <= 0
+
+
+@dataclass
+class Stage:
+    """
+    One agent step of a pipeline.
+
+    Attributes:
+        name (str): The stage name, used as the key of its output.
+        run (Callable[[bool, threading.Event], str]): Runs the stage. Receives True when it should take
+            its cheaper path, and an event that is set if the stage is abandoned. Long stages should
+            check the event between steps (see check_cancelled) so an abandoned stage stops early.
+        weight (float): Share of the remaining budget relative to the stages still to run.
+        degrade_below (float): Take the cheaper path when the stage's time share is below this many seconds.
+    """
+    name: str
+    run: Callable[[bool, threading.Event], str]
+    weight: float = 1.0
+    degrade_below: float = 0.0
+
+
+@dataclass
+class PipelineResult:
+    """
+    Outputs of a deadline-bounded pipeline.
+
+    Attributes:
+        outputs (Dict[str, str]): Stage name -> output, for stages that completed.
+        timed_out (List[str]): Stages abandoned when their time share ran out.
+        skipped (List[str]): Stages not started because the budget was used up.
+        failed (Dict[str, str]): Stage name -> error message.
+        degraded (List[str]): Stages that ran their cheaper path.
+        elapsed_seconds (float): Total wall-clock time.
+    """
+    outputs: Dict[str, str] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    degraded: List[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def partial(self) -> bool:
+        """
+        Whether any stage is missing from the outputs.
+        """
+        return bool(self.timed_out or self.skipped or self.failed)
+
+
+def _run_in_thread(stage: Stage, degraded: bool, cancel: threading.Event) -> Future:
+    future: Future = Future()
+
+    def target() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(stage.run(degraded, cancel))
+        except BaseException as e:
+            future.set_exception(e)
+
+    # Daemon thread, so an abandoned stage cannot keep the process alive.
+    threading.Thread(target=target, name=f"stage-{stage.name}", daemon=True).start()
+    return future
+
+
+def run_stages(stages: List[Stage], deadline: Deadline) -> PipelineResult:
+    """
+    Run stages in order, giving each a timeout carved from the remaining budget.
+
+    A stage's timeout is its weight's share of the time left across the stages still to
+    run, so time saved by a fast stage flows to the later ones. A stage that overruns is
+    abandoned: its cancel event is set, its output is discarded and the pipeline moves on.
+    Python threads cannot be interrupted, so an abandoned stage keeps running until it
+    next checks its event.
+
+    Args:
+        stages (List[Stage]): The stages to run.
+        deadline (Deadline): The request-level budget.
+
+    Returns:
+        PipelineResult: The completed outputs, marked partial if any stage is missing.
+    """
+    started = time.monotonic()
+    result = PipelineResult()
+
+    for index, stage in enumerate(stages):
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            result.skipped.extend(pending.name for pending in stages[index:])
+            break
+
+        remaining_weight = sum(pending.weight for pending in stages[index:]) or 1.0
+        timeout = remaining * stage.weight / remaining_weight
+        degraded = timeout < stage.degrade_below
+        if degraded:
+            result.degraded.append(stage.name)
+            logger.info(f"Stage {stage.name} has {timeout:.1f}s, taking its cheaper path")
+
+        cancel = threading.Event()
+        future = _run_in_thread(stage, degraded, cancel)
+        try:
+            result.outputs[stage.name] = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            cancel.set()
+            result.timed_out.append(stage.name)
+            logger.warning(f"Stage {stage.name} exceeded its {timeout:.1f}s budget")
+        except Exception as e:
+            result.failed[stage.name] = str(e)
+            logger.error(f"Stage {stage.name} failed: {e}")
+
+    result.elapsed_seconds = time.monotonic() - started
+    return result
+
+
+def format_pipeline_result(result: PipelineResult, titles: Optional[Dict[str, str]] = None) -> str:
+    """
+    Format pipeline outputs for display, noting any missing stages.
+
+    Args:
+        result (PipelineResult): The pipeline result.
+        titles (Optional[Dict[str, str]]): Stage name -> display title. Defaults to the stage names.
+
+    Returns:
+        str: The formatted result.
+    """
+    titles = titles or {}
+    sections = [
+        f"--- {titles.get(name, name)} ---\n{output}"
+        for name, output in result.outputs.items()
+    ]
+    if result.partial:
+        missing = result.timed_out + result.skipped + list(result.failed)
+        sections.append(
+            f"[Partial result after {result.elapsed_seconds:.1f}s: "
+            f"{', '.join(titles.get(name, name) for name in missing)} did not complete]"
+        )
+    return "\n\n".join(sections)
@@ -0,0 +1,268 @@
+"""
+Near-duplicate detection for job postings using MinHash signatures and an LSH index.
+"""
+
+import os
+import re
+import json
+import random
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Mersenne prime larger than any 32-bit shingle hash.
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _hash32(value: str) -> int:
+    """
+    Hash a string to 32 bits, stable across processes (unlike the built-in hash()).
+    """
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=4).digest(), "big")
+
+
+def posting_fingerprint(text: str) -> str:
+    """
+    Compute an exact fingerprint of a posting's normalized text.
+
+    Args:
+        text (str): The posting text.
+
+    Returns:
+        str: A hex digest that ignores case and whitespace differences.
+    """
+    normalized = " ".join(text.lower().split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class DedupResult:
+    """
+    Outcome of deduplicating a batch of postings.
+
+    Attributes:
+        unique (List[str]): Postings not seen before, one per near-duplicate group.
+        duplicates (Dict[int, int]): Batch index -> batch index of the kept posting it duplicates.
+        previously_seen (List[int]): Batch indexes of postings that match one indexed in an earlier run.
+    """
+    unique: List[str] = field(default_factory=list)
+    duplicates: Dict[int, int] = field(default_factory=dict)
+    previously_seen: List[int] = field(default_factory=list)
+
+
+class PostingDeduplicator:
+    """
+    Collapses near-duplicate job postings, such as the same job cross-posted to several boards.
+
+    Each posting is reduced to a MinHash signature over word shingles. Signatures are split
+    into bands and bucketed, so a lookup only compares against postings that share at least
+    one band instead of the whole index. The index can be persisted to a JSON file so postings
+    from earlier runs are recognized.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 3,
+        threshold: float = 0.8,
+        seed: int = 1
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            path (Optional[str]): JSON file the index is persisted to. Defaults to None (in memory only).
+            num_perm (int): Number of MinHash permutations. Must be divisible by ``bands``.
+            bands (int): Number of LSH bands.
+            shingle_size (int): Number of words per shingle.
+            threshold (float): Minimum estimated Jaccard similarity to count as a duplicate.
+            seed (int): Seed for the permutation coefficients.
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.path = path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.seed = seed
+
+        rng = random.Random(seed)
+        self._coefficients = [
+            (rng.randint(1, _PRIME - 1), rng.randint(0, _PRIME - 1))
+            for _ in range(num_perm)
+        ]
+        self._signatures: Dict[str, List[int]] = {}
+        self._buckets: Dict[str, List[str]] = {}
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _shingles(self, text: str) -> Set[int]:
+        words = re.findall(r"\w+", text.lower())
+        if len(words) < self.shingle_size:
+            return {_hash32(" ".join(words))}
+        return {
+            _hash32(" ".join(words[i:i + self.shingle_size]))
+            for i in range(len(words) - self.shingle_size + 1)
+        }
+
+    def signature(self, text: str) -> List[int]:
+        """
+        Compute the MinHash signature of a posting.
+
+        Args:
+            text (str): The posting text.
+
+        Returns:
+            List[int]: One minimum hash value per permutation.
+        """
+        shingles = self._shingles(text)
+        return [
+            min((a * shingle + b) % _PRIME for shingle in shingles) & _MAX_HASH
+            for a, b in self._coefficients
+        ]
+
+    def _band_keys(self, signature: List[int]) -> List[str]:
+        return [
+            f"{band}:{'.'.join(map(str, signature[band * self.rows:(band + 1) * self.rows]))}"
+            for band in range(self.bands)
+        ]
+
+    def _similarity(self, first: List[int], second: List[int]) -> float:
+        return sum(1 for a, b in zip(first, second) if a == b) / self.num_perm
+
+    def find_duplicate(self, text: str, signature: Optional[List[int]] = None) -> Optional[str]:
+        """
+        Find an indexed posting that is a near-duplicate of the given text.
+
+        Args:
+            text (str): The posting text.
+            signature (Optional[List[int]]): Precomputed signature of ``text``. Defaults to None.
+
+        Returns:
+            Optional[str]: The key of the most similar indexed posting, or None.
+        """
+        signature = signature or self.signature(text)
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self._buckets.get(band_key, ()))
+
+        best_key, best_similarity = None, self.threshold
+        for key in candidates:
+            similarity = self._similarity(signature, self._signatures[key])
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+        return best_key
+
+    def add(self, text: str, key: Optional[str] = None, signature: Optional[List[int]] = None) -> str:
+        """
+        Add a posting to the index.
+
+        Args:
+            text (str): The posting text.
+            key (Optional[str]): Key to index the posting under. Defaults to its fingerprint.
+            signature (Optional[List[int]]): Precomputed signature of ``text``. Defaults to None.
+
+        Returns:
+            str: The key the posting was indexed under.
+        """
+        key = key or posting_fingerprint(text)
+        if key in self._signatures:
+            return key
+
+        signature = signature or self.signature(text)
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, []).append(key)
+        return key
+
+    def deduplicate(self, postings: List[str]) -> DedupResult:
+        """
+        Collapse near-duplicates in a batch of postings and index the survivors.
+
+        Args:
+            postings (List[str]): The posting texts, e.g. from search and scrape results.
+
+        Returns:
+            DedupResult: The postings to send on, plus what was collapsed.
+        """
+        result = DedupResult()
+        batch_keys: Dict[str, int] = {}
+
+        for index, text in enumerate(postings):
+            signature = self.signature(text)
+            match = self.find_duplicate(text, signature)
+            if match is None:
+                batch_keys[self.add(text, signature=signature)] = index
+                result.unique.append(text)
+            elif match in batch_keys:
+                result.duplicates[index] = batch_keys[match]
+            else:
+                result.previously_seen.append(index)
+
+        logger.info(
+            f"Deduplicated {len(postings)} postings: {len(result.unique)} new, "
+            f"{len(result.duplicates)} duplicates, {len(result.previously_seen)} seen before"
+        )
+        return result
+
+    def load(self) -> None:
+        """
+        Load the index from its JSON file.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except Exception as e:
+            logger.error(f"Error loading dedup index {self.path}: {e}")
+            return
+
+        settings = (data.get("num_perm"), data.get("shingle_size"), data.get("seed"))
+        if settings != (self.num_perm, self.shingle_size, self.seed):
+            logger.warning(f"Ignoring dedup index {self.path} built with different settings")
+            return
+
+        self._signatures = {}
+        self._buckets = {}
+        for key, signature in data.get("signatures", {}).items():
+            self.add("", key=key, signature=signature)
+
+    def save(self) -> bool:
+        """
+        Persist the index to its JSON file.
+
+        Returns:
+            bool: True if the index was saved successfully, False otherwise.
+        """
+        if not self.path:
+            return False
+
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({
+                    "num_perm": self.num_perm,
+                    "shingle_size": self.shingle_size,
+                    "seed": self.seed,
+                    "signatures": self._signatures
+                }, file)
+            os.replace(temp_path, self.path)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving dedup index {self.path}: {e}")
+            return False
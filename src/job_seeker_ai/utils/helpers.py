@@ -6,6 +6,8 @@ import os
 import logging
 from typing import Dict, Any, Optional
 
+from job_seeker_ai.utils.ingestion import DEFAULT_MAX_BYTES, DEFAULT_MAX_CHARS, read_text
+
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
     """
@@ -25,19 +27,27 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     return logging.getLogger("job_seeker_ai")
 
 
-def read_file_content(file_path: str) -> Optional[str]:
+def read_file_content(
+    file_path: str,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    max_chars: int = DEFAULT_MAX_CHARS
+) -> Optional[str]:
     """
-    Read the content of a file.
+    Read the content of a text file in bounded memory.
+    
+    The file is read in chunks with its encoding detected, and compacted to at most
+    ``max_chars`` characters. Files larger than ``max_bytes`` are not read.
     
     Args:
         file_path (str): Path to the file.
+        max_bytes (int): Maximum file size in bytes. Defaults to DEFAULT_MAX_BYTES.
+        max_chars (int): Maximum characters to return. Defaults to DEFAULT_MAX_CHARS.
         
     Returns:
         Optional[str]: The content of the file, or None if the file cannot be read.
     """
     try:
-        with open(file_path, "r") as file:
-            return file.read()
+        return read_text(file_path, max_bytes, max_chars).text
     except Exception as e:
         logger = logging.getLogger("job_seeker_ai")
         logger.error(f"Error reading file {file_path}: {e}")
@@ -0,0 +1,241 @@
+"""
+Ingestion - Bounded-memory reading of uploaded text files such as resumes.
+"""
+
+import os
+import re
+import codecs
+import logging
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Files larger than this are rejected without being read.
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+# Characters kept after compaction, roughly 15k tokens.
+DEFAULT_MAX_CHARS = 60_000
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Byte order marks, longest first so UTF-32 is not mistaken for UTF-16. The codecs
+# named here consume the mark instead of decoding it as text.
+BOMS: List[Tuple[bytes, str]] = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+# Control characters other than tab and newline.
+_CONTROL_PATTERN = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+
+_SPACE_RUN_PATTERN = re.compile(r"[ \t]{2,}")
+
+
+class IngestionError(ValueError):
+    """
+    Raised when an input file cannot be ingested.
+    """
+
+
+class FileTooLargeError(IngestionError):
+    """
+    Raised when an input file exceeds the size limit.
+    """
+
+
+class BinaryFileError(IngestionError):
+    """
+    Raised when an input file does not look like text.
+    """
+
+
+@dataclass
+class IngestedText:
+    """
+    Text read from an input.
+
+    Attributes:
+        text (str): The compacted text.
+        encoding (str): The detected encoding.
+        bytes_read (int): Bytes read from the input.
+        truncated (bool): Whether text was dropped to stay within the character limit.
+    """
+    text: str
+    encoding: str = "utf-8"
+    bytes_read: int = 0
+    truncated: bool = False
+
+
+def detect_encoding(sample: bytes) -> str:
+    """
+    Detect the encoding of a file from its first bytes.
+
+    Byte order marks are honoured; otherwise the sample is tried as UTF-8 and
+    Windows-1252 is assumed if that fails.
+
+    Args:
+        sample (bytes): The first bytes of the file.
+
+    Returns:
+        str: The codec name.
+    """
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return encoding
+    try:
+        # Not final: the sample may end in the middle of a multi-byte character.
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp1252"
+
+
+class ChunkedTextReader:
+    """
+    Reads a text file chunk by chunk, decoding it incrementally.
+
+    Only one chunk is held in memory at a time. The encoding is detected from the first
+    chunk and is available, with the number of bytes read, once iteration has started.
+    """
+
+    def __init__(self, file_path: str, max_bytes: int = DEFAULT_MAX_BYTES, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the reader.
+
+        Args:
+            file_path (str): Path to the file.
+            max_bytes (int): Files larger than this are rejected.
+            chunk_size (int): Bytes read per chunk.
+        """
+        self.file_path = file_path
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.encoding: Optional[str] = None
+        self.bytes_read = 0
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Yield decoded text chunks.
+
+        Raises:
+            FileTooLargeError: If the file is, or grows while being read, larger than max_bytes.
+            BinaryFileError: If the file contains NUL bytes outside a UTF-16/32 encoding.
+        """
+        size = os.path.getsize(self.file_path)
+        if size > self.max_bytes:
+            raise FileTooLargeError(f"{self.file_path} is {size} bytes, the limit is {self.max_bytes}")
+
+        with open(self.file_path, "rb") as file:
+            chunk = file.read(self.chunk_size)
+            self.encoding = detect_encoding(chunk)
+            if b"\x00" in chunk and not self.encoding.startswith(("utf-16", "utf-32")):
+                raise BinaryFileError(f"{self.file_path} does not look like a text file")
+
+            decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+            while chunk:
+                self.bytes_read += len(chunk)
+                if self.bytes_read > self.max_bytes:
+                    raise FileTooLargeError(
+                        f"{self.file_path} grew past the {self.max_bytes} byte limit while being read"
+                    )
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+                chunk = file.read(self.chunk_size)
+
+            text = decoder.decode(b"", final=True)
+            if text:
+                yield text
+
+
+def compact_text(chunks: Iterable[str], max_chars: int = DEFAULT_MAX_CHARS) -> Tuple[str, bool]:
+    """
+    Compact streamed text for a prompt, keeping at most max_chars characters.
+
+    Control characters and trailing whitespace are removed, runs of spaces collapsed and
+    runs of blank lines reduced to one. Chunks are consumed only until the limit is
+    reached, so the rest of a large input is never read.
+
+    Args:
+        chunks (Iterable[str]): The text, in chunks.
+        max_chars (int): Maximum characters to keep.
+
+    Returns:
+        Tuple[str, bool]: The compacted text and whether input was dropped to fit the limit.
+    """
+    lines: List[str] = []
+    length = 0
+    pending = ""
+    blank = True
+
+    def add(line: str) -> bool:
+        nonlocal length, blank
+        line = _SPACE_RUN_PATTERN.sub(" ", _CONTROL_PATTERN.sub(" ", line)).rstrip()
+        if not line:
+            if blank:
+                return True
+            blank = True
+            line = ""
+        else:
+            blank = False
+        if length + len(line) + 1 > max_chars:
+            remaining = max_chars - length
+            if remaining > 0:
+                lines.append(line[:remaining])
+            return False
+        lines.append(line)
+        length += len(line) + 1
+        return True
+
+    for chunk in chunks:
+        parts = (pending + chunk.replace("\r\n", "\n").replace("\r", "\n")).split("\n")
+        pending = parts.pop()
+        for line in parts:
+            if not add(line):
+                return "\n".join(lines).strip(), True
+        # A single line longer than the limit is cut without waiting for its end.
+        if len(pending) > max_chars:
+            add(pending)
+            return "\n".join(lines).strip(), True
+
+    if pending and not add(pending):
+        return "\n".join(lines).strip(), True
+    return "\n".join(lines).strip(), False
+
+
+def read_text(
+    file_path: str,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    max_chars: int = DEFAULT_MAX_CHARS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> IngestedText:
+    """
+    Read and compact a text file in bounded memory.
+
+    Args:
+        file_path (str): Path to the file.
+        max_bytes (int): Files larger than this are rejected.
+        max_chars (int): Maximum characters to keep after compaction.
+        chunk_size (int): Bytes read per chunk.
+
+    Returns:
+        IngestedText: The compacted text.
+
+    Raises:
+        FileTooLargeError: If the file is larger than max_bytes.
+        BinaryFileError: If the file does not look like text.
+    """
+    reader = ChunkedTextReader(file_path, max_bytes, chunk_size)
+    text, truncated = compact_text(reader, max_chars)
+    if truncated:
+        logger.warning(f"{file_path} was truncated to {max_chars} characters after reading {reader.bytes_read} bytes")
+    return IngestedText(
+        text=text,
+        encoding=reader.encoding or "utf-8",
+        bytes_read=reader.bytes_read,
+        truncated=truncated
+    )
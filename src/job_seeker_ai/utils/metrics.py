@@ -0,0 +1,77 @@
+"""
+Lightweight timing and prompt-cache metrics for the Job Seeker AI Assistant.
+"""
+
+import time
+import hashlib
+import threading
+from typing import Dict
+
+
+class Timer:
+    """
+    Context manager that measures wall-clock time.
+
+    Example:
+        with Timer() as timer:
+            do_work()
+        print(timer.elapsed)
+    """
+
+    def __init__(self):
+        self.started = 0.0
+        self.elapsed = 0.0
+
+    def __enter__(self) -> "Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed = time.perf_counter() - self.started
+
+
+class SharedPrefixTracker:
+    """
+    Measures how much of a batch of prompts is a prefix shared with an earlier prompt.
+
+    This describes the prompt layout only: it is the share of input a provider's prefix
+    cache could serve at best. It is not an observed cache hit rate, which only the
+    provider's usage data (cached input tokens) can report.
+    """
+
+    def __init__(self):
+        self._seen: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.reused = 0
+        self.requests = 0
+        self.shared_chars = 0
+        self.total_chars = 0
+
+    def record(self, prefix: str, prompt: str) -> bool:
+        """
+        Record a prompt that starts with a stable prefix.
+
+        Args:
+            prefix (str): The stable, shared part of the prompt.
+            prompt (str): The full prompt.
+
+        Returns:
+            bool: True if the prefix had been sent before.
+        """
+        key = hashlib.blake2b(prefix.encode("utf-8"), digest_size=16).hexdigest()
+        with self._lock:
+            reused = key in self._seen
+            self._seen[key] = self._seen.get(key, 0) + 1
+            self.requests += 1
+            self.total_chars += len(prompt)
+            if reused:
+                self.reused += 1
+                self.shared_chars += len(prefix)
+        return reused
+
+    @property
+    def shared_prefix_fraction(self) -> float:
+        """
+        Fraction of all prompt characters that repeat a previously sent prefix.
+        """
+        return self.shared_chars / self.total_chars if self.total_chars else 0.0
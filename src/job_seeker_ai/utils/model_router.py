@@ -0,0 +1,370 @@
+"""
+Model router - Per-agent and per-method model tiers with usage reporting.
+"""
+
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from langchain.callbacks.base import BaseCallbackHandler
+
+logger = logging.getLogger(__name__)
+
+GENERATION = "generation"
+EXTRACTION = "extraction"
+SCORING = "scoring"
+
+
+@dataclass
+class ModelTier:
+    """
+    A model offered at one tier.
+
+    Attributes:
+        name (str): The tier name, e.g. "fast" or "large".
+        model (str): The provider model name.
+        base_url (Optional[str]): OpenAI-compatible endpoint, e.g. for a local model server.
+        temperature (float): Sampling temperature.
+        cost_per_1k_input_tokens (float): Price of 1,000 prompt tokens.
+        cost_per_1k_output_tokens (float): Price of 1,000 completion tokens.
+    """
+    name: str
+    model: str
+    base_url: Optional[str] = None
+    temperature: float = 0.7
+    cost_per_1k_input_tokens: float = 0.0
+    cost_per_1k_output_tokens: float = 0.0
+
+
+@dataclass
+class _TierUsage:
+    calls: int = 0
+    latency_seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the token count of a text (about four characters per token in English).
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        int: The estimated token count.
+    """
+    return max(1, len(text) // 4) if text else 0
+
+
+class TierUsageHandler(BaseCallbackHandler):
+    """
+    LangChain callback that records every call a tier's model makes, including calls made
+    by a crew outside ModelRouter.call. Token counts come from the provider's response
+    when it reports them and are estimated otherwise.
+    """
+
+    def __init__(self, router: "ModelRouter", tier: str):
+        """
+        Initialize the handler.
+
+        Args:
+            router (ModelRouter): The router that records the usage.
+            tier (str): The tier whose model the handler is attached to.
+        """
+        self.router = router
+        self.tier = tier
+        self._started: Dict[UUID, Tuple[float, str]] = {}
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID, **kwargs: Any) -> None:
+        self._started[run_id] = (time.perf_counter(), "\n".join(prompts))
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        started, prompt = self._started.pop(run_id, (time.perf_counter(), ""))
+        output = "\n".join(
+            generation.text for generations in response.generations for generation in generations
+        )
+        token_usage = (response.llm_output or {}).get("token_usage") or {}
+        self.router._record(
+            self.tier,
+            time.perf_counter() - started,
+            prompt,
+            output,
+            token_usage.get("prompt_tokens"),
+            token_usage.get("completion_tokens"),
+            observed=True
+        )
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._started.pop(run_id, None)
+
+
+def default_llm_factory(tier: ModelTier) -> Any:
+    """
+    Build a chat model for a tier through LangChain's OpenAI-compatible client.
+
+    Args:
+        tier (ModelTier): The tier.
+
+    Returns:
+        Any: The chat model.
+    """
+    from langchain_openai import ChatOpenAI
+
+    kwargs = {"model": tier.model, "temperature": tier.temperature}
+    if tier.base_url:
+        kwargs["base_url"] = tier.base_url
+    return ChatOpenAI(**kwargs)
+
+
+class ModelRouter:
+    """
+    Chooses a model tier for each agent call and records latency and cost per tier.
+
+    A call's tier is, in order of precedence: the agent's ``method_tiers`` entry for the
+    method, the first matching routing rule, the agent's ``model_tier``, and finally the
+    default tier. Routing rules match on task type and on input size.
+
+    Models that accept LangChain callbacks get a TierUsageHandler, so their usage is
+    recorded however they are called, e.g. by a crew. Per-method routing only applies to
+    calls made through ``call``.
+    """
+
+    def __init__(
+        self,
+        tiers: Dict[str, ModelTier],
+        default_tier: str,
+        rules: Optional[List[Dict[str, Any]]] = None,
+        agent_tiers: Optional[Dict[str, str]] = None,
+        method_tiers: Optional[Dict[str, Dict[str, str]]] = None,
+        llm_factory: Callable[[ModelTier], Any] = default_llm_factory
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            tiers (Dict[str, ModelTier]): Tier name -> tier.
+            default_tier (str): Tier used when nothing else applies.
+            rules (Optional[List[Dict[str, Any]]]): Routing rules, each with a "tier" and optional
+                "task_type", "min_input_chars" and "max_input_chars" conditions.
+            agent_tiers (Optional[Dict[str, str]]): Agent config key -> tier.
+            method_tiers (Optional[Dict[str, Dict[str, str]]]): Agent config key -> method name -> tier.
+            llm_factory (Callable[[ModelTier], Any]): Builds the model for a tier.
+        """
+        unknown = {default_tier} | {rule["tier"] for rule in rules or []}
+        unknown |= set((agent_tiers or {}).values())
+        unknown |= {tier for methods in (method_tiers or {}).values() for tier in methods.values()}
+        unknown -= set(tiers)
+        if unknown:
+            raise ValueError(f"Unknown model tier(s): {', '.join(sorted(unknown))}")
+
+        self.tiers = tiers
+        self.default_tier = default_tier
+        self.rules = list(rules or [])
+        self.agent_tiers = dict(agent_tiers or {})
+        self.method_tiers = {agent: dict(methods) for agent, methods in (method_tiers or {}).items()}
+        self.llm_factory = llm_factory
+        self._llms: Dict[str, Any] = {}
+        self._usage: Dict[str, _TierUsage] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], **kwargs) -> Optional["ModelRouter"]:
+        """
+        Build a router from the agents.yaml configuration.
+
+        Args:
+            config (Dict[str, Any]): The full agent configuration, with a top-level "models" section.
+            **kwargs: Passed on to the constructor.
+
+        Returns:
+            Optional[ModelRouter]: The router, or None if no models are configured.
+        """
+        models = config.get("models")
+        if not models:
+            return None
+
+        tiers = {
+            name: ModelTier(name=name, **settings)
+            for name, settings in models["tiers"].items()
+        }
+        agents = {key: value for key, value in config.items() if key != "models" and isinstance(value, dict)}
+        return cls(
+            tiers=tiers,
+            default_tier=models.get("default_tier", next(iter(tiers))),
+            rules=models.get("routing", []),
+            agent_tiers={key: agent["model_tier"] for key, agent in agents.items() if agent.get("model_tier")},
+            method_tiers={key: agent["method_tiers"] for key, agent in agents.items() if agent.get("method_tiers")},
+            **kwargs
+        )
+
+    def _rule_matches(self, rule: Dict[str, Any], task_type: str, input_chars: int) -> bool:
+        if rule.get("task_type") not in (None, task_type):
+            return False
+        if input_chars < rule.get("min_input_chars", 0):
+            return False
+        return input_chars <= rule.get("max_input_chars", float("inf"))
+
+    def select(self, agent_key: str, method: Optional[str] = None, input_text: str = "", task_type: str = GENERATION) -> str:
+        """
+        Choose the tier for a call.
+
+        Args:
+            agent_key (str): The agent's config key, e.g. "job_search_agent".
+            method (Optional[str]): The agent method being called. Defaults to None.
+            input_text (str): The call's input, used by size-based rules.
+            task_type (str): GENERATION, EXTRACTION, SCORING or a custom type.
+
+        Returns:
+            str: The tier name.
+        """
+        tier = self.method_tiers.get(agent_key, {}).get(method) if method else None
+        if tier:
+            return tier
+
+        for rule in self.rules:
+            if self._rule_matches(rule, task_type, len(input_text)):
+                return rule["tier"]
+
+        return self.agent_tiers.get(agent_key, self.default_tier)
+
+    def llm(self, tier: str) -> Any:
+        """
+        Get the model for a tier, building it on first use.
+
+        Args:
+            tier (str): The tier name.
+
+        Returns:
+            Any: The chat model.
+        """
+        with self._lock:
+            if tier not in self._llms:
+                llm = self.llm_factory(self.tiers[tier])
+                if hasattr(llm, "callbacks"):
+                    llm.callbacks = list(llm.callbacks or []) + [TierUsageHandler(self, tier)]
+                self._llms[tier] = llm
+            return self._llms[tier]
+
+    def agent_llm(self, agent_key: str) -> Any:
+        """
+        Get the model an agent uses by default.
+
+        Args:
+            agent_key (str): The agent's config key.
+
+        Returns:
+            Any: The chat model.
+        """
+        return self.llm(self.agent_tiers.get(agent_key, self.default_tier))
+
+    def call(
+        self,
+        agent: Any,
+        agent_key: str,
+        method: str,
+        func: Callable[[Any], str],
+        input_text: str = "",
+        task_type: str = GENERATION
+    ) -> str:
+        """
+        Run an agent call on its routed tier and record its latency and estimated cost.
+
+        The call runs on its own copy of the agent, built with the routed model, so the
+        shared agent is never modified. A call that is abandoned by its stage and finishes
+        late therefore cannot change the model of a later call on the same agent. If the
+        model's TierUsageHandler recorded the call's model requests, the call is not
+        recorded again.
+
+        Args:
+            agent (Any): The agent making the call.
+            agent_key (str): The agent's config key.
+            method (str): The agent method being called.
+            func (Callable[[Any], str]): Makes the call on the agent it is given and returns its output.
+            input_text (str): The call's input.
+            task_type (str): The call's task type.
+
+        Returns:
+            str: The call's output.
+        """
+        tier = self.select(agent_key, method, input_text, task_type)
+        logger.debug(f"Routing {agent_key}.{method} ({task_type}, {len(input_text)} chars) to tier {tier}")
+        routed_agent = type(agent)(agent.role, agent.goal, agent.tools, llm=self.llm(tier))
+
+        observed_before = getattr(self._local, "observed", 0)
+        started = time.perf_counter()
+        try:
+            output = func(routed_agent)
+        finally:
+            latency = time.perf_counter() - started
+
+        if getattr(self._local, "observed", 0) == observed_before:
+            self._record(tier, latency, input_text, str(output))
+        return output
+
+    def _record(
+        self,
+        tier: str,
+        latency: float,
+        input_text: str,
+        output: str,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+        observed: bool = False
+    ) -> None:
+        if observed:
+            self._local.observed = getattr(self._local, "observed", 0) + 1
+        input_tokens = estimate_tokens(input_text) if input_tokens is None else input_tokens
+        output_tokens = estimate_tokens(output) if output_tokens is None else output_tokens
+        settings = self.tiers[tier]
+        with self._lock:
+            usage = self._usage.setdefault(tier, _TierUsage())
+            usage.calls += 1
+            usage.latency_seconds += latency
+            usage.input_tokens += input_tokens
+            usage.output_tokens += output_tokens
+            usage.cost += (
+                input_tokens * settings.cost_per_1k_input_tokens
+                + output_tokens * settings.cost_per_1k_output_tokens
+            ) / 1000
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get call counts, latency and tokens and estimated cost per tier.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Tier name -> usage.
+        """
+        with self._lock:
+            return {
+                tier: {
+                    "model": self.tiers[tier].model,
+                    "calls": usage.calls,
+                    "total_latency_seconds": usage.latency_seconds,
+                    "avg_latency_seconds": usage.latency_seconds / usage.calls,
+                    "input_tokens": usage.input_tokens,
+                    "output_tokens": usage.output_tokens,
+                    "estimated_cost": usage.cost,
+                }
+                for tier, usage in self._usage.items()
+            }
+
+    def format_report(self) -> str:
+        """
+        Format the per-tier usage as a table.
+
+        Returns:
+            str: The report.
+        """
+        lines = [f"{'tier':<8} {'model':<24} {'calls':>5} {'avg s':>7} {'in tok':>8} {'out tok':>8} {'cost':>9}"]
+        for tier, usage in self.report().items():
+            lines.append(
+                f"{tier:<8} {usage['model']:<24} {usage['calls']:>5} {usage['avg_latency_seconds']:>7.2f} "
+                f"{usage['input_tokens']:>8} {usage['output_tokens']:>8} {usage['estimated_cost']:>9.4f}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,190 @@
+"""
+Per-stage profiling for the Job Seeker AI Assistant.
+"""
+
+import os
+import sys
+import time
+import pstats
+import cProfile
+import logging
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageProfile:
+    """
+    Profiling results for one stage.
+
+    Attributes:
+        name (str): The stage name.
+        wall_seconds (float): Wall-clock duration.
+        peak_memory_bytes (int): Peak traced memory during the stage.
+        top_allocations (List[str]): Largest allocation sites still alive at the end of the stage.
+        samples (int): Number of stack samples taken.
+    """
+    name: str
+    wall_seconds: float = 0.0
+    peak_memory_bytes: int = 0
+    top_allocations: List[str] = field(default_factory=list)
+    samples: int = 0
+
+
+class _StackSampler(threading.Thread):
+    """
+    Background thread that periodically samples the stacks of all other threads.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__(name="stage-profiler-sampler", daemon=True)
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                frames.append(names.get(thread_id, f"thread-{thread_id}"))
+                self.stacks[tuple(reversed(frames))] += 1
+            self.samples += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+class StageProfiler:
+    """
+    Profiles named stages of a run.
+
+    For each stage this records a cProfile dump (``<stage>.prof``), sampled stacks in the
+    collapsed format used by flame graph tools (``stacks.collapsed``, one
+    ``stage;thread;frame;...;frame count`` line per unique stack) and the peak traced
+    memory with the largest allocation sites.
+    """
+
+    def __init__(self, output_dir: str, sample_interval: float = 0.005, top_allocations: int = 10):
+        """
+        Initialize the profiler.
+
+        Args:
+            output_dir (str): Directory the profiling output is written to.
+            sample_interval (float): Seconds between stack samples.
+            top_allocations (int): Number of allocation sites to report per stage.
+        """
+        self.output_dir = output_dir
+        self.sample_interval = sample_interval
+        self.top_allocations = top_allocations
+        self.stages: List[StageProfile] = []
+        self._collapsed: Dict[Tuple[str, ...], int] = Counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageProfile]:
+        """
+        Profile the code run inside the context.
+
+        Args:
+            name (str): The stage name.
+
+        Yields:
+            StageProfile: The stage results, filled in when the context exits.
+        """
+        result = StageProfile(name)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+
+        sampler = _StackSampler(self.sample_interval)
+        profile = cProfile.Profile()
+        sampler.start()
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            yield result
+        finally:
+            profile.disable()
+            result.wall_seconds = time.perf_counter() - started
+            sampler.stop()
+
+            result.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+            snapshot = tracemalloc.take_snapshot()
+            result.top_allocations = [
+                str(stat) for stat in snapshot.statistics("lineno")[:self.top_allocations]
+            ]
+            if started_tracing:
+                tracemalloc.stop()
+
+            result.samples = sampler.samples
+            for stack, count in sampler.stacks.items():
+                self._collapsed[(name,) + stack] += count
+
+            self._write_profile(name, profile)
+            self.stages.append(result)
+
+    def _write_profile(self, name: str, profile: cProfile.Profile) -> None:
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            profile.dump_stats(os.path.join(self.output_dir, f"{name}.prof"))
+        except Exception as e:
+            logger.error(f"Error writing profile for stage {name}: {e}")
+
+    def report(self) -> str:
+        """
+        Summarize wall time and peak memory per stage.
+
+        Returns:
+            str: A plain-text report.
+        """
+        lines = ["Stage profile:"]
+        total = sum(stage.wall_seconds for stage in self.stages) or 1.0
+        for stage in self.stages:
+            lines.append(
+                f"  {stage.name:<20} {stage.wall_seconds:8.3f}s {100 * stage.wall_seconds / total:5.1f}%"
+                f"  peak {stage.peak_memory_bytes / (1024 * 1024):8.2f} MiB  samples {stage.samples}"
+            )
+        for stage in self.stages:
+            if stage.top_allocations:
+                lines.append(f"\nTop allocations in {stage.name}:")
+                lines.extend(f"  {allocation}" for allocation in stage.top_allocations)
+        return "\n".join(lines)
+
+    def save(self) -> str:
+        """
+        Write the collapsed stacks, the report and a cumulative-time listing per stage.
+
+        Returns:
+            str: The directory the output was written to.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        with open(os.path.join(self.output_dir, "stacks.collapsed"), "w", encoding="utf-8") as file:
+            for stack, count in sorted(self._collapsed.items()):
+                file.write(f"{';'.join(frame.replace(';', ',') for frame in stack)} {count}\n")
+
+        with open(os.path.join(self.output_dir, "report.txt"), "w", encoding="utf-8") as file:
+            file.write(self.report() + "\n")
+            for stage in self.stages:
+                profile_path = os.path.join(self.output_dir, f"{stage.name}.prof")
+                if os.path.exists(profile_path):
+                    file.write(f"\n=== {stage.name} (top 25 by cumulative time) ===\n")
+                    pstats.Stats(profile_path, stream=file).sort_stats("cumulative").print_stats(25)
+
+        return self.output_dir
@@ -0,0 +1,207 @@
+"""
+Interview question bank - Persistent store of interview questions keyed by role and skill cluster.
+"""
+
+import os
+import re
+import json
+import logging
+from collections import Counter
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+
+from job_seeker_ai.utils.skills import extract_role_title, extract_skills, normalize_role
+
+logger = logging.getLogger(__name__)
+
+_QUESTION_PREFIX_PATTERN = re.compile(r"^\s*(?:[-*•]|\d+[.)]|[a-z][.)]|q\d*[:.])?\s*(?:\*\*)?", re.IGNORECASE)
+
+
+class QuestionBank:
+    """
+    A persistent bank of interview questions grouped into clusters.
+
+    A cluster is identified by the normalized role title plus the leading skills
+    of the job description, so "Sr. Backend Developer" and "Senior Back-End Engineer"
+    postings asking for the same stack share their questions. Only the start of the
+    description is scanned for skills. Clusters are held in a dictionary and indexed
+    by role and skill, so a lookup costs one hash probe and, when that misses, visits
+    only the same-role clusters sharing at least one skill.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        cluster_size: int = 5,
+        min_overlap: float = 0.5,
+        leading_chars: int = 2000
+    ):
+        """
+        Initialize the question bank.
+
+        Args:
+            path (Optional[str]): JSON file the bank is persisted to. Defaults to None (in memory only).
+            cluster_size (int): Number of leading job description skills that define a cluster.
+            min_overlap (float): Minimum Jaccard overlap for a same-role cluster to count as a match.
+            leading_chars (int): Characters at the start of a job description scanned for skills.
+        """
+        self.path = path
+        self.cluster_size = cluster_size
+        self.min_overlap = min_overlap
+        self.leading_chars = leading_chars
+        self._clusters: Dict[str, Dict] = {}
+        # role -> skill -> keys of the role's clusters that include the skill
+        self._index: Dict[str, Dict[str, List[str]]] = {}
+        if path and os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._clusters)
+
+    def cluster_for(self, job_description: str) -> Tuple[str, List[str]]:
+        """
+        Compute the cluster a job description belongs to.
+
+        Args:
+            job_description (str): The job description.
+
+        Returns:
+            Tuple[str, List[str]]: The normalized role and the sorted cluster skills.
+        """
+        role = normalize_role(extract_role_title(job_description) or "")
+        skills = sorted(extract_skills(job_description[:self.leading_chars], limit=self.cluster_size))
+        return role, skills
+
+    @staticmethod
+    def cluster_key(role: str, skills: List[str]) -> str:
+        """
+        Build the dictionary key for a cluster.
+
+        Args:
+            role (str): The normalized role.
+            skills (List[str]): The sorted cluster skills.
+
+        Returns:
+            str: The cluster key.
+        """
+        return f"{role}|{','.join(skills)}"
+
+    def lookup(self, job_description: str) -> List[str]:
+        """
+        Fetch the banked questions for a job description.
+
+        An exact cluster match is tried first, then the same-role cluster with the
+        largest skill overlap above ``min_overlap``. Only clusters that share a skill
+        with the job description can reach the overlap, so only those are scored.
+
+        Args:
+            job_description (str): The job description.
+
+        Returns:
+            List[str]: The banked questions, or an empty list if no cluster matches.
+        """
+        role, skills = self.cluster_for(job_description)
+        cluster = self._clusters.get(self.cluster_key(role, skills))
+        if cluster:
+            return list(cluster["questions"])
+
+        role_index = self._index.get(role, {})
+        shared = Counter(chain.from_iterable(role_index.get(skill, ()) for skill in skills))
+        best_cluster, best_overlap = None, self.min_overlap
+        for key, count in shared.items():
+            # A cluster sharing `count` skills overlaps by at most count / len(skills).
+            if count < best_overlap * len(skills):
+                continue
+            candidate = self._clusters[key]
+            overlap = count / (len(skills) + len(candidate["skills"]) - count)
+            if overlap >= best_overlap:
+                best_cluster, best_overlap = candidate, overlap
+
+        return list(best_cluster["questions"]) if best_cluster else []
+
+    def _index_cluster(self, key: str, cluster: Dict) -> None:
+        role_index = self._index.setdefault(cluster["role"], {})
+        for skill in cluster["skills"]:
+            role_index.setdefault(skill, []).append(key)
+
+    def add_questions(self, job_description: str, questions: List[str]) -> None:
+        """
+        Add questions to the cluster of a job description, skipping duplicates.
+
+        Args:
+            job_description (str): The job description.
+            questions (List[str]): The questions to add.
+        """
+        role, skills = self.cluster_for(job_description)
+        if not role or not questions:
+            return
+
+        key = self.cluster_key(role, skills)
+        cluster = self._clusters.get(key)
+        if cluster is None:
+            cluster = {"role": role, "skills": skills, "questions": []}
+            self._clusters[key] = cluster
+            self._index_cluster(key, cluster)
+
+        known = {question.lower() for question in cluster["questions"]}
+        for question in questions:
+            if question.lower() not in known:
+                known.add(question.lower())
+                cluster["questions"].append(question)
+
+    @staticmethod
+    def extract_questions(text: str) -> List[str]:
+        """
+        Pull the individual questions out of a generated question set.
+
+        Args:
+            text (str): The LLM output.
+
+        Returns:
+            List[str]: One entry per line that ends with a question mark.
+        """
+        questions = []
+        for line in text.splitlines():
+            line = _QUESTION_PREFIX_PATTERN.sub("", line).strip().strip("*\"").strip()
+            if line.endswith("?") and len(line) > 10:
+                questions.append(line)
+        return questions
+
+    def load(self) -> None:
+        """
+        Load the bank from its JSON file.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                clusters = json.load(file)
+        except Exception as e:
+            logger.error(f"Error loading question bank {self.path}: {e}")
+            return
+
+        self._clusters = clusters
+        self._index = {}
+        for key, cluster in clusters.items():
+            self._index_cluster(key, cluster)
+
+    def save(self) -> bool:
+        """
+        Persist the bank to its JSON file.
+
+        Returns:
+            bool: True if the bank was saved successfully, False otherwise.
+        """
+        if not self.path:
+            return False
+
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self._clusters, file)
+            os.replace(temp_path, self.path)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving question bank {self.path}: {e}")
+            return False
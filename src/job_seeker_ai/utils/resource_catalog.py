@@ -0,0 +1,120 @@
+"""
+Learning resource catalog - Local index of courses, docs and projects per skill.
+"""
+
+import os
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from job_seeker_ai.utils.skills import canonicalize_skill
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "config",
+    "learning_resources.json"
+)
+
+
+@dataclass(frozen=True)
+class LearningResource:
+    """
+    A single learning resource for a skill.
+
+    Attributes:
+        title (str): Name of the resource.
+        kind (str): One of "course", "docs", "book" or "project".
+        url (str): Where to find it. Empty for self-directed projects.
+        hours (int): Estimated time to complete.
+        level (str): "beginner", "intermediate" or "advanced".
+    """
+    title: str
+    kind: str
+    url: str
+    hours: int
+    level: str
+
+    def format(self) -> str:
+        """
+        Format the resource as a single prompt line.
+
+        Returns:
+            str: The formatted resource.
+        """
+        location = f" - {self.url}" if self.url else ""
+        return f"{self.title} ({self.kind}, {self.level}, ~{self.hours}h){location}"
+
+
+class ResourceCatalog:
+    """
+    Catalog of learning resources indexed by canonical skill.
+
+    The catalog file stores each resource as a positional row under its skill, and is
+    only read the first time a lookup is made.
+    """
+
+    def __init__(self, path: str = DEFAULT_CATALOG_PATH):
+        """
+        Initialize the catalog.
+
+        Args:
+            path (str): Path to the catalog JSON file. Defaults to the bundled catalog.
+        """
+        self.path = path
+        self._index: Optional[Dict[str, List[LearningResource]]] = None
+
+    def _load(self) -> Dict[str, List[LearningResource]]:
+        index: Dict[str, List[LearningResource]] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            fields = data["fields"]
+            for skill, rows in data["skills"].items():
+                index[canonicalize_skill(skill)] = [
+                    LearningResource(**dict(zip(fields, row)))
+                    for row in rows
+                ]
+        except Exception as e:
+            logger.error(f"Error loading learning resource catalog {self.path}: {e}")
+        return index
+
+    @property
+    def index(self) -> Dict[str, List[LearningResource]]:
+        """
+        The skill index, loaded on first access.
+        """
+        if self._index is None:
+            self._index = self._load()
+        return self._index
+
+    def lookup(self, skill: str) -> List[LearningResource]:
+        """
+        Get the resources for a skill.
+
+        Args:
+            skill (str): The skill, in any alias form.
+
+        Returns:
+            List[LearningResource]: The resources, or an empty list if the skill is not covered.
+        """
+        return self.index.get(canonicalize_skill(skill), [])
+
+    def recommend(self, skills: List[str]) -> Dict[str, List[LearningResource]]:
+        """
+        Get the resources for each covered skill.
+
+        Args:
+            skills (List[str]): The skills to look up.
+
+        Returns:
+            Dict[str, List[LearningResource]]: Canonical skill -> resources, for covered skills only.
+        """
+        recommendations = {}
+        for skill in skills:
+            resources = self.lookup(skill)
+            if resources:
+                recommendations[canonicalize_skill(skill)] = resources
+        return recommendations
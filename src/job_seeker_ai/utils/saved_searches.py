@@ -0,0 +1,241 @@
+"""
+Saved searches - Persisted job searches refreshed incrementally on a schedule.
+"""
+
+import os
+import json
+import time
+import uuid
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from job_seeker_ai.utils.dedup import PostingDeduplicator, posting_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# A posting as returned by a fetcher: at least "text", ideally "url" and "title".
+Posting = Dict[str, str]
+
+
+@dataclass
+class SavedSearch:
+    """
+    A job search a user re-runs regularly.
+
+    Attributes:
+        id (str): Unique search id.
+        resume (str): The user's resume.
+        job_preferences (str): The user's job preferences, also used as the search query.
+        interval_hours (float): How often the search should be refreshed.
+        last_run (Optional[float]): Epoch seconds of the last refresh.
+        seen (Dict[str, str]): Posting key -> fingerprint of the posting text last sent to the LLM.
+    """
+    id: str
+    resume: str
+    job_preferences: str
+    interval_hours: float = 24.0
+    last_run: Optional[float] = None
+    seen: Dict[str, str] = field(default_factory=dict)
+
+    def is_due(self, now: Optional[float] = None) -> bool:
+        """
+        Whether the search should be refreshed.
+
+        Args:
+            now (Optional[float]): Current epoch seconds. Defaults to time.time().
+
+        Returns:
+            bool: True if the search has never run or its interval has passed.
+        """
+        now = time.time() if now is None else now
+        return self.last_run is None or now - self.last_run >= self.interval_hours * 3600
+
+
+def posting_key(posting: Posting) -> str:
+    """
+    Identify a posting across refreshes.
+
+    Args:
+        posting (Posting): The posting.
+
+    Returns:
+        str: The posting URL, or a fingerprint of its title (or text) when there is no URL.
+    """
+    return posting.get("url") or posting_fingerprint(posting.get("title") or posting["text"])
+
+
+def compute_delta(search: SavedSearch, postings: List[Posting]) -> Tuple[List[Posting], List[Posting]]:
+    """
+    Split fetched postings into new ones and ones whose text changed since they were last seen.
+
+    Args:
+        search (SavedSearch): The saved search.
+        postings (List[Posting]): The postings fetched for this refresh.
+
+    Returns:
+        Tuple[List[Posting], List[Posting]]: The new postings and the changed postings.
+    """
+    new, changed = [], []
+    for posting in postings:
+        previous = search.seen.get(posting_key(posting))
+        if previous is None:
+            new.append(posting)
+        elif previous != posting_fingerprint(posting["text"]):
+            changed.append(posting)
+    return new, changed
+
+
+def parse_serper_results(raw: Any) -> List[Posting]:
+    """
+    Convert Serper search output into postings.
+
+    Args:
+        raw (Any): The search tool output, as a dict or a JSON string with an "organic" list.
+
+    Returns:
+        List[Posting]: One posting per organic result.
+
+    Raises:
+        ValueError: If the output is not a JSON object, e.g. an error message from the tool,
+            so a failed search is not mistaken for one that found no postings.
+    """
+    if isinstance(raw, str):
+        raw = json.loads(raw)
+    if raw is not None and not isinstance(raw, dict):
+        raise ValueError(f"Search output is not a JSON object: {type(raw).__name__}")
+
+    return [
+        {
+            "url": item.get("link", ""),
+            "title": item.get("title", ""),
+            "text": f"{item.get('title', '')}\n{item.get('snippet', '')}".strip()
+        }
+        for item in (raw or {}).get("organic", [])
+    ]
+
+
+class SavedSearchStore:
+    """
+    JSON-file store of saved searches.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the store, loading existing searches.
+
+        Args:
+            path (str): Path to the JSON file.
+        """
+        self.path = path
+        self.searches: Dict[str, SavedSearch] = {}
+        if os.path.exists(path):
+            self.load()
+
+    def add(self, resume: str, job_preferences: str, interval_hours: float = 24.0) -> SavedSearch:
+        """
+        Save a new search.
+
+        Args:
+            resume (str): The user's resume.
+            job_preferences (str): The user's job preferences.
+            interval_hours (float): How often the search should be refreshed.
+
+        Returns:
+            SavedSearch: The saved search.
+        """
+        search = SavedSearch(uuid.uuid4().hex, resume, job_preferences, interval_hours)
+        self.searches[search.id] = search
+        return search
+
+    def due(self, now: Optional[float] = None) -> List[SavedSearch]:
+        """
+        Get the searches that should be refreshed.
+
+        Args:
+            now (Optional[float]): Current epoch seconds. Defaults to time.time().
+
+        Returns:
+            List[SavedSearch]: The due searches.
+        """
+        return [search for search in self.searches.values() if search.is_due(now)]
+
+    def load(self) -> None:
+        """
+        Load the searches from the JSON file.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                self.searches = {item["id"]: SavedSearch(**item) for item in json.load(file)}
+        except Exception as e:
+            logger.error(f"Error loading saved searches {self.path}: {e}")
+
+    def save(self) -> bool:
+        """
+        Persist the searches to the JSON file.
+
+        Returns:
+            bool: True if the searches were saved successfully, False otherwise.
+        """
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump([asdict(search) for search in self.searches.values()], file)
+            os.replace(temp_path, self.path)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving saved searches {self.path}: {e}")
+            return False
+
+
+def refresh_search(
+    search: SavedSearch,
+    job_search_agent: Any,
+    fetch_postings: Callable[[SavedSearch], List[Posting]],
+    now: Optional[float] = None
+) -> Optional[str]:
+    """
+    Refresh a saved search, sending only new and changed postings to the LLM.
+
+    What counts as new is decided per search, from the search's own seen postings, so
+    one search never hides postings from another. Cross-posted copies among the new
+    postings are collapsed within the refresh. Postings are marked seen only once the
+    summary they were sent for has been produced, and the last run is only recorded
+    once the postings were fetched and summarized.
+
+    Args:
+        search (SavedSearch): The saved search. Its seen postings and last run are updated.
+        job_search_agent (JobSearchAgent): The agent that summarizes the postings.
+        fetch_postings (Callable[[SavedSearch], List[Posting]]): Fetches the current postings for the search.
+        now (Optional[float]): Current epoch seconds. Defaults to time.time().
+
+    Returns:
+        Optional[str]: The agent's summary of the delta, or None if nothing changed.
+    """
+    postings = fetch_postings(search)
+    new, changed = compute_delta(search, postings)
+    logger.info(
+        f"Saved search {search.id}: {len(postings)} postings, {len(new)} new, {len(changed)} changed"
+    )
+
+    # An in-memory index, so only copies within this refresh are collapsed. Each dropped
+    # copy is a near-duplicate of a posting that is sent.
+    new_texts = PostingDeduplicator().deduplicate([posting["text"] for posting in new]).unique
+
+    summary = None
+    delta = new_texts + [f"[Updated since last check]\n{posting['text']}" for posting in changed]
+    if delta:
+        summary = job_search_agent.find_job_opportunities(
+            search.resume,
+            search.job_preferences,
+            postings=delta,
+            use_web_search=False
+        )
+
+    for posting in new + changed:
+        search.seen[posting_key(posting)] = posting_fingerprint(posting["text"])
+    search.last_run = time.time() if now is None else now
+    return summary
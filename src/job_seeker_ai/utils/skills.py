@@ -0,0 +1,179 @@
+"""
+Skill and role normalization utilities for the Job Seeker AI Assistant.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+
+# Canonical skill name -> aliases that should be treated as the same skill.
+SKILL_ALIASES: Dict[str, List[str]] = {
+    "python": ["python", "python3"],
+    "java": ["java"],
+    "javascript": ["javascript", "js", "ecmascript"],
+    "typescript": ["typescript"],
+    "go": ["golang"],
+    "rust": ["rust"],
+    "c++": ["c++", "cpp"],
+    "c#": ["c#", "csharp", ".net", "dotnet"],
+    "sql": ["sql", "postgresql", "postgres", "mysql", "sqlite"],
+    "nosql": ["nosql", "mongodb", "dynamodb", "cassandra"],
+    "redis": ["redis"],
+    "kafka": ["kafka"],
+    "spark": ["spark", "pyspark"],
+    "react": ["react", "reactjs", "react.js"],
+    "node.js": ["nodejs", "node.js"],
+    "django": ["django"],
+    "flask": ["flask"],
+    "fastapi": ["fastapi"],
+    "aws": ["aws", "amazon web services"],
+    "gcp": ["gcp", "google cloud"],
+    "azure": ["azure"],
+    "docker": ["docker"],
+    "kubernetes": ["kubernetes", "k8s"],
+    "terraform": ["terraform"],
+    "ci/cd": ["ci/cd", "continuous integration", "continuous delivery"],
+    "linux": ["linux", "unix"],
+    "git": ["git"],
+    "rest apis": ["restful", "rest api", "rest apis"],
+    "graphql": ["graphql"],
+    "microservices": ["microservices", "microservice"],
+    "distributed systems": ["distributed systems"],
+    "system design": ["system design"],
+    "machine learning": ["machine learning", "ml"],
+    "deep learning": ["deep learning"],
+    "pytorch": ["pytorch"],
+    "tensorflow": ["tensorflow"],
+    "nlp": ["nlp", "natural language processing"],
+    "llms": ["llm", "llms", "large language models"],
+    "data analysis": ["data analysis", "analytics"],
+    "pandas": ["pandas"],
+    "statistics": ["statistics"],
+    "tableau": ["tableau"],
+    "excel": ["excel"],
+    "agile": ["agile", "scrum", "kanban"],
+    "project management": ["project management"],
+    "product management": ["product management"],
+    "leadership": ["leadership", "people management", "mentoring"],
+    "communication": ["communication", "stakeholder management"],
+}
+
+# Seniority and title words normalized to a single spelling.
+ROLE_SYNONYMS: Dict[str, str] = {
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "jnr": "junior",
+    "mid-level": "mid",
+    "intermediate": "mid",
+    "principle": "principal",
+    "mgr": "manager",
+    "eng": "engineer",
+    "developer": "engineer",
+    "dev": "engineer",
+    "swe": "software engineer",
+    "back-end": "backend",
+    "back end": "backend",
+    "front-end": "frontend",
+    "front end": "frontend",
+    "full-stack": "fullstack",
+    "full stack": "fullstack",
+}
+
+_ALIAS_TO_SKILL: Dict[str, str] = {
+    alias: skill
+    for skill, aliases in SKILL_ALIASES.items()
+    for alias in aliases
+}
+
+# Longest aliases first so "rest apis" wins over "rest api".
+_SKILL_PATTERN = re.compile(
+    r"(?<![\w+#.])("
+    + "|".join(re.escape(alias) for alias in sorted(_ALIAS_TO_SKILL, key=len, reverse=True))
+    + r")(?![\w+#])",
+    re.IGNORECASE,
+)
+
+_ROLE_SYNONYM_PATTERN = re.compile(
+    r"\b("
+    + "|".join(re.escape(word) for word in sorted(ROLE_SYNONYMS, key=len, reverse=True))
+    + r")\b"
+)
+
+_TITLE_PREFIX_PATTERN = re.compile(r"(?i)^\s*(?:job\s+title|title|position|role)\s*[:\-]\s*")
+
+
+def canonicalize_skill(skill: str) -> str:
+    """
+    Map a skill name to its canonical form.
+
+    Args:
+        skill (str): The skill name as written.
+
+    Returns:
+        str: The canonical skill name, or the lowercased input if it is unknown.
+    """
+    key = skill.strip().lower()
+    return _ALIAS_TO_SKILL.get(key, key)
+
+
+def extract_skills(text: str, limit: Optional[int] = None) -> List[str]:
+    """
+    Extract known skills from free text.
+
+    Args:
+        text (str): The text to scan (job description, resume, etc.).
+        limit (Optional[int]): Stop scanning once this many skills are found. Defaults to None.
+
+    Returns:
+        List[str]: Canonical skills in order of first appearance, without duplicates.
+    """
+    skills = []
+    seen = set()
+    for match in _SKILL_PATTERN.finditer(text):
+        skill = _ALIAS_TO_SKILL[match.group(1).lower()]
+        if skill not in seen:
+            seen.add(skill)
+            skills.append(skill)
+            if limit is not None and len(skills) >= limit:
+                break
+    return skills
+
+
+def normalize_role(title: str) -> str:
+    """
+    Normalize a job title so near-identical roles share the same key.
+
+    Args:
+        title (str): The job title, e.g. "Sr. Back-End Developer (Remote)".
+
+    Returns:
+        str: The normalized title, e.g. "senior backend engineer".
+    """
+    role = title.lower()
+    role = re.sub(r"\(.*?\)|\[.*?\]", " ", role)
+    role = re.split(r"\s[-|@]\s|,|\bat\b", role)[0]
+    role = role.replace(".", " ")
+    role = _ROLE_SYNONYM_PATTERN.sub(lambda match: ROLE_SYNONYMS[match.group(1)], role)
+    role = re.sub(r"[^a-z0-9+#/ ]", " ", role)
+    role = re.sub(r"\b(?:i{1,3}|iv|[1-4])\b", " ", role)
+    return " ".join(role.split())
+
+
+def extract_role_title(job_description: str) -> Optional[str]:
+    """
+    Guess the job title from a job description.
+
+    The first non-empty line is used, after stripping a leading "Title:" label.
+
+    Args:
+        job_description (str): The job description.
+
+    Returns:
+        Optional[str]: The job title, or None if the description is empty.
+    """
+    for line in job_description.splitlines():
+        line = _TITLE_PREFIX_PATTERN.sub("", line).strip()
+        if line:
+            return line[:120]
+    return None
@@ -0,0 +1,3 @@
+"""
+Worker processes and job queues for the Job Seeker AI Assistant.
+"""
\ No newline at end of file
@@ -0,0 +1,277 @@
+"""
+Job queue backends - Shared job tables with lease, heartbeat and retry semantics.
+"""
+
+import os
+import abc
+import json
+import time
+import uuid
+import sqlite3
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+DEAD = "dead"
+
+
+@dataclass
+class Job:
+    """
+    A unit of work in the queue.
+
+    Attributes:
+        id (str): Unique job id.
+        payload (Dict[str, Any]): Crew inputs, e.g. job_description and resume.
+        status (str): One of QUEUED, RUNNING, DONE or DEAD.
+        attempts (int): Number of times the job has been claimed.
+        max_attempts (int): Claims allowed before the job is dead-lettered.
+        lease_owner (Optional[str]): Worker holding the lease while RUNNING.
+        lease_expires (Optional[float]): Epoch seconds at which the lease lapses.
+        result (Optional[str]): Crew output once DONE.
+        result_path (Optional[str]): Where the result was written in the results store.
+        error (Optional[str]): Last error message.
+    """
+    id: str
+    payload: Dict[str, Any]
+    status: str = QUEUED
+    attempts: int = 0
+    max_attempts: int = 3
+    lease_owner: Optional[str] = None
+    lease_expires: Optional[float] = None
+    result: Optional[str] = None
+    result_path: Optional[str] = None
+    error: Optional[str] = None
+
+
+class JobQueueBackend(abc.ABC):
+    """
+    Interface for shared job queues.
+
+    A claimed job is leased to one worker. The worker must renew the lease with
+    heartbeat() while it runs; a job whose lease lapses is handed to another worker,
+    or dead-lettered once it has used up its attempts.
+    """
+
+    @abc.abstractmethod
+    def enqueue(self, payload: Dict[str, Any], max_attempts: int = 3, job_id: Optional[str] = None) -> str:
+        """
+        Add a job to the queue and return its id.
+        """
+
+    @abc.abstractmethod
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        """
+        Lease the oldest available job to a worker, or return None if there is none.
+        """
+
+    @abc.abstractmethod
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """
+        Extend a lease. Returns False if the worker no longer holds it.
+        """
+
+    @abc.abstractmethod
+    def complete(self, job_id: str, worker_id: str, result: str, result_path: Optional[str] = None) -> bool:
+        """
+        Mark a leased job as done with its result. Returns False if the lease was lost.
+        """
+
+    @abc.abstractmethod
+    def fail(self, job_id: str, worker_id: str, error: str, retry_delay: float = 0.0, permanent: bool = False) -> bool:
+        """
+        Record a failed attempt, requeueing or dead-lettering the job. Permanent failures are
+        dead-lettered without using up the remaining attempts. Returns False if the lease was lost.
+        """
+
+    @abc.abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Fetch a job by id.
+        """
+
+    @abc.abstractmethod
+    def list_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Job]:
+        """
+        List jobs, optionally filtered by status (e.g. DEAD for the dead-letter queue).
+        """
+
+
+class SQLiteJobQueue(JobQueueBackend):
+    """
+    Job queue stored in a SQLite file that any number of worker processes can share.
+
+    Claims run in an IMMEDIATE transaction, so two workers can never lease the same job.
+    WAL mode lets readers proceed while a claim is written, but it needs shared memory
+    and therefore only works for processes on one host. When the file sits on network
+    storage shared by several nodes, use ``journal_mode="DELETE"`` so SQLite falls back
+    to file locking.
+    """
+
+    def __init__(self, path: str, journal_mode: str = "WAL", busy_timeout: float = 30.0):
+        """
+        Initialize the queue, creating the job table if needed.
+
+        Args:
+            path (str): Path to the SQLite database file.
+            journal_mode (str): SQLite journal mode. Defaults to "WAL".
+            busy_timeout (float): Seconds to wait for a lock held by another process.
+        """
+        self.path = path
+        self.journal_mode = journal_mode
+        self.busy_timeout = busy_timeout
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute(f"PRAGMA journal_mode={journal_mode}")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    lease_owner TEXT,
+                    lease_expires REAL,
+                    available_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    result TEXT,
+                    result_path TEXT,
+                    error TEXT
+                )
+                """
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS jobs_status_available ON jobs (status, available_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One connection per operation keeps the queue safe to use from heartbeat threads.
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Job:
+        return Job(
+            id=row["id"],
+            payload=json.loads(row["payload"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            lease_owner=row["lease_owner"],
+            lease_expires=row["lease_expires"],
+            result=row["result"],
+            result_path=row["result_path"],
+            error=row["error"],
+        )
+
+    def enqueue(self, payload: Dict[str, Any], max_attempts: int = 3, job_id: Optional[str] = None) -> str:
+        job_id = job_id or uuid.uuid4().hex
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT INTO jobs (id, payload, status, max_attempts, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, json.dumps(payload), QUEUED, max_attempts, now, now, now)
+            )
+        return job_id
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        now = time.time()
+        with self._transaction() as connection:
+            dead = connection.execute(
+                "UPDATE jobs SET status = ?, lease_owner = NULL, error = 'lease expired', updated_at = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                (DEAD, now, RUNNING, now)
+            ).rowcount
+            if dead:
+                logger.warning(f"Dead-lettered {dead} job(s) whose final lease expired")
+
+            row = connection.execute(
+                "SELECT id FROM jobs "
+                "WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires < ?) "
+                "ORDER BY created_at LIMIT 1",
+                (QUEUED, now, RUNNING, now)
+            ).fetchone()
+            if row is None:
+                return None
+
+            connection.execute(
+                "UPDATE jobs SET status = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE id = ?",
+                (RUNNING, worker_id, now + lease_seconds, now, row["id"])
+            )
+            claimed = connection.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+        return self._to_job(claimed)
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        now = time.time()
+        with self._transaction() as connection:
+            updated = connection.execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (now + lease_seconds, now, job_id, RUNNING, worker_id)
+            ).rowcount
+        return updated == 1
+
+    def complete(self, job_id: str, worker_id: str, result: str, result_path: Optional[str] = None) -> bool:
+        with self._transaction() as connection:
+            updated = connection.execute(
+                "UPDATE jobs SET status = ?, result = ?, result_path = ?, lease_owner = NULL, "
+                "lease_expires = NULL, error = NULL, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (DONE, result, result_path, time.time(), job_id, RUNNING, worker_id)
+            ).rowcount
+        return updated == 1
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry_delay: float = 0.0, permanent: bool = False) -> bool:
+        now = time.time()
+        with self._transaction() as connection:
+            updated = connection.execute(
+                "UPDATE jobs SET "
+                "status = CASE WHEN ? OR attempts >= max_attempts THEN ? ELSE ? END, "
+                "available_at = ?, error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (permanent, DEAD, QUEUED, now + retry_delay, error, now, job_id, RUNNING, worker_id)
+            ).rowcount
+        return updated == 1
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._connect() as connection:
+            row = connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Job]:
+        with self._connect() as connection:
+            if status:
+                rows = connection.execute(
+                    "SELECT * FROM jobs WHERE status = ? ORDER BY created_at LIMIT ?", (status, limit)
+                ).fetchall()
+            else:
+                rows = connection.execute("SELECT * FROM jobs ORDER BY created_at LIMIT ?", (limit,)).fetchall()
+        return [self._to_job(row) for row in rows]
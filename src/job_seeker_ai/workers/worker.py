@@ -0,0 +1,152 @@
+"""
+Queue worker - Pulls jobs from a shared queue and runs them with a lease heartbeat.
+"""
+
+import os
+import uuid
+import socket
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from job_seeker_ai.utils.helpers import save_result
+from job_seeker_ai.workers.job_queue import Job, JobQueueBackend
+
+logger = logging.getLogger(__name__)
+
+
+class PermanentJobError(Exception):
+    """
+    Raised by a job handler when retrying cannot help, e.g. for an invalid payload.
+    The job is dead-lettered immediately.
+    """
+
+
+class Worker:
+    """
+    Runs jobs from a shared queue, one at a time.
+
+    While a job runs, a background thread renews its lease every ``heartbeat_interval``
+    seconds. If the worker dies, the lease lapses and another worker picks the job up.
+    Failed jobs are retried with exponential backoff until they run out of attempts and
+    are dead-lettered by the queue. Jobs whose handler raises PermanentJobError are
+    dead-lettered straight away.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueueBackend,
+        handler: Callable[[Dict[str, Any]], str],
+        worker_id: Optional[str] = None,
+        lease_seconds: float = 120.0,
+        heartbeat_interval: Optional[float] = None,
+        poll_interval: float = 2.0,
+        retry_delay: float = 10.0,
+        results_dir: Optional[str] = None
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            queue (JobQueueBackend): The shared queue.
+            handler (Callable[[Dict[str, Any]], str]): Runs a job payload and returns its result.
+            worker_id (Optional[str]): Unique worker id. Defaults to host, pid and a random suffix.
+            lease_seconds (float): Length of each lease.
+            heartbeat_interval (Optional[float]): Seconds between lease renewals. Defaults to a third of the lease.
+            poll_interval (float): Seconds to wait when the queue is empty.
+            retry_delay (float): Base delay before a failed job is retried. Doubles with each attempt.
+            results_dir (Optional[str]): Directory results are written to as ``<job_id>.txt``. Defaults to None.
+        """
+        self.queue = queue
+        self.handler = handler
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval or lease_seconds / 3
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.results_dir = results_dir
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """
+        Ask the worker to stop after the current job.
+        """
+        self._stop.set()
+
+    def _heartbeat(self, job: Job, done: threading.Event, lost: threading.Event) -> None:
+        while not done.wait(self.heartbeat_interval):
+            try:
+                if not self.queue.heartbeat(job.id, self.worker_id, self.lease_seconds):
+                    logger.warning(f"Worker {self.worker_id} lost the lease on job {job.id}")
+                    lost.set()
+                    return
+            except Exception as e:
+                logger.error(f"Heartbeat for job {job.id} failed: {e}")
+
+    def process(self, job: Job) -> bool:
+        """
+        Run one claimed job and report its outcome to the queue.
+
+        Args:
+            job (Job): The claimed job.
+
+        Returns:
+            bool: True if the job completed successfully, False otherwise.
+        """
+        done, lost = threading.Event(), threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job, done, lost), daemon=True)
+        heartbeat.start()
+
+        try:
+            result = str(self.handler(job.payload))
+        except PermanentJobError as e:
+            logger.error(f"Job {job.id} failed permanently: {e}")
+            done.set()
+            heartbeat.join()
+            self.queue.fail(job.id, self.worker_id, str(e), permanent=True)
+            return False
+        except Exception as e:
+            logger.error(f"Job {job.id} failed on attempt {job.attempts}: {e}")
+            done.set()
+            heartbeat.join()
+            self.queue.fail(job.id, self.worker_id, str(e), self.retry_delay * 2 ** (job.attempts - 1))
+            return False
+
+        done.set()
+        heartbeat.join()
+        if lost.is_set():
+            logger.warning(f"Discarding result of job {job.id}; its lease was taken over")
+            return False
+
+        result_path = None
+        if self.results_dir:
+            result_path = os.path.join(self.results_dir, f"{job.id}.txt")
+            if not save_result(result, result_path):
+                result_path = None
+
+        return self.queue.complete(job.id, self.worker_id, result, result_path)
+
+    def run(self, max_jobs: Optional[int] = None) -> int:
+        """
+        Pull and run jobs until stopped.
+
+        Args:
+            max_jobs (Optional[int]): Stop after this many jobs. Defaults to None (run until stop()).
+
+        Returns:
+            int: Number of jobs processed.
+        """
+        processed = 0
+        logger.info(f"Worker {self.worker_id} started")
+        while not self._stop.is_set() and (max_jobs is None or processed < max_jobs):
+            job = self.queue.claim(self.worker_id, self.lease_seconds)
+            if job is None:
+                self._stop.wait(self.poll_interval)
+                continue
+
+            logger.info(f"Worker {self.worker_id} claimed job {job.id} (attempt {job.attempts})")
+            self.process(job)
+            processed += 1
+
+        logger.info(f"Worker {self.worker_id} stopped after {processed} job(s)")
+        return processed
@@ -0,0 +1,233 @@
+"""
+Tests for the shared per-run blackboard.
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+from src.job_seeker_ai.agents.interview_prep_agent import InterviewPrepAgent
+from src.job_seeker_ai.agents.negotiation_agent import NegotiationAgent
+from src.job_seeker_ai.agents.skill_gap_agent import SkillGapAgent
+from src.job_seeker_ai.utils.blackboard import Blackboard, JobRequirements
+
+
+JOB_DESCRIPTION = """Title: Senior Backend Engineer
+We need 5+ years of experience building services in Python with Kafka and AWS.
+
+Nice to have:
+Kubernetes and Terraform.
+"""
+
+RESUME = """Jane Doe
+Backend developer with 7 years of experience.
+
+SKILLS
+Python, Kubernetes, Domain-Driven Design
+
+EDUCATION
+BSc Computer Science
+"""
+
+
+def test_job_requirements_split_required_and_preferred():
+    """Test that skills after a nice-to-have heading are preferred, not required."""
+    # Act
+    requirements = JobRequirements.from_job_description(JOB_DESCRIPTION)
+
+    # Assert
+    assert requirements.title == "Senior Backend Engineer"
+    assert requirements.required_skills == ["python", "kafka", "aws"]
+    assert requirements.preferred_skills == ["kubernetes", "terraform"]
+    assert requirements.min_years_experience == 5
+
+
+def test_blackboard_matches_profile_against_requirements():
+    """Test that the blackboard derives strengths and gaps once for every agent."""
+    # Act
+    blackboard = Blackboard.build(JOB_DESCRIPTION, RESUME)
+    rendered = blackboard.render()
+
+    # Assert
+    assert "domain-driven design" in blackboard.candidate_profile.skills
+    assert blackboard.candidate_profile.years_experience == 7
+    assert blackboard.matched_skills == ["python", "kubernetes"]
+    assert blackboard.missing_skills == ["kafka", "aws"]
+    assert blackboard.missing_preferred_skills == ["terraform"]
+    assert "Missing required skills (gaps): kafka, aws" in rendered
+    assert "BSc Computer Science" in rendered
+
+
+JAVA_JOB_DESCRIPTION = """Title: Java Backend Developer
+Acme Bank is hiring a Java developer to build and run the services behind our online banking platform.
+You will design REST APIs, own the persistence layer and work with the platform team on deployments.
+
+Requirements:
+- 4+ years of Java
+- Spring Boot and Hibernate
+- Oracle database design and PL/SQL tuning
+- Experience with Kotlin for new services
+
+Nice to have:
+- Kafka
+
+About us:
+Acme Bank has served families and small businesses for more than 80 years. Our engineering
+organisation of 400 people builds the products that millions of customers use every day, and we
+invest in our people through mentoring, a yearly learning budget and internal mobility.
+
+Benefits:
+Competitive salary and annual bonus, 401(k) with a 6% match, medical, dental and vision cover from
+day one, 25 days of paid time off, paid parental leave and a hybrid schedule with two office days.
+
+Acme Bank is an equal opportunity employer. We welcome applicants of every background and provide
+reasonable accommodations throughout the hiring process; contact our recruiting team to request one.
+"""
+
+JAVA_RESUME = """Sam Lee
+Software engineer, 6 years building payment services at a fintech startup and a retail bank.
+Led the migration of a monolith to microservices, built REST APIs used by 2M customers and
+mentored four junior engineers. On call for the transaction platform.
+
+SKILLS
+Java, Spring Boot, PostgreSQL, Docker
+
+EDUCATION
+BSc Software Engineering
+"""
+
+JAVA_EXTRACTION = "Here is the analysis:\n```json\n" + json.dumps({
+    "title": "Java Backend Developer",
+    "required_skills": ["Java", "Spring Boot", "Hibernate", "Oracle", "Kotlin", "REST APIs"],
+    "preferred_skills": ["Kafka"],
+    "qualifications": [],
+    "responsibilities": ["Build online banking services", "Own the persistence layer"],
+    "min_years_experience": 4,
+    "candidate_skills": ["Java", "Spring Boot", "PostgreSQL", "Docker"],
+    "candidate_years_experience": 6,
+    "candidate_education": ["BSc Software Engineering"],
+    "candidate_experience": ["Migrated a monolith to microservices", "Built REST APIs for 2M customers"],
+    "matched_skills": ["Java", "Spring Boot", "REST APIs"],
+    "missing_skills": ["Hibernate", "Oracle", "Kotlin"],
+    "missing_preferred_skills": ["Kafka"],
+}) + "\n```"
+
+NURSE_JOB_DESCRIPTION = """Registered Nurse - ICU
+Provide direct care to critically ill adults in a 24-bed intensive care unit.
+Requirements: active RN license, BLS and ACLS certification, 2+ years of critical care experience,
+experience with ventilator management and titrating vasoactive drips.
+"""
+
+NURSE_RESUME = """Alex Kim
+Registered nurse with 3 years on a cardiac step-down unit.
+
+SKILLS
+Telemetry, BLS
+"""
+
+
+def test_extraction_keeps_requirements_keywords_miss():
+    """Test that the extracted analysis keeps frameworks the keyword table does not know."""
+    # Act
+    blackboard = Blackboard.from_extraction(JAVA_EXTRACTION)
+    rendered = blackboard.render()
+
+    # Assert
+    assert blackboard.extracted
+    assert blackboard.job_requirements.required_skills == [
+        "java", "spring boot", "hibernate", "oracle", "kotlin", "rest apis"
+    ]
+    assert blackboard.job_requirements.min_years_experience == 4
+    assert blackboard.candidate_profile.years_experience == 6
+    assert blackboard.missing_skills == ["Hibernate", "Oracle", "Kotlin"]
+    assert "Responsibilities: Build online banking services; Own the persistence layer" in rendered
+    assert "Keyword hints" not in rendered
+
+
+def test_extraction_without_json_is_rejected():
+    """Test that an extraction call that returned prose is rejected so the keyword analysis is kept."""
+    with pytest.raises(ValueError):
+        Blackboard.from_extraction("Sorry, I cannot help with that.")
+
+
+def test_keyword_analysis_is_marked_as_hints():
+    """Test that the keyword analysis of a non-technical posting is labelled as incomplete hints."""
+    # Act
+    blackboard = Blackboard.build(NURSE_JOB_DESCRIPTION, NURSE_RESUME)
+
+    # Assert
+    assert not blackboard.extracted
+    assert blackboard.render().lstrip().startswith("Keyword hints")
+
+
+@patch("src.job_seeker_ai.agents.skill_gap_agent.Agent.execute_task", side_effect=lambda task: task)
+def test_skill_gap_prompt_shrinks_and_keeps_requirements(mock_execute_task):
+    """Test that the extracted blackboard replaces the documents in a shorter skill gap prompt."""
+    # Arrange
+    agent = SkillGapAgent("Role", "Goal", [])
+    blackboard = Blackboard.from_extraction(JAVA_EXTRACTION)
+
+    # Act
+    full_prompt = agent.analyze_skill_gaps(JAVA_RESUME, JAVA_JOB_DESCRIPTION)
+    shared_prompt = agent.analyze_skill_gaps(JAVA_RESUME, JAVA_JOB_DESCRIPTION, blackboard=blackboard)
+
+    # Assert
+    assert len(shared_prompt) < len(full_prompt)
+    assert JAVA_JOB_DESCRIPTION.splitlines()[1] not in shared_prompt
+    for requirement in ("spring boot", "hibernate", "oracle", "kotlin"):
+        assert requirement in shared_prompt
+    assert "Missing required skills (gaps): Hibernate, Oracle, Kotlin" in shared_prompt
+
+
+@patch("src.job_seeker_ai.agents.interview_prep_agent.Agent.execute_task", side_effect=lambda task: task)
+def test_interview_prep_prompt_shrinks_and_keeps_requirements(mock_execute_task):
+    """Test that the extracted blackboard replaces the documents in a shorter interview prep prompt."""
+    # Arrange
+    agent = InterviewPrepAgent("Role", "Goal", [])
+    blackboard = Blackboard.from_extraction(JAVA_EXTRACTION)
+
+    # Act
+    full_prompt = agent.generate_interview_questions(JAVA_JOB_DESCRIPTION, JAVA_RESUME)
+    shared_prompt = agent.generate_interview_questions(JAVA_JOB_DESCRIPTION, JAVA_RESUME, blackboard=blackboard)
+
+    # Assert
+    assert len(shared_prompt) < len(full_prompt)
+    assert JAVA_RESUME.splitlines()[1] not in shared_prompt
+    assert JAVA_JOB_DESCRIPTION.splitlines()[1] not in shared_prompt
+    for requirement in ("spring boot", "hibernate", "oracle", "kotlin"):
+        assert requirement in shared_prompt
+
+
+@patch("src.job_seeker_ai.agents.negotiation_agent.Agent.execute_task", side_effect=lambda task: task)
+def test_offer_evaluation_uses_requirements_and_gaps(mock_execute_task):
+    """Test that the extracted blackboard replaces the documents in a shorter offer evaluation prompt."""
+    # Arrange
+    agent = NegotiationAgent("Role", "Goal", [])
+    blackboard = Blackboard.from_extraction(JAVA_EXTRACTION)
+    offer = "Base salary $140k, 10% bonus, 25 days PTO."
+
+    # Act
+    full_prompt = agent.evaluate_job_offer(offer, JAVA_RESUME, JAVA_JOB_DESCRIPTION)
+    shared_prompt = agent.evaluate_job_offer(offer, JAVA_RESUME, JAVA_JOB_DESCRIPTION, blackboard=blackboard)
+
+    # Assert
+    assert len(shared_prompt) < len(full_prompt)
+    assert offer in shared_prompt
+    assert JAVA_RESUME.splitlines()[1] not in shared_prompt
+    assert JAVA_JOB_DESCRIPTION.splitlines()[1] not in shared_prompt
+    assert "Missing required skills (gaps): Hibernate, Oracle, Kotlin" in shared_prompt
+
+
+@patch("src.job_seeker_ai.agents.skill_gap_agent.Agent.execute_task", side_effect=lambda task: task)
+def test_keyword_blackboard_keeps_full_documents(mock_execute_task):
+    """Test that without an extraction the skill gap prompt keeps the job description and resume."""
+    # Arrange
+    agent = SkillGapAgent("Role", "Goal", [])
+    blackboard = Blackboard.build(NURSE_JOB_DESCRIPTION, NURSE_RESUME)
+
+    # Act
+    prompt = agent.analyze_skill_gaps(NURSE_RESUME, NURSE_JOB_DESCRIPTION, blackboard=blackboard)
+
+    # Assert
+    assert "titrating vasoactive drips" in prompt
+    assert "cardiac step-down unit" in prompt
+    assert "Keyword hints" in prompt
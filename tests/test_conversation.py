@@ -0,0 +1,44 @@
+"""
+Tests for the rolling conversation context.
+"""
+
+from src.job_seeker_ai.utils.conversation import RollingContext, first_sentence, truncate
+
+
+def test_truncate_and_first_sentence():
+    """Test the text helpers used to compact turns."""
+    assert truncate("a   b c", 10) == "a b c"
+    assert truncate("x" * 20, 10) == "xxxxxxx..."
+    assert first_sentence("Good structure. Add metrics next time.") == "Good structure."
+
+
+def test_older_turns_are_digested():
+    """Test that turns beyond the recent window are folded into one-line digests."""
+    # Arrange
+    context = RollingContext(max_recent_turns=2)
+
+    # Act
+    for index in range(3):
+        context.add_turn(f"Question {index}?", f"Answer {index}", f"Feedback {index}. More detail.")
+    rendered = context.render()
+
+    # Assert
+    assert context.turn_count == 3
+    assert context.digests == ["- Q: Question 0? | Feedback: Feedback 0."]
+    assert "Answer 0" not in rendered
+    assert "Question: Question 2?\nAnswer: Answer 2" in rendered
+
+
+def test_oldest_digests_are_dropped_over_budget():
+    """Test that digests beyond the summary budget are dropped and counted."""
+    # Arrange
+    context = RollingContext(max_recent_turns=1, max_summary_chars=200)
+
+    # Act
+    for index in range(10):
+        context.add_turn(f"Question {index}?", "Answer", "Feedback. " + "x" * 100)
+
+    # Assert
+    assert sum(len(digest) + 1 for digest in context.digests) <= 200
+    assert context.dropped_turns + len(context.digests) + len(context.recent) == 10
+    assert f"({context.dropped_turns} earlier questions already covered)" in context.render()
@@ -0,0 +1,196 @@
+"""
+Tests for deadline-aware stage execution.
+"""
+
+import threading
+import pytest
+from src.job_seeker_ai.utils.deadline import (
+    Deadline,
+    PipelineResult,
+    Stage,
+    StageCancelled,
+    check_cancelled,
+    format_pipeline_result,
+    run_stages,
+)
+
+
+class FakeClock:
+    """A clock that only moves when a stage advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def run_probed(offset):
+    """
+    Run three stages on a 100s fake-clock budget, each with degrade_below set `offset`
+    seconds above the timeout it is expected to get, and return the degraded stages.
+    """
+    clock = FakeClock()
+    expected = {"a": 25.0, "b": 95.0 * 2 / 3, "c": 85.0}
+
+    def stage(name, seconds, weight=1.0):
+        def run(degraded, cancel):
+            clock.advance(seconds)
+            return name
+        return Stage(name, run, weight=weight, degrade_below=expected[name] + offset)
+
+    stages = [stage("a", 5.0), stage("b", 10.0, weight=2.0), stage("c", 0.0)]
+    result = run_stages(stages, Deadline(100.0, clock=clock))
+    assert list(result.outputs) == ["a", "b", "c"]
+    return result.degraded
+
+
+def test_timeouts_are_weight_proportional_and_roll_forward():
+    """Test that each stage's timeout is its weight's share of the time left when it starts."""
+    # Arrange / Act
+    # "a" gets a quarter of 100s and uses 5s, so "b" gets two thirds of the 95s left
+    # rather than half of the original budget, and "c" gets everything that remains.
+    just_above = run_probed(0.01)
+    just_below = run_probed(-0.01)
+
+    # Assert
+    assert just_above == ["a", "b", "c"]
+    assert just_below == []
+
+
+def test_degrade_below_selects_cheaper_path():
+    """Test that a stage whose share is below degrade_below runs its cheaper path."""
+    # Arrange
+    clock = FakeClock()
+    deadline = Deadline(40.0, clock=clock)
+    seen = {}
+
+    def run(degraded, cancel):
+        seen["degraded"] = degraded
+        return "ok"
+
+    def first(degraded, cancel):
+        clock.advance(20.0)
+        return "ok"
+
+    # "search" starts with 20s left, below its 30s threshold.
+    stages = [Stage("first", first), Stage("search", run, weight=2.0, degrade_below=30.0)]
+
+    # Act
+    result = run_stages(stages, deadline)
+
+    # Assert
+    assert seen["degraded"] is True
+    assert result.degraded == ["search"]
+    assert result.outputs["search"] == "ok"
+    assert not result.partial
+
+
+def test_exhausted_budget_skips_remaining_stages():
+    """Test that stages after the budget runs out are skipped and the result is partial."""
+    # Arrange
+    clock = FakeClock()
+    deadline = Deadline(10.0, clock=clock)
+
+    def slow(degraded, cancel):
+        clock.advance(10.0)
+        return "done"
+
+    stages = [Stage("a", slow, weight=100.0), Stage("b", slow), Stage("c", slow)]
+
+    # Act
+    result = run_stages(stages, deadline)
+
+    # Assert
+    assert result.outputs == {"a": "done"}
+    assert result.skipped == ["b", "c"]
+    assert result.partial
+
+
+def test_failed_stage_is_recorded_and_later_stages_run():
+    """Test that a failing stage is reported and does not stop the pipeline."""
+    # Arrange
+    def fail(degraded, cancel):
+        raise RuntimeError("model unavailable")
+
+    stages = [Stage("a", fail), Stage("b", lambda degraded, cancel: "b output")]
+
+    # Act
+    result = run_stages(stages, Deadline(10.0))
+
+    # Assert
+    assert result.failed == {"a": "model unavailable"}
+    assert result.outputs == {"b": "b output"}
+    assert result.partial
+
+
+def test_timed_out_stage_is_cancelled():
+    """Test that an overrunning stage is marked timed out and its cancel event is set."""
+    # Arrange
+    cancelled = threading.Event()
+
+    def hang(degraded, cancel):
+        if cancel.wait(timeout=5.0):
+            cancelled.set()
+        check_cancelled(cancel)
+        return "too late"
+
+    stages = [Stage("hang", hang)]
+
+    # Act
+    result = run_stages(stages, Deadline(0.05))
+
+    # Assert
+    assert result.timed_out == ["hang"]
+    assert "hang" not in result.outputs
+    assert result.partial
+    assert cancelled.wait(timeout=1.0)
+
+
+def test_check_cancelled_raises_only_when_set():
+    """Test that check_cancelled raises StageCancelled once the event is set."""
+    # Arrange
+    cancel = threading.Event()
+
+    # Act
+    check_cancelled(cancel)
+    cancel.set()
+
+    # Assert
+    with pytest.raises(StageCancelled):
+        check_cancelled(cancel)
+
+
+def test_format_pipeline_result_notes_missing_stages():
+    """Test that formatted output uses titles and lists every missing stage."""
+    # Arrange
+    result = PipelineResult(
+        outputs={"resume": "Better resume"},
+        timed_out=["job_search"],
+        skipped=["interview_prep"],
+        failed={"skill_gaps": "boom"},
+        elapsed_seconds=12.34
+    )
+    titles = {"resume": "Optimized Resume", "job_search": "Job Opportunities"}
+
+    # Act
+    text = format_pipeline_result(result, titles)
+
+    # Assert
+    assert text.startswith("--- Optimized Resume ---\nBetter resume")
+    assert "[Partial result after 12.3s: Job Opportunities, interview_prep, skill_gaps did not complete]" in text
+
+
+def test_format_pipeline_result_complete():
+    """Test that a complete result has no partial note."""
+    # Arrange
+    result = PipelineResult(outputs={"a": "A", "b": "B"})
+
+    # Act
+    text = format_pipeline_result(result)
+
+    # Assert
+    assert text == "--- a ---\nA\n\n--- b ---\nB"
@@ -0,0 +1,49 @@
+"""
+Tests for near-duplicate posting detection.
+"""
+
+import pytest
+from src.job_seeker_ai.utils.dedup import PostingDeduplicator
+
+
+POSTING = (
+    "Senior Backend Engineer at Acme Corp. Remote. We build distributed payment systems in Python. "
+    "Responsibilities include designing APIs, owning services end to end, mentoring engineers and "
+    "improving reliability. Requirements: 5+ years experience, Kafka, AWS, PostgreSQL. "
+    "Salary $150k-$180k plus equity."
+)
+CROSS_POST = POSTING.replace("Remote.", "Remote (US).") + " Apply via LinkedIn."
+OTHER_POSTING = (
+    "Data Analyst at Foo Inc. Build dashboards in Tableau, write SQL and partner with finance "
+    "on forecasting. 2+ years experience required."
+)
+
+
+def test_deduplicate_collapses_cross_posts():
+    """Test that a cross-posted job is collapsed into the first copy."""
+    # Arrange
+    deduplicator = PostingDeduplicator()
+
+    # Act
+    result = deduplicator.deduplicate([POSTING, CROSS_POST, OTHER_POSTING])
+
+    # Assert
+    assert result.unique == [POSTING, OTHER_POSTING]
+    assert result.duplicates == {1: 0}
+    assert result.previously_seen == []
+
+
+def test_index_persists_across_runs(tmp_path):
+    """Test that postings indexed in an earlier run are recognized after reloading."""
+    # Arrange
+    path = str(tmp_path / "dedup_index.json")
+    first_run = PostingDeduplicator(path)
+    first_run.deduplicate([POSTING])
+    first_run.save()
+
+    # Act
+    result = PostingDeduplicator(path).deduplicate([CROSS_POST, OTHER_POSTING])
+
+    # Assert
+    assert result.unique == [OTHER_POSTING]
+    assert result.previously_seen == [0]
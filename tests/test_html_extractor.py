@@ -0,0 +1,155 @@
+"""
+Tests for the streaming HTML extractor.
+"""
+
+import os
+import pytest
+from src.job_seeker_ai.tools.html_extractor import clean_scraped_page, extract_posting
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "pages")
+
+
+def read_chunks(name, chunk_size=4096):
+    """Stream a fixture page in binary chunks."""
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def test_extract_posting_strips_boilerplate():
+    """Test that navigation, scripts and related jobs are removed."""
+    # Act
+    posting = extract_posting(read_chunks("acme_backend_engineer.html"))
+
+    # Assert
+    assert "Design, build and operate high-throughput services" in posting.text
+    assert "cookies" not in posting.text
+    assert "Similar jobs" not in posting.text
+    assert "function" not in posting.text
+    assert posting.reduction > 0.95
+
+
+def test_extract_posting_fields_from_json_ld():
+    """Test structured fields taken from JobPosting JSON-LD."""
+    # Act
+    posting = extract_posting(read_chunks("acme_backend_engineer.html"))
+
+    # Assert
+    assert posting.title == "Senior Backend Engineer, Payments"
+    assert posting.location == "New York, NY, US"
+    assert posting.salary == "USD 165000-205000 per year"
+
+
+def test_extract_posting_fields_from_text():
+    """Test structured fields found in the posting text when there is no JSON-LD."""
+    # Act
+    posting = extract_posting(read_chunks("globex_data_analyst.html"))
+
+    # Assert
+    assert posting.title == "Data Analyst"
+    assert posting.location == "Austin, TX (Hybrid)"
+    assert posting.salary == "$75k - $95k a year"
+
+
+def test_clean_scraped_page_passes_through_plain_text():
+    """Test that non-HTML scraper output is left unchanged."""
+    # Act
+    result = clean_scraped_page("Already plain text")
+
+    # Assert
+    assert result == "Already plain text"
+
+
+POSTING_BODY = (
+    "<h1>Registered Nurse, ICU</h1>"
+    "<p>Provide direct patient care in a 24-bed intensive care unit, working with physicians "
+    "and respiratory therapists on ventilated and post-surgical patients.</p>"
+    "<p>Requirements: active RN license, BLS and ACLS certification, two years of critical care experience.</p>"
+)
+
+
+@pytest.mark.parametrize("page", [
+    f'<html><body class="page has-sidebar">{POSTING_BODY}</body></html>',
+    f'<html><body><div class="job-description ads-free">{POSTING_BODY}</div></body></html>',
+    f'<html><body><form action="/apply">{POSTING_BODY}<button>Apply</button></form></body></html>',
+])
+def test_extract_posting_keeps_content_in_misleading_containers(page):
+    """Test that a posting inside a container whose class or tag looks like boilerplate is kept."""
+    # Act
+    posting = extract_posting(page)
+
+    # Assert
+    assert posting.title == "Registered Nurse, ICU"
+    assert "intensive care unit" in posting.text
+    assert "ACLS certification" in posting.text
+    assert "Apply" not in posting.text
+
+
+def test_extract_posting_drops_sidebar_next_to_content():
+    """Test that a boilerplate-looking container without the main content is still dropped."""
+    # Arrange
+    page = (
+        '<html><body class="has-sidebar"><main>' + POSTING_BODY + '</main>'
+        '<div class="sidebar"><p>Trending: 10 tips for your next interview</p></div>'
+        '<p>Posted 3 days ago by <span class="share">Share this job on every network</span> the hiring team</p>'
+        '</body></html>'
+    )
+
+    # Act
+    posting = extract_posting(page)
+
+    # Assert
+    assert "intensive care unit" in posting.text
+    assert "Trending" not in posting.text
+    assert "Share this job" not in posting.text
+    assert "Posted 3 days ago by the hiring team" in posting.text
+
+
+def test_clean_scraped_page_falls_back_to_page_text():
+    """Test that the full page text is returned when extraction leaves almost nothing."""
+    # Arrange
+    page = (
+        '<html><body><div class="modal-content">' + POSTING_BODY + '</div>'
+        '<script>var tracking = true;</script></body></html>'
+    ).replace("<h1>", "<h2>").replace("</h1>", "</h2>")
+
+    # Act
+    result = clean_scraped_page(page)
+
+    # Assert
+    assert "intensive care unit" in result
+    assert "tracking" not in result
+
+
+@pytest.mark.parametrize("name", sorted(os.listdir(FIXTURE_DIR)))
+@pytest.mark.parametrize("chunk_size", [7, 512, 1024])
+def test_chunked_extraction_matches_whole_page(name, chunk_size):
+    """Test that small chunks, which split words and characters, give the same result as the whole page."""
+    # Arrange
+    whole = extract_posting(b"".join(read_chunks(name)))
+
+    # Act
+    chunked = extract_posting(read_chunks(name, chunk_size))
+
+    # Assert
+    assert chunked.text == whole.text
+    assert (chunked.title, chunked.location, chunked.salary) == (whole.title, whole.location, whole.salary)
+
+
+def test_words_split_across_chunks_are_rejoined():
+    """Test that a word or multi-byte character cut at a chunk boundary is not split in the output."""
+    # Arrange
+    page = "<p>Salary: $100k - $120k a year</p><p>Location: Café District</p>".encode("utf-8")
+    split_at = page.index("é".encode("utf-8")) + 1
+
+    # Act
+    posting = extract_posting([page[:7], page[7:split_at], page[split_at:]])
+
+    # Assert
+    assert posting.text == "Salary: $100k - $120k a year\nLocation: Café District"
+    assert posting.salary == "$100k - $120k a year"
+    assert posting.location == "Café District"
@@ -0,0 +1,80 @@
+"""
+Tests for bounded-memory file ingestion.
+"""
+
+import codecs
+import pytest
+from src.job_seeker_ai.utils.ingestion import (
+    BinaryFileError,
+    ChunkedTextReader,
+    FileTooLargeError,
+    compact_text,
+    read_text,
+)
+
+
+def test_read_text_detects_encodings(tmp_path):
+    """Test that BOM-marked UTF-16 and legacy Windows-1252 files are decoded."""
+    # Arrange
+    utf16_path = tmp_path / "resume_utf16.txt"
+    utf16_path.write_bytes(codecs.BOM_UTF16_LE + "Résumé\nPython".encode("utf-16-le"))
+    cp1252_path = tmp_path / "resume_cp1252.txt"
+    cp1252_path.write_bytes("Café manager – 5 years".encode("cp1252"))
+
+    # Act
+    utf16 = read_text(str(utf16_path))
+    cp1252 = read_text(str(cp1252_path))
+
+    # Assert
+    assert utf16.encoding == "utf-16"
+    assert utf16.text == "Résumé\nPython"
+    assert cp1252.encoding == "cp1252"
+    assert cp1252.text == "Café manager – 5 years"
+
+
+def test_multibyte_characters_split_across_chunks(tmp_path):
+    """Test that incremental decoding handles characters cut at chunk boundaries."""
+    # Arrange
+    path = tmp_path / "resume.txt"
+    path.write_text("é" * 50, encoding="utf-8")
+
+    # Act
+    chunks = list(ChunkedTextReader(str(path), chunk_size=7))
+
+    # Assert
+    assert "".join(chunks) == "é" * 50
+
+
+def test_size_limit_and_binary_files_are_rejected(tmp_path):
+    """Test that oversized and binary uploads fail fast."""
+    # Arrange
+    large = tmp_path / "portfolio.txt"
+    large.write_text("x" * 2048)
+    binary = tmp_path / "resume.pdf"
+    binary.write_bytes(b"%PDF-1.4\x00\x01\x02")
+
+    # Act / Assert
+    with pytest.raises(FileTooLargeError):
+        read_text(str(large), max_bytes=1024)
+    with pytest.raises(BinaryFileError):
+        read_text(str(binary))
+
+
+def test_compact_text_stops_reading_at_limit():
+    """Test that compaction normalizes whitespace and stops consuming chunks at the limit."""
+    # Arrange
+    consumed = []
+
+    def chunks():
+        for index in range(1000):
+            consumed.append(index)
+            yield f"Line   {index}\t\twith  spaces\r\n\n\n"
+
+    # Act
+    text, truncated = compact_text(chunks(), max_chars=100)
+
+    # Assert
+    assert truncated
+    assert len(text) <= 100
+    assert text.startswith("Line 0 with spaces\n\nLine 1 with spaces")
+    assert len(consumed) < 10
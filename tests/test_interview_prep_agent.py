@@ -0,0 +1,62 @@
+"""
+Tests for the Interview Prep Agent's mock interview session.
+"""
+
+import pytest
+from unittest.mock import patch
+from src.job_seeker_ai.agents.interview_prep_agent import InterviewPrepAgent
+
+
+def fake_llm(task):
+    """Answer each kind of prompt with realistically long output."""
+    if "condense the job description" in task:
+        return "Brief: senior backend role, Python and Kafka. " * 30
+    if "Ask question" in task:
+        return "Tell me about a time you scaled a service under load?"
+    return "Strong structure. " + "Add concrete metrics and trade-offs. " * 40
+
+
+@patch("src.job_seeker_ai.agents.interview_prep_agent.Agent.execute_task", side_effect=fake_llm)
+def test_prompt_size_stays_flat_over_twenty_turns(mock_execute_task):
+    """Test that per-turn prompts stop growing however long the session runs."""
+    # Arrange
+    agent = InterviewPrepAgent("Test Role", "Test Goal", [])
+    session = agent.start_mock_interview_session(
+        "Job description " * 500, "Resume " * 500, "system design", num_questions=20
+    )
+
+    # Act
+    while not session.finished:
+        session.ask_question()
+        session.submit_answer("I led the migration to event streaming. " * 30)
+
+    # Assert
+    feedback_prompts = [stat["prompt_chars"] for stat in session.turn_stats if stat["kind"] == "feedback"]
+    assert len(feedback_prompts) == 20
+    # Prompts grow while the rolling summary fills its budget, then stay flat.
+    assert max(feedback_prompts[-4:]) - min(feedback_prompts[-4:]) <= 50
+    # Brief + two verbatim turns + summary budget + question and answer, plus the instructions.
+    assert max(feedback_prompts) <= 1500 + 2 * 3 * 800 + 1200 + 2 * 2000 + 1000
+    # The full job description and resume are only sent once, for the brief.
+    assert sum("Job description Job description" in call[0][0] for call in mock_execute_task.call_args_list) == 1
+
+
+@patch("src.job_seeker_ai.agents.interview_prep_agent.Agent.execute_task", side_effect=fake_llm)
+def test_session_enforces_question_answer_order(mock_execute_task):
+    """Test that answers need a pending question and no questions are asked past the end."""
+    # Arrange
+    agent = InterviewPrepAgent("Test Role", "Test Goal", [])
+    session = agent.start_mock_interview_session("JD", "Resume", "behavioral", num_questions=1)
+
+    # Act / Assert
+    with pytest.raises(RuntimeError):
+        session.submit_answer("An answer without a question")
+
+    session.ask_question()
+    session.submit_answer("My answer")
+
+    with pytest.raises(RuntimeError):
+        session.submit_answer("A second answer to the same question")
+    assert session.finished
+    with pytest.raises(RuntimeError):
+        session.ask_question()
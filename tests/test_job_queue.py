@@ -0,0 +1,102 @@
+"""
+Tests for the SQLite job queue and queue worker.
+"""
+
+import time
+import pytest
+from src.job_seeker_ai.workers.job_queue import DEAD, DONE, QUEUED, SQLiteJobQueue
+from src.job_seeker_ai.workers.worker import PermanentJobError, Worker
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Create a queue backed by a temporary SQLite file."""
+    return SQLiteJobQueue(str(tmp_path / "jobs.sqlite3"))
+
+
+def test_claim_leases_job_to_one_worker(queue):
+    """Test that a claimed job is not handed to a second worker."""
+    # Arrange
+    job_id = queue.enqueue({"resume": "r", "job_description": "jd"})
+
+    # Act
+    first = queue.claim("worker-a", lease_seconds=60)
+    second = queue.claim("worker-b", lease_seconds=60)
+
+    # Assert
+    assert first.id == job_id
+    assert first.payload == {"resume": "r", "job_description": "jd"}
+    assert first.attempts == 1
+    assert second is None
+
+
+def test_expired_lease_is_reclaimed(queue):
+    """Test that a job whose lease lapsed is handed to another worker."""
+    # Arrange
+    job_id = queue.enqueue({"resume": "r"})
+    queue.claim("worker-a", lease_seconds=0.01)
+    time.sleep(0.02)
+
+    # Act
+    reclaimed = queue.claim("worker-b", lease_seconds=60)
+
+    # Assert
+    assert reclaimed.id == job_id
+    assert reclaimed.attempts == 2
+    assert queue.heartbeat(job_id, "worker-a", 60) is False
+    assert queue.heartbeat(job_id, "worker-b", 60) is True
+
+
+def test_failed_job_is_retried_then_dead_lettered(queue):
+    """Test retries and dead-lettering of a failing job."""
+    # Arrange
+    job_id = queue.enqueue({"resume": "r"}, max_attempts=2)
+
+    # Act
+    queue.fail(job_id, queue.claim("worker-a", 60).lease_owner, "boom")
+    after_first_failure = queue.get(job_id).status
+    queue.fail(job_id, queue.claim("worker-a", 60).lease_owner, "boom again")
+
+    # Assert
+    assert after_first_failure == QUEUED
+    assert queue.get(job_id).status == DEAD
+    assert [job.id for job in queue.list_jobs(DEAD)] == [job_id]
+    assert queue.claim("worker-a", 60) is None
+
+
+def test_worker_hands_result_to_results_store(queue, tmp_path):
+    """Test that a worker completes jobs and writes their results."""
+    # Arrange
+    job_id = queue.enqueue({"resume": "my resume"})
+    results_dir = tmp_path / "results"
+    worker = Worker(queue, handler=lambda payload: payload["resume"].upper(), results_dir=str(results_dir))
+
+    # Act
+    processed = worker.run(max_jobs=1)
+
+    # Assert
+    job = queue.get(job_id)
+    assert processed == 1
+    assert job.status == DONE
+    assert job.result == "MY RESUME"
+    assert (results_dir / f"{job_id}.txt").read_text() == "MY RESUME"
+
+
+def test_permanent_failure_is_dead_lettered_without_retry(queue):
+    """Test that a handler raising PermanentJobError dead-letters the job on its first attempt."""
+    # Arrange
+    job_id = queue.enqueue({"resume": ""}, max_attempts=3)
+
+    def handler(payload):
+        raise PermanentJobError("resume is empty")
+
+    worker = Worker(queue, handler=handler)
+
+    # Act
+    worker.run(max_jobs=1)
+
+    # Assert
+    job = queue.get(job_id)
+    assert job.status == DEAD
+    assert job.attempts == 1
+    assert job.error == "resume is empty"
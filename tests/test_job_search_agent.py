@@ -0,0 +1,51 @@
+"""
+Tests for the Job Search Agent.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from src.job_seeker_ai.agents.job_search_agent import JobSearchAgent
+
+
+@pytest.fixture
+def search_tool():
+    """Create a web search tool that records its calls."""
+    tool = Mock()
+    tool.name = "serper_dev_api"
+    return tool
+
+
+@pytest.mark.parametrize("use_web_search", [True, False])
+def test_find_job_opportunities_only_has_tools_with_web_search(search_tool, use_web_search):
+    """Test that the degraded search runs on an agent without tools and leaves the shared agent's tools alone."""
+    # Arrange
+    agent = JobSearchAgent("Test Role", "Test Goal", [search_tool])
+
+    def execute_task(executing_agent, task):
+        for tool in executing_agent.tools:
+            tool.run("backend jobs")
+        return "jobs"
+
+    # Act
+    with patch.object(JobSearchAgent, "execute_task", autospec=True, side_effect=execute_task):
+        result = agent.find_job_opportunities("my resume", "backend roles", use_web_search=use_web_search)
+
+    # Assert
+    assert result == "jobs"
+    assert search_tool.run.called is use_web_search
+    assert agent.tools == [search_tool]
+
+
+@patch('src.job_seeker_ai.agents.job_search_agent.Agent.execute_task')
+def test_find_job_opportunities_without_web_search_says_so(mock_execute_task):
+    """Test that the degraded prompt tells the agent to work from the provided postings."""
+    # Arrange
+    mock_execute_task.side_effect = lambda task: task
+    agent = JobSearchAgent("Test Role", "Test Goal", [])
+
+    # Act
+    task = agent.find_job_opportunities("my resume", "backend roles", postings=["Posting text"], use_web_search=False)
+
+    # Assert
+    assert "Do not use web search." in task
+    assert "Posting text" in task
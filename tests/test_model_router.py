@@ -0,0 +1,163 @@
+"""
+Tests for per-agent model tiering and routing.
+"""
+
+from types import SimpleNamespace
+import pytest
+from src.job_seeker_ai.utils.model_router import EXTRACTION, GENERATION, ModelRouter
+
+
+CONFIG = {
+    "models": {
+        "default_tier": "large",
+        "tiers": {
+            "fast": {"model": "small-model", "cost_per_1k_input_tokens": 0.001},
+            "large": {"model": "big-model", "cost_per_1k_input_tokens": 0.01},
+        },
+        "routing": [
+            {"task_type": EXTRACTION, "max_input_chars": 1000, "tier": "fast"},
+        ],
+    },
+    "resume_agent": {"role": "Resume", "goal": "Resumes", "model_tier": "large"},
+    "job_search_agent": {
+        "role": "Search",
+        "goal": "Jobs",
+        "model_tier": "fast",
+        "method_tiers": {"analyze_job_market": "large"},
+    },
+}
+
+
+class FakeAgent:
+    def __init__(self, role, goal, tools, llm=None):
+        self.role = role
+        self.goal = goal
+        self.tools = tools
+        self.llm = llm
+
+
+def make_router():
+    return ModelRouter.from_config(CONFIG, llm_factory=lambda tier: tier.name)
+
+
+def test_select_follows_precedence():
+    """Test that method tiers beat routing rules, which beat agent tiers."""
+    # Arrange
+    router = make_router()
+
+    # Act / Assert
+    assert router.select("job_search_agent", "analyze_job_market", "x" * 10, EXTRACTION) == "large"
+    assert router.select("resume_agent", "optimize_resume", "x" * 10, EXTRACTION) == "fast"
+    assert router.select("resume_agent", "optimize_resume", "x" * 5000, EXTRACTION) == "large"
+    assert router.select("job_search_agent", "find_job_opportunities", "x", GENERATION) == "fast"
+    assert router.select("negotiation_agent", "evaluate_job_offer", "x", GENERATION) == "large"
+
+
+def test_call_runs_on_a_routed_copy_and_reports_usage():
+    """Test that a call runs on a copy of the agent with the routed model and records cost."""
+    # Arrange
+    router = make_router()
+    agent = FakeAgent("Resume", "Resumes", ["tool"], router.agent_llm("resume_agent"))
+    seen = []
+
+    # Act
+    output = router.call(
+        agent, "resume_agent", "extract_requirements",
+        lambda routed: seen.append(routed) or "done", "x" * 400, EXTRACTION
+    )
+    report = router.report()
+
+    # Assert
+    assert output == "done"
+    assert seen[0] is not agent
+    assert (seen[0].llm, seen[0].tools) == ("fast", ["tool"])
+    assert agent.llm == "large"
+    assert report["fast"]["calls"] == 1
+    assert report["fast"]["input_tokens"] == 100
+    assert report["fast"]["estimated_cost"] == pytest.approx(0.0001)
+
+
+def test_overlapping_calls_keep_their_own_models():
+    """Test that a call still running when another starts on the same agent keeps its model."""
+    # Arrange
+    router = make_router()
+    agent = FakeAgent("Resume", "Resumes", [], router.agent_llm("resume_agent"))
+    models = []
+
+    def abandoned(routed):
+        # A later call on the same agent starts and ends while this one is in flight.
+        router.call(agent, "resume_agent", "optimize_resume", lambda later: models.append(later.llm) or "", "x")
+        models.append(routed.llm)
+        return ""
+
+    # Act
+    router.call(agent, "resume_agent", "extract_requirements", abandoned, "x" * 400, EXTRACTION)
+
+    # Assert
+    assert models == ["large", "fast"]
+    assert agent.llm == "large"
+
+
+def test_unknown_tier_is_rejected():
+    """Test that configuring an undefined tier fails fast."""
+    # Arrange
+    config = dict(CONFIG, resume_agent={"role": "Resume", "goal": "Resumes", "model_tier": "huge"})
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        ModelRouter.from_config(config)
+
+
+def test_no_models_section_disables_routing():
+    """Test that configurations without model tiers keep the default model."""
+    assert ModelRouter.from_config({"resume_agent": {"role": "Resume"}}) is None
+
+
+class FakeChatModel:
+    """A model that accepts LangChain callbacks and reports provider token usage."""
+
+    def __init__(self):
+        self.callbacks = None
+
+    def invoke(self, prompt):
+        run_id = object()
+        for handler in self.callbacks:
+            handler.on_llm_start({}, [prompt], run_id=run_id)
+        response = SimpleNamespace(
+            generations=[[SimpleNamespace(text="answer")]],
+            llm_output={"token_usage": {"prompt_tokens": 7, "completion_tokens": 3}}
+        )
+        for handler in self.callbacks:
+            handler.on_llm_end(response, run_id=run_id)
+        return "answer"
+
+
+def test_model_calls_are_recorded_outside_routed_calls():
+    """Test that a tier model records calls made directly, e.g. by a crew, with provider token counts."""
+    # Arrange
+    router = ModelRouter.from_config(CONFIG, llm_factory=lambda tier: FakeChatModel())
+    llm = router.agent_llm("resume_agent")
+
+    # Act
+    llm.invoke("optimize this resume")
+    report = router.report()
+
+    # Assert
+    assert report["large"]["calls"] == 1
+    assert report["large"]["input_tokens"] == 7
+    assert report["large"]["output_tokens"] == 3
+
+
+def test_routed_call_is_not_recorded_twice():
+    """Test that a routed call whose model reports its own usage is recorded once."""
+    # Arrange
+    router = ModelRouter.from_config(CONFIG, llm_factory=lambda tier: FakeChatModel())
+    agent = FakeAgent("Resume", "Resumes", [], router.agent_llm("resume_agent"))
+
+    # Act
+    router.call(agent, "resume_agent", "optimize_resume", lambda routed: routed.llm.invoke("x" * 400), "x" * 400)
+    report = router.report()
+
+    # Assert
+    assert report["large"]["calls"] == 1
+    assert report["large"]["input_tokens"] == 7
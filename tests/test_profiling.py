@@ -0,0 +1,50 @@
+"""
+Tests for per-stage profiling.
+"""
+
+import os
+import re
+import time
+import pstats
+import pytest
+from src.job_seeker_ai.utils.profiling import StageProfiler
+
+
+def busy(seconds):
+    """Burn CPU so the sampler sees a stack."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(1000))
+
+
+def test_stage_profiler_writes_profile_stacks_and_report(tmp_path):
+    """Test that each stage gets a cProfile dump and shows up in the stacks and report."""
+    # Arrange
+    profiler = StageProfiler(str(tmp_path), sample_interval=0.001)
+
+    # Act
+    with profiler.stage("load_config"):
+        busy(0.05)
+    with pytest.raises(RuntimeError):
+        with profiler.stage("crew_kickoff"):
+            busy(0.05)
+            raise RuntimeError("LLM call failed")
+    output_dir = profiler.save()
+
+    # Assert
+    assert [stage.name for stage in profiler.stages] == ["load_config", "crew_kickoff"]
+    for name in ("load_config", "crew_kickoff"):
+        pstats.Stats(os.path.join(output_dir, f"{name}.prof"))
+
+    with open(os.path.join(output_dir, "stacks.collapsed"), encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    assert lines
+    # Collapsed format: "stage;thread;frame;...;frame count"
+    assert all(re.fullmatch(r"[^ ].*;.* \d+", line) for line in lines)
+    assert {line.split(";", 1)[0] for line in lines} == {"load_config", "crew_kickoff"}
+    assert any("busy (test_profiling.py" in line for line in lines)
+
+    with open(os.path.join(output_dir, "report.txt"), encoding="utf-8") as file:
+        report = file.read()
+    assert "load_config" in report and "crew_kickoff" in report
+    assert "top 25 by cumulative time" in report
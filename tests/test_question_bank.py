@@ -0,0 +1,100 @@
+"""
+Tests for the interview question bank.
+"""
+
+import random
+import time
+import pytest
+from src.job_seeker_ai.utils.question_bank import QuestionBank
+from src.job_seeker_ai.utils.skills import SKILL_ALIASES
+
+
+def test_lookup_matches_near_identical_role():
+    """Test that near-identical role titles share a cluster."""
+    # Arrange
+    bank = QuestionBank()
+    bank.add_questions(
+        "Senior Backend Engineer\nWe use Python, Kafka and AWS.",
+        ["How would you scale a Kafka consumer group?"]
+    )
+
+    # Act
+    questions = bank.lookup("Title: Sr. Back-End Developer (Remote)\nPython, AWS, Kafka required.")
+
+    # Assert
+    assert questions == ["How would you scale a Kafka consumer group?"]
+
+
+def test_lookup_misses_unrelated_role():
+    """Test that a different role does not reuse another cluster's questions."""
+    # Arrange
+    bank = QuestionBank()
+    bank.add_questions("Senior Backend Engineer\nPython, Kafka", ["Why Kafka over a database queue?"])
+
+    # Act
+    questions = bank.lookup("Product Manager\nAgile, stakeholder management")
+
+    # Assert
+    assert questions == []
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """Test that the bank persists across instances."""
+    # Arrange
+    path = str(tmp_path / "question_bank.json")
+    bank = QuestionBank(path)
+    bank.add_questions("Data Analyst\nSQL, Tableau", ["How do you validate a dashboard metric?"])
+
+    # Act
+    saved = bank.save()
+    reloaded = QuestionBank(path)
+
+    # Assert
+    assert saved is True
+    assert len(reloaded) == 1
+    assert reloaded.lookup("Data Analyst\nTableau and SQL") == ["How do you validate a dashboard metric?"]
+
+
+def test_lookup_is_fast_on_a_large_bank():
+    """Test that lookups stay under a millisecond with 5000 same-role clusters and a 5 KB description."""
+    # Arrange
+    rng = random.Random(0)
+    skills = sorted(SKILL_ALIASES)
+    bank = QuestionBank()
+    for i in range(5000):
+        bank.add_questions(f"Senior Backend Engineer\nWe use {', '.join(rng.sample(skills, 5))}", [f"Question {i}?"])
+    filler = "We are a fast-growing company that values ownership, collaboration and learning. " * 62
+    _, banked = bank.cluster_for(f"Senior Backend Engineer\nWe use {', '.join(rng.sample(skills, 5))}")
+    bank.add_questions(f"Senior Backend Engineer\nWe use {', '.join(banked)}", ["Banked question?"])
+    unbanked = next(skill for skill in skills if skill not in banked)
+    exact = f"Senior Backend Engineer\nWe use {', '.join(banked)}\n{filler}"
+    overlapping = f"Senior Backend Engineer\nWe use {', '.join(banked[:4] + [unbanked])}\n{filler}"
+
+    # Act
+    timings = {}
+    for name, job_description in (("exact", exact), ("overlapping", overlapping)):
+        start = time.perf_counter()
+        for _ in range(50):
+            questions = bank.lookup(job_description)
+        timings[name] = (time.perf_counter() - start) / 50
+        assert questions
+
+    # Assert
+    assert len(exact) > 5000
+    assert timings["exact"] < 0.001
+    assert timings["overlapping"] < 0.001
+
+
+def test_extract_questions():
+    """Test extraction of questions from generated text."""
+    # Arrange
+    text = "Technical Questions\n1. **How do you design an idempotent API?**\n- Why this matters: retries\n- Tell me about a time you led a migration?"
+
+    # Act
+    questions = QuestionBank.extract_questions(text)
+
+    # Assert
+    assert questions == [
+        "How do you design an idempotent API?",
+        "Tell me about a time you led a migration?"
+    ]
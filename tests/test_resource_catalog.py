@@ -0,0 +1,74 @@
+"""
+Tests for the local learning resource catalog.
+"""
+
+import json
+from src.job_seeker_ai.agents.skill_gap_agent import SkillGapAgent
+from src.job_seeker_ai.utils.resource_catalog import ResourceCatalog
+
+
+CATALOG = {
+    "fields": ["title", "kind", "url", "hours", "level"],
+    "skills": {
+        "kubernetes": [["Kubernetes Basics", "course", "https://kubernetes.io/docs/tutorials/", 6, "beginner"]],
+        "sql": [["SQLBolt", "course", "https://sqlbolt.com/", 6, "beginner"]],
+    },
+}
+
+
+def write_catalog(path):
+    path.write_text(json.dumps(CATALOG), encoding="utf-8")
+    return str(path)
+
+
+def test_catalog_is_loaded_on_first_lookup(tmp_path):
+    """Test that the catalog file is not read until the first lookup."""
+    # Arrange
+    path = tmp_path / "resources.json"
+    catalog = ResourceCatalog(str(path))
+
+    # Act
+    # The file only exists after construction, so an eager read would have found nothing.
+    write_catalog(path)
+    resources = catalog.lookup("kubernetes")
+
+    # Assert
+    assert [resource.title for resource in resources] == ["Kubernetes Basics"]
+
+
+def test_lookup_canonicalizes_aliases(tmp_path):
+    """Test that aliases resolve to the canonical skill's resources."""
+    # Arrange
+    catalog = ResourceCatalog(write_catalog(tmp_path / "resources.json"))
+
+    # Act / Assert
+    assert catalog.lookup("K8s") == catalog.lookup("kubernetes")
+    assert catalog.lookup("PostgreSQL") == catalog.lookup("sql")
+    assert catalog.lookup("cobol") == []
+
+
+def test_recommend_skips_uncovered_skills(tmp_path):
+    """Test that only skills with resources are recommended."""
+    # Arrange
+    catalog = ResourceCatalog(write_catalog(tmp_path / "resources.json"))
+
+    # Act
+    recommendations = catalog.recommend(["k8s", "cobol", "sql"])
+
+    # Assert
+    assert list(recommendations) == ["kubernetes", "sql"]
+
+
+def test_prefetched_section_lists_uncovered_skills_for_web_search(tmp_path):
+    """Test that the prompt section lists catalog resources and leaves the rest to web search."""
+    # Arrange
+    catalog = ResourceCatalog(write_catalog(tmp_path / "resources.json"))
+    agent = SkillGapAgent("Test Role", "Test Goal", [])
+
+    # Act
+    section = agent._prefetched_resources_section(["kubernetes", "kafka"], catalog)
+
+    # Assert
+    assert "Kubernetes Basics (course, beginner, ~6h)" in section
+    assert "for example: kafka" in section
+    assert agent._prefetched_resources_section(["kafka"], catalog) == ""
@@ -70,4 +70,35 @@ def test_optimize_resume_with_mock_tools():
         result = agent.optimize_resume("Sample resume", "Sample job description")
         
         # Assert
-        assert result == "Optimized resume with search data" 
\ No newline at end of file
+        assert result == "Optimized resume with search data" 
+
+@patch('src.job_seeker_ai.agents.resume_agent.Agent.execute_task', autospec=True)
+def test_optimize_resume_for_jobs(mock_execute_task):
+    """Test optimize_resume_for_jobs fan-out with a shared prompt prefix."""
+    # Arrange
+    mock_execute_task.side_effect = lambda agent, task: f"Optimized for {task.strip().splitlines()[-1].strip()}"
+    agent = ResumeAgent("Test Role", "Test Goal", [])
+    
+    resume = "SKILLS\nPython, SQL\n\nEXPERIENCE\nData Engineer at Acme"
+    job_descriptions = ["Job A", "Job B", "Job C"]
+    
+    # Act
+    fan_out = agent.optimize_resume_for_jobs(resume, job_descriptions, max_workers=2)
+    
+    # Assert
+    assert fan_out.results == ["Optimized for Job A", "Optimized for Job B", "Optimized for Job C"]
+    assert len(fan_out.latencies) == 3
+    assert fan_out.errors == {}
+    
+    # Verify that every prompt starts with the same prefix containing the resume
+    tasks = [call[0][1] for call in mock_execute_task.call_args_list]
+    prefix = tasks[0][:tasks[0].index("Job Description:")]
+    assert resume in prefix
+    assert all(task.startswith(prefix) for task in tasks)
+    # Two of the three prompts repeat the prefix, which is most of each prompt.
+    assert 0.5 < fan_out.shared_prefix_fraction < 2 / 3
+    
+    # Verify that concurrent requests never share the caller's agent instance
+    agents = [call[0][0] for call in mock_execute_task.call_args_list]
+    assert agents[0] is agent
+    assert all(other is not agent for other in agents[1:])
@@ -0,0 +1,199 @@
+"""
+Tests for incrementally refreshed saved searches.
+"""
+
+import json
+import pytest
+from src.job_seeker_ai.utils.dedup import posting_fingerprint
+from src.job_seeker_ai.utils.saved_searches import (
+    SavedSearch,
+    SavedSearchStore,
+    compute_delta,
+    parse_serper_results,
+    posting_key,
+    refresh_search,
+)
+
+
+BACKEND = {
+    "url": "https://jobs.example.com/1",
+    "title": "Senior Backend Engineer",
+    "text": (
+        "Senior Backend Engineer at Acme Corp. Remote. We build distributed payment systems in Python. "
+        "Responsibilities include designing APIs, owning services end to end, mentoring engineers and "
+        "improving reliability. Requirements: 5+ years experience, Kafka, AWS, PostgreSQL. "
+        "Salary $150k-$180k plus equity."
+    ),
+}
+BACKEND_CROSS_POST = {
+    "url": "https://board.example.org/acme-backend",
+    "title": "Senior Backend Engineer",
+    "text": BACKEND["text"].replace("Remote.", "Remote (US).") + " Apply via LinkedIn.",
+}
+ANALYST = {
+    "url": "https://jobs.example.com/2",
+    "title": "Data Analyst",
+    "text": "Data Analyst at Foo Inc. Build dashboards in Tableau, write SQL and partner with finance on forecasting.",
+}
+
+
+class FakeJobSearchAgent:
+    """Records the postings each summary was asked for."""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def find_job_opportunities(self, resume, job_preferences, postings=None, use_web_search=True):
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        self.calls.append({"postings": postings, "use_web_search": use_web_search})
+        return f"{len(postings)} postings summarized"
+
+
+@pytest.fixture
+def search():
+    """Create a saved search that has not run yet."""
+    return SavedSearch("search-a", "my resume", "backend roles")
+
+
+def test_posting_key_prefers_url_then_title():
+    """Test that postings are keyed by URL, falling back to a fingerprint of the title or text."""
+    # Arrange
+    untitled = {"text": "Some posting text"}
+
+    # Act / Assert
+    assert posting_key(BACKEND) == BACKEND["url"]
+    assert posting_key({"title": "Data Analyst", "text": "anything"}) == posting_fingerprint("Data Analyst")
+    assert posting_key(untitled) == posting_fingerprint("Some posting text")
+
+
+def test_compute_delta_splits_new_and_changed(search):
+    """Test that unseen postings are new, edited ones are changed and unchanged ones are dropped."""
+    # Arrange
+    search.seen[posting_key(BACKEND)] = posting_fingerprint(BACKEND["text"])
+    search.seen[posting_key(ANALYST)] = posting_fingerprint("an older version of the analyst posting")
+    extra = {"url": "https://jobs.example.com/3", "title": "SRE", "text": "Site Reliability Engineer"}
+
+    # Act
+    new, changed = compute_delta(search, [BACKEND, ANALYST, extra])
+
+    # Assert
+    assert new == [extra]
+    assert changed == [ANALYST]
+
+
+def test_parse_serper_results_accepts_json_strings():
+    """Test that organic results become postings and empty output yields none."""
+    # Arrange
+    raw = json.dumps({"organic": [{"link": "https://x.example/1", "title": "Engineer", "snippet": "Build things"}]})
+
+    # Act
+    postings = parse_serper_results(raw)
+
+    # Assert
+    assert postings == [{"url": "https://x.example/1", "title": "Engineer", "text": "Engineer\nBuild things"}]
+    assert parse_serper_results({}) == []
+
+
+@pytest.mark.parametrize("raw", ["not json", "[1, 2]"])
+def test_parse_serper_results_rejects_non_json_objects(raw):
+    """Test that output that is not a JSON object raises instead of looking like an empty search."""
+    # Act / Assert
+    with pytest.raises(ValueError):
+        parse_serper_results(raw)
+
+
+def test_failed_fetch_does_not_record_a_run(search):
+    """Test that a search whose fetch fails keeps no last run and is still due."""
+    # Arrange
+    agent = FakeJobSearchAgent()
+
+    # Act
+    with pytest.raises(ValueError):
+        refresh_search(search, agent, lambda saved: parse_serper_results("Error: rate limited"))
+
+    # Assert
+    assert search.last_run is None
+    assert search.is_due(now=0.0)
+    assert agent.calls == []
+
+
+def test_refresh_sends_only_the_delta(search):
+    """Test that a second refresh only sends what changed, and nothing at all when nothing did."""
+    # Arrange
+    agent = FakeJobSearchAgent()
+    edited_analyst = dict(ANALYST, text=ANALYST["text"] + " Hybrid, two days a week in office.")
+
+    # Act
+    first = refresh_search(search, agent, lambda saved: [BACKEND, ANALYST], now=1.0)
+    unchanged = refresh_search(search, agent, lambda saved: [BACKEND, ANALYST], now=2.0)
+    edited = refresh_search(search, agent, lambda saved: [BACKEND, edited_analyst], now=3.0)
+
+    # Assert
+    assert first == "2 postings summarized"
+    assert unchanged is None
+    assert edited == "1 postings summarized"
+    assert len(agent.calls) == 2
+    assert agent.calls[0]["use_web_search"] is False
+    assert agent.calls[1]["postings"] == [f"[Updated since last check]\n{edited_analyst['text']}"]
+    assert search.last_run == 3.0
+
+
+def test_refresh_collapses_cross_posts_within_a_refresh(search):
+    """Test that cross-posted copies fetched together are sent once but both marked seen."""
+    # Arrange
+    agent = FakeJobSearchAgent()
+
+    # Act
+    refresh_search(search, agent, lambda saved: [BACKEND, BACKEND_CROSS_POST, ANALYST])
+
+    # Assert
+    assert agent.calls[0]["postings"] == [BACKEND["text"], ANALYST["text"]]
+    assert set(search.seen) == {BACKEND["url"], BACKEND_CROSS_POST["url"], ANALYST["url"]}
+
+
+def test_searches_track_postings_independently(search):
+    """Test that a posting already sent for one search is still sent for another."""
+    # Arrange
+    other = SavedSearch("search-b", "another resume", "python roles")
+    agent = FakeJobSearchAgent()
+
+    # Act
+    refresh_search(search, agent, lambda saved: [BACKEND])
+    summary = refresh_search(other, agent, lambda saved: [BACKEND, ANALYST])
+
+    # Assert
+    assert summary == "2 postings summarized"
+    assert agent.calls[1]["postings"] == [BACKEND["text"], ANALYST["text"]]
+
+
+def test_failed_summary_does_not_mark_postings_seen(search):
+    """Test that postings stay unseen when the summary they were sent for fails."""
+    # Arrange
+    agent = FakeJobSearchAgent(fail=True)
+
+    # Act
+    with pytest.raises(RuntimeError):
+        refresh_search(search, agent, lambda saved: [BACKEND])
+
+    # Assert
+    assert search.seen == {}
+    assert search.last_run is None
+
+
+def test_store_round_trips_searches(tmp_path):
+    """Test that saved searches and their seen postings survive a save and reload."""
+    # Arrange
+    path = str(tmp_path / "saved_searches.json")
+    store = SavedSearchStore(path)
+    saved = store.add("my resume", "backend roles", interval_hours=12)
+    saved.seen["https://jobs.example.com/1"] = "abc"
+
+    # Act
+    store.save()
+    reloaded = SavedSearchStore(path)
+
+    # Assert
+    assert reloaded.searches[saved.id] == saved
+    assert [due.id for due in reloaded.due(now=0.0)] == [saved.id]
@@ -0,0 +1,124 @@
+"""
+Tests for the shared tool runtime.
+"""
+
+import time
+import asyncio
+import threading
+import pytest
+from src.job_seeker_ai.tools.runtime import (
+    IO,
+    RuntimeTool,
+    ToolBackpressureError,
+    ToolRuntime,
+    ToolTimeoutError,
+)
+
+
+def wait_until_idle(runtime, kind=IO, timeout=2.0):
+    """Wait for done callbacks, which may run just after a result is returned."""
+    deadline = time.monotonic() + timeout
+    while runtime.metrics()[kind]["in_flight"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return runtime.metrics()[kind]
+
+
+class EchoTool:
+    name = "echo"
+    description = "Echoes its input."
+
+    def __init__(self):
+        self.inputs = []
+
+    def run(self, tool_input):
+        self.inputs.append(tool_input)
+        return f"out:{tool_input}"
+
+
+def test_calls_beyond_workers_and_queue_depth_are_rejected():
+    """Test that a full pool rejects calls after the admission timeout."""
+    # Arrange
+    runtime = ToolRuntime(io_workers=1, max_queue_depth=1, admission_timeout=0.05)
+    release = threading.Event()
+    try:
+        # Act
+        running = runtime.submit(IO, "blocking", release.wait)
+        queued = runtime.submit(IO, "blocking", release.wait)
+
+        # Assert
+        with pytest.raises(ToolBackpressureError):
+            runtime.submit(IO, "blocking", release.wait)
+        metrics = runtime.metrics()[IO]
+        assert metrics["in_flight"] == 2
+        assert metrics["queued"] == 1
+        assert metrics["rejected"] == 1
+    finally:
+        release.set()
+    assert running.result(timeout=1) and queued.result(timeout=1)
+    runtime.shutdown()
+
+
+def test_slow_calls_time_out():
+    """Test that a call exceeding its tool timeout raises and is counted."""
+    # Arrange
+    runtime = ToolRuntime(io_workers=1, tool_timeouts={"slow": 0.05})
+    release = threading.Event()
+
+    # Act / Assert
+    with pytest.raises(ToolTimeoutError):
+        runtime.run(IO, "slow", release.wait)
+    assert runtime.metrics()[IO]["timed_out"] == 1
+    release.set()
+    runtime.shutdown()
+
+
+def test_metrics_count_completed_and_failed_calls():
+    """Test that completions and failures are counted once calls finish."""
+    # Arrange
+    runtime = ToolRuntime(io_workers=2)
+
+    def fail():
+        raise ValueError("boom")
+
+    # Act
+    assert runtime.run(IO, "ok", lambda: "done") == "done"
+    with pytest.raises(ValueError):
+        runtime.run(IO, "fail", fail)
+    metrics = wait_until_idle(runtime)
+
+    # Assert
+    assert metrics["submitted"] == 2
+    assert metrics["completed"] == 1
+    assert metrics["failed"] == 1
+    assert metrics["in_flight"] == 0
+    runtime.shutdown()
+
+
+def test_arun_awaits_pool_result():
+    """Test the async path returns the function result without blocking the loop."""
+    # Arrange
+    runtime = ToolRuntime(io_workers=1)
+
+    # Act
+    result = asyncio.run(runtime.arun(IO, "double", lambda value: value * 2, 21))
+
+    # Assert
+    assert result == 42
+    runtime.shutdown()
+
+
+def test_runtime_tool_forwards_input_and_postprocesses():
+    """Test that the wrapper passes input to the tool and post-processes its output."""
+    # Arrange
+    echo = EchoTool()
+    tool = RuntimeTool(echo, postprocess=str.upper)
+
+    # Act
+    positional = tool._run("query")
+    keyword = asyncio.run(tool._arun(query="jobs"))
+
+    # Assert
+    assert tool.name == "echo"
+    assert positional == "OUT:QUERY"
+    assert echo.inputs == ["query", {"query": "jobs"}]
+    assert keyword == "OUT:{'QUERY': 'JOBS'}"